@@ -0,0 +1,78 @@
+""" Generated configs of increasing size for the benchmarks
+
+Requires pytest-benchmark. Run with `make benchmark` to store a baseline in
+.benchmarks/ and `make benchmark-compare` to compare against the last one.
+"""
+
+import configparser
+import io
+import json
+import pathlib
+from typing import Any, Callable, Dict
+
+import pytest
+
+SIZES = [10, 1_000, 10_000]  # number of leaf values per config
+KEYS_PER_SECTION = 10
+
+
+def make_config(size: int) -> Dict[str, Dict[str, Any]]:
+    """A two-level config with `size` leaves of mixed types."""
+    return {
+        f"section_{i}": {
+            f"key_{j}": [f"value_{i}_{j}", i * j, i / (j + 1), j % 2 == 0][j % 4]
+            for j in range(KEYS_PER_SECTION)
+        }
+        for i in range(max(size // KEYS_PER_SECTION, 1))
+    }
+
+
+def dump_ini(config: Dict[str, Dict[str, Any]]) -> str:
+    (cnfparser := configparser.ConfigParser(interpolation=None)).read_dict(config)
+    cnfparser.write(buffer := io.StringIO())
+    return buffer.getvalue()
+
+
+def dump_xml(config: Dict[str, Dict[str, Any]]) -> str:
+    sections = "".join(
+        f"<{section}>"
+        + "".join(f"<{key}>{value}</{key}>" for key, value in values.items())
+        + f"</{section}>"
+        for section, values in config.items()
+    )
+    return f"<config>{sections}</config>"
+
+
+def dump_toml(config: Dict[str, Dict[str, Any]]) -> str:
+    return pytest.importorskip("toml").dumps(config)
+
+
+def dump_yaml(config: Dict[str, Dict[str, Any]]) -> str:
+    return pytest.importorskip("yaml").safe_dump(config)
+
+
+DUMPERS: Dict[str, Callable[[Dict[str, Dict[str, Any]]], str]] = {
+    ".json": json.dumps,
+    ".ini": dump_ini,
+    ".xml": dump_xml,
+    ".toml": dump_toml,
+    ".yaml": dump_yaml,
+}
+
+
+@pytest.fixture(scope="session", name="config_factory")
+def fixture_config_factory(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Callable[[str, int], pathlib.Path]:
+    """Writes (and memoizes) a generated config of a given format and size."""
+    directory = tmp_path_factory.mktemp("configs")
+    written: Dict[pathlib.Path, pathlib.Path] = {}
+
+    def factory(extension: str, size: int, name: str = "config") -> pathlib.Path:
+        path = directory / f"{name}_{size}{extension}"
+        if path not in written:
+            path.write_text(DUMPERS[extension](make_config(size)), encoding="utf-8")
+            written[path] = path
+        return path
+
+    return factory
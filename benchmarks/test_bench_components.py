@@ -0,0 +1,41 @@
+import json
+from typing import Any, Dict, List
+
+import pytest
+
+from benchmarks.conftest import SIZES, make_config
+from configmate.components import aggregators, interpolators
+from configmate.core import builders
+
+LAYERS = [2, 10, 100]
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_variable_interpolator(benchmark, size: int) -> None:
+    config = make_config(size)
+    for i, section in enumerate(config.values()):
+        section["key_0"] = f"${{VAR_{i % 100}:default}}"
+    text = json.dumps(config)
+    env = {f"VAR_{i}": str(i) for i in range(0, 100, 2)}  # half of them missing
+    interpolator = interpolators.VariableInterpolator.from_sub_mapping(env)
+    benchmark.group = "interpolation"
+    assert benchmark(interpolator, text)
+
+
+@pytest.mark.parametrize("aggregation", ["overlay", "deep"])
+@pytest.mark.parametrize("layers", LAYERS)
+def test_aggregator(benchmark, layers: int, aggregation: str) -> None:
+    configs: List[Dict[str, Any]] = [make_config(1_000) for _ in range(layers)]
+    aggregator = aggregators.AggregatorFactory.build_aggregator(aggregation)
+    benchmark.group = f"aggregation-{aggregation}"
+    assert benchmark(aggregator, configs)
+
+
+@pytest.mark.parametrize("overlays", [10, 100, 1_000])
+def test_cli_overlay(benchmark, overlays: int) -> None:
+    args = ["prog"]
+    for i in range(overlays):
+        args += [f"++section_{i}.key", json.dumps(i), "--unrelated", "value"]
+    cli_reader = builders.build_cli_reader(builders.build_fileprocessor())
+    benchmark.group = "cli-overlay"
+    assert len(benchmark(lambda: list(cli_reader(args)))) == overlays
@@ -0,0 +1,59 @@
+import pathlib
+import timeit
+from typing import Any, Callable, Dict
+
+import pytest
+
+from benchmarks.conftest import SIZES
+from configmate import configure, get_config
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_get_config(
+    benchmark, config_factory: Callable[..., pathlib.Path], size: int
+) -> None:
+    files = [config_factory(".json", size), config_factory(".json", size, "override")]
+    benchmark.group = "get_config"
+    assert benchmark(get_config, *files)
+
+
+@pytest.mark.parametrize("files", [1, 10, 50])
+def test_get_config_many_files(
+    benchmark, config_factory: Callable[..., pathlib.Path], files: int
+) -> None:
+    paths = [config_factory(".json", 100, f"layer_{i}") for i in range(files)]
+    benchmark.group = "get_config-files"
+    assert benchmark(get_config, *paths)
+
+
+def test_configure_call_overhead(
+    benchmark, config_factory: Callable[..., pathlib.Path]
+) -> None:
+    @configure(str(config_factory(".json", 10)))
+    def func(**kwargs: Any) -> int:
+        return len(kwargs)
+
+    benchmark.group = "configure"
+    assert benchmark(func)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_configure_beats_uncached_calls(
+    config_factory: Callable[..., pathlib.Path], size: int
+) -> None:
+    """Configured calls reuse the cached layers, so they must be cheaper than
+    loading the config on every call.
+    """
+    path = str(config_factory(".json", size))
+
+    @configure(path)
+    def cached(**kwargs: Any) -> Dict[str, Any]:
+        return kwargs
+
+    def uncached(**kwargs: Any) -> Dict[str, Any]:
+        return {**get_config(path), **kwargs}
+
+    assert cached(extra=1) == uncached(extra=1)
+    cached_time = min(timeit.repeat(lambda: cached(extra=1), number=20, repeat=5))
+    uncached_time = min(timeit.repeat(lambda: uncached(extra=1), number=20, repeat=5))
+    assert cached_time < uncached_time
@@ -0,0 +1,27 @@
+import pytest
+
+from configmate.base import operators
+
+DEPTHS = [2, 5, 20]
+
+
+class Increment(operators.Operator[int, int]):
+    def _transform(self, ctx: operators.Context, input_: int) -> int:
+        return input_ + 1
+
+
+def make_pipeline(depth: int) -> operators.Operator[int, int]:
+    pipeline: operators.Operator[int, int] = Increment()
+    for _ in range(depth - 1):
+        pipeline = pipeline.pipe_to(Increment())
+    return pipeline
+
+
+@pytest.mark.parametrize("compiled", [False, True], ids=["nested", "compiled"])
+@pytest.mark.parametrize("depth", DEPTHS)
+def test_pipeline_call(benchmark, depth: int, compiled: bool) -> None:
+    pipeline = make_pipeline(depth)
+    if compiled:
+        pipeline = operators.compile_pipeline(pipeline)
+    benchmark.group = f"pipeline-depth-{depth}"
+    assert benchmark(pipeline, 0) == depth
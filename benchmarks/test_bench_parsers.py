@@ -0,0 +1,116 @@
+import pathlib
+from typing import Callable
+
+import pytest
+
+from benchmarks.conftest import KEYS_PER_SECTION, SIZES
+from configmate.base import constants
+from configmate.components import filereader, parsers
+from configmate.core import builders
+
+PARSERS = [
+    (".json", "configmate.components.parsers"),
+    (".ini", "configmate.components.parsers"),
+    (".xml", "configmate.components.parsers"),
+    (".toml", "configmate_plugins.toml_parser"),
+    (".yaml", "configmate_plugins.yaml_parser"),
+]
+XML_LARGE_SIZE = 4_000_000  # leaves, about 110MB of xml
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("extension,module", PARSERS)
+def test_parser(
+    benchmark,
+    config_factory: Callable[[str, int], pathlib.Path],
+    extension: str,
+    module: str,
+    size: int,
+) -> None:
+    pytest.importorskip(module)
+    text = config_factory(extension, size).read_text(encoding="utf-8")
+    parser = parsers.FileFormatParserRegistry.infer_parser(extension)
+    benchmark.group = f"parser-{extension}"
+    assert benchmark(parser, text)
+
+
+@pytest.mark.parametrize("streaming", [False, True], ids=["full", "streaming"])
+@pytest.mark.parametrize("size", SIZES)
+def test_json_section(
+    benchmark,
+    config_factory: Callable[[str, int], pathlib.Path],
+    size: int,
+    streaming: bool,
+) -> None:
+    path = config_factory(".json", size)
+    section = f"section_{size // KEYS_PER_SECTION - 1}"  # the last one
+    processor = builders.build_fileprocessor(
+        interpolation=None, section=section, streaming=streaming
+    )
+    benchmark.group = f"json-section-{size}"
+    assert benchmark(processor, path)
+
+
+@pytest.mark.parametrize("mode", ["text", "bytes", "mmap"])
+@pytest.mark.parametrize("extension", [".json", ".xml"])
+def test_read_and_parse(
+    benchmark,
+    config_factory: Callable[[str, int], pathlib.Path],
+    extension: str,
+    mode: str,
+) -> None:
+    path = config_factory(extension, SIZES[-1])
+    reader = filereader.FileReader(mode=mode)  # type: ignore
+    parser = parsers.FileFormatParserRegistry.infer_parser(extension)
+    benchmark.group = f"read-mode-{extension}"
+    assert benchmark(lambda: parser(reader(path)))
+
+
+@pytest.mark.parametrize("lazy", [False, True], ids=["eager", "lazy"])
+@pytest.mark.parametrize("size", SIZES)
+def test_json_single_key(
+    benchmark,
+    config_factory: Callable[[str, int], pathlib.Path],
+    size: int,
+    lazy: bool,
+) -> None:
+    path = config_factory(".json", size)
+    processor = builders.build_fileprocessor(interpolation=None, lazy=lazy)
+    benchmark.group = f"json-single-key-{size}"
+    assert benchmark(lambda: processor(path)["section_0"]["key_0"])
+
+
+@pytest.mark.parametrize("iterparse", [False, True], ids=["tree", "iterparse"])
+def test_xml_large(
+    benchmark,
+    config_factory: Callable[[str, int], pathlib.Path],
+    monkeypatch: pytest.MonkeyPatch,
+    iterparse: bool,
+) -> None:
+    path = config_factory(".xml", XML_LARGE_SIZE)
+    threshold = 0 if iterparse else path.stat().st_size + 1
+    monkeypatch.setattr(constants, "XML_ITERPARSE_MIN_BYTES", threshold)
+    parser = parsers.XmlParser()
+    benchmark.group = "xml-large"
+    assert benchmark.pedantic(lambda: parser(filereader.read_mmap(path)), rounds=3)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"interpolation": False},
+        {"interpolation": False, "coerce_types": True},
+        {"interpolation": False, "section": ["section_0"]},
+    ],
+    ids=["configparser", "single-pass", "single-pass-typed", "single-pass-section"],
+)
+def test_ini_modes(
+    benchmark,
+    config_factory: Callable[[str, int], pathlib.Path],
+    options: dict,
+) -> None:
+    text = config_factory(".ini", SIZES[-1]).read_text(encoding="utf-8")
+    parser = parsers.IniParser(**options)
+    benchmark.group = "ini-modes"
+    assert benchmark(parser, text)
@@ -4,7 +4,8 @@ extends the configmate library with a validator that uses pydantic to validate i
 
 from configmate_plugins.pydantic_validator.pydantic_validator import (
     PydanticValidator,
+    get_validation_function,
     validate_with_pydantic,
 )
 
-__all__ = ["PydanticValidator", "validate_with_pydantic"]
+__all__ = ["PydanticValidator", "get_validation_function", "validate_with_pydantic"]
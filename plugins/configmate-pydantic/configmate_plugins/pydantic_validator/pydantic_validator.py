@@ -1,7 +1,9 @@
 """ Pydantic Validator
 """
 
-from typing import Any, Type, TypeVar
+import collections
+import threading
+from typing import Any, Callable, OrderedDict, Type, TypeVar
 
 import pydantic
 
@@ -10,23 +12,53 @@ from configmate.components import validators
 
 T = TypeVar("T")
 
+PYDANTIC_V2 = hasattr(pydantic, "TypeAdapter")  # the API of 2.x and later
+VALIDATOR_CACHE_SIZE = 256
+
+_validator_cache: OrderedDict[Any, Callable[[Any], Any]] = collections.OrderedDict()
+_validator_cache_lock = threading.Lock()
+
 
 class PydanticValidator(validators.TypeValidator[Any, T]):
     def __init__(self, type_: Type[T]) -> None:
         super().__init__()
         self._type = type_
+        self._validate = get_validation_function(type_)
 
     def _transform(self, ctx: operators.Context, input_: Any) -> T:
-        return validate_with_pydantic(self._type, input_)
+        return self._validate(input_)
 
 
 def validate_with_pydantic(type_: Type[T], obj: Any) -> T:
+    return get_validation_function(type_)(obj)
+
+
+def get_validation_function(type_: Type[T]) -> Callable[[Any], T]:
+    """Returns a function validating objects as `type_`, cached per type."""
+    try:
+        hash(type_)
+    except TypeError:  # e.g. Annotated with unhashable metadata
+        return _build_validation_function(type_)
+    with _validator_cache_lock:  # held while building, so each type is built once
+        if (validate := _validator_cache.get(type_)) is None:
+            validate = _validator_cache[type_] = _build_validation_function(type_)
+            if len(_validator_cache) > VALIDATOR_CACHE_SIZE:
+                _validator_cache.popitem(last=False)
+        else:
+            _validator_cache.move_to_end(type_)
+    return validate
+
+
+def _build_validation_function(type_: Type[T]) -> Callable[[Any], T]:
+    if PYDANTIC_V2:
+        return pydantic.TypeAdapter(type_).validate_python
+
     class Validator(pydantic.BaseModel):
-        """Temporary class to validate the object with pydantic."""
+        """Wrapper model to validate the object with pydantic."""
 
-        object: type_
+        object: type_  # type: ignore
 
-    return Validator(object=obj).object
+    return lambda obj: Validator(object=obj).object
 
 
 ###
@@ -40,5 +72,6 @@ validators.TypeValidatorFactory.register(
     is_not_function,
     PydanticValidator,
     where="first",
+    type_based=True,
 )
 ## NOTE: we want this to trigger for everything except functions
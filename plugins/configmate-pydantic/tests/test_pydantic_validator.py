@@ -70,3 +70,11 @@ def test_modified_factory(
     validator = validators.TypeValidatorFactory.build_validator(type_)
     validated_obj = validator(input_)
     assert validated_obj == expected
+
+
+### Test the validator cache
+def test_validation_function_is_cached_per_type() -> None:
+    """Test that the pydantic validator is only built once per type."""
+    validate = pydantic_validator.get_validation_function(Dict[str, int])
+    assert pydantic_validator.get_validation_function(Dict[str, int]) is validate
+    assert validate({"a": "1"}) == {"a": 1}
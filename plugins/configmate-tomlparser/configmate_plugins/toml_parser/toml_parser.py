@@ -1,19 +1,76 @@
 """This is a plugin for configmate that adds support for TOML files.
-"""
 
-from typing import Any
+The fastest installed backend is picked at import: `rtoml`, the stdlib `tomllib`
+(or `tomli` before python 3.11), then `toml`. Set the `CONFIGMATE_TOML_BACKEND`
+env-var, call `TomlParser.use_backend` or pass `backend` to pick another one.
+"""
 
-import toml
+import importlib
+import os
+from typing import Any, Callable, Dict, Optional
 
-from configmate.base import operators
+from configmate.base import constants, operators
 from configmate.components import parsers
 
 TOML_EXTENSIONS = ".tml", ".toml", ".TML", ".TOML"
+TOML_BACKEND_ENV_VAR = "CONFIGMATE_TOML_BACKEND"
+TOML_BACKENDS = {  # name: module, by preference
+    "rtoml": "rtoml",
+    "tomllib": "tomllib",
+    "tomli": "tomli",
+    "toml": "toml",
+}
+
+
+def available_backends() -> Dict[str, Callable[[str], Any]]:
+    """The `loads` functions of the installed backends, by preference."""
+    backends = {}
+    for name, module in TOML_BACKENDS.items():
+        try:
+            backends[name] = importlib.import_module(module).loads
+        except ImportError:
+            continue
+    return backends
+
+
+_BACKENDS = available_backends()
 
 
 class TomlParser(parsers.Parser[Any]):
+    input_kinds = (constants.BYTES, constants.TEXT)
+    backend = os.environ.get(TOML_BACKEND_ENV_VAR) or next(iter(_BACKENDS), "toml")
+
+    def __init__(self, backend: Optional[str] = None) -> None:
+        super().__init__()
+        self.backend = _check_backend(backend or self.backend)
+
     def _transform(self, ctx: operators.Context, input_: Any) -> Any:
-        return toml.loads(input_)
+        if not isinstance(input_, str):
+            input_ = bytes(input_).decode("utf-8")  # toml files are always utf-8
+        return _BACKENDS[self.backend](input_)
+
+    def cache_identity(self, ctx: operators.Context) -> Optional[str]:
+        return f"{super().cache_identity(ctx)}({self.backend})"
+
+    @classmethod
+    def use_backend(cls, backend: str) -> None:
+        """Sets the backend of the parsers created from now on, the parsers built
+        by configmate are rebuilt.
+        """
+        cls.backend = _check_backend(backend)
+        parsers.FileFormatParserRegistry.invalidate()
+
+    @classmethod
+    def describe(cls) -> str:
+        return f"{cls.__name__}(backend={cls.backend!r}) of {list(_BACKENDS)}"
+
+
+def _check_backend(backend: str) -> str:
+    if backend not in _BACKENDS:
+        raise ValueError(
+            f"Toml backend {backend!r} is not installed, choose from {list(_BACKENDS)}"
+        )
+    return backend
 
 
 parsers.FileFormatParserRegistry.add_strategy(TomlParser, *TOML_EXTENSIONS)
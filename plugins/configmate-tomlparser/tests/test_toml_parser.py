@@ -0,0 +1,85 @@
+import datetime
+import pathlib
+from unittest import mock
+
+import pytest
+
+from configmate.components import parsers
+from configmate.core import functions
+from configmate_plugins.toml_parser import TomlParser, toml_parser
+
+DOCUMENT = """
+title = "Example"
+ratio = 0.5
+enabled = true
+ports = [8000, 8001]
+released = 1979-05-27T07:32:00Z
+
+[owner]
+name = "Tom"
+aliases = ["t", 'tp']
+
+[servers.alpha]
+ip = "10.0.0.1"
+
+[[products]]
+name = "Hammer"
+sku = 738594937
+
+[[products]]
+name = "Nail"
+"""
+EXPECTED = {
+    "title": "Example",
+    "ratio": 0.5,
+    "enabled": True,
+    "ports": [8000, 8001],
+    "released": datetime.datetime(1979, 5, 27, 7, 32, tzinfo=datetime.timezone.utc),
+    "owner": {"name": "Tom", "aliases": ["t", "tp"]},
+    "servers": {"alpha": {"ip": "10.0.0.1"}},
+    "products": [{"name": "Hammer", "sku": 738594937}, {"name": "Nail"}],
+}
+BACKENDS = list(toml_parser.available_backends())
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("content", [DOCUMENT, DOCUMENT.encode()])
+def test_backends_conform(backend: str, content: object) -> None:
+    assert TomlParser(backend)(content) == EXPECTED
+
+
+def test_default_backend_is_fastest_available() -> None:
+    assert TomlParser().backend == BACKENDS[0]
+    assert repr(BACKENDS[0]) in TomlParser.describe()
+    assert repr(BACKENDS[0]) in parsers.FileFormatParserRegistry.describe()
+
+
+def test_use_backend(tmp_path: pathlib.Path) -> None:
+    """Switching backends applies to the parsers configmate built already."""
+    (path := tmp_path / "config.toml").write_text(DOCUMENT)
+    default = TomlParser.backend
+    assert functions.get_config(path) == EXPECTED
+    try:
+        TomlParser.use_backend(BACKENDS[-1])
+        assert TomlParser().backend == BACKENDS[-1]
+        assert repr(BACKENDS[-1]) in parsers.FileFormatParserRegistry.describe()
+        loads = mock.Mock(wraps=toml_parser._BACKENDS[BACKENDS[-1]])
+        with mock.patch.dict(toml_parser._BACKENDS, {BACKENDS[-1]: loads}):
+            functions.get_config(path)
+        loads.assert_called_once()
+    finally:
+        TomlParser.use_backend(default)
+
+
+def test_cache_identity_includes_backend() -> None:
+    identities = {TomlParser(backend).cache_identity(None) for backend in BACKENDS}
+    assert len(identities) == len(BACKENDS)
+
+
+def test_missing_backend() -> None:
+    with pytest.raises(ValueError):
+        TomlParser("missing")
+
+
+if __name__ == "__main__":
+    pytest.main()
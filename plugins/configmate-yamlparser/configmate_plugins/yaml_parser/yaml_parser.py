@@ -1,19 +1,126 @@
-"""This is a plugin for configmate that adds support for TOML files.
+"""This is a plugin for configmate that adds support for YAML files.
+
+The fastest installed backend is picked at import: PyYAML bound to libyaml, then
+pure python PyYAML. Set the `CONFIGMATE_YAML_BACKEND` env-var, call
+`YamlParser.use_backend` or pass `backend` to pick another one. `ryaml` is only
+used when picked, it reads YAML 1.2 so it differs from PyYAML on YAML 1.1 values
+(e.g. `yes` and `on` booleans) and merge keys.
 """
 
-from typing import Any
+import os
+from typing import Any, Callable, Dict, Optional, Sequence
 
 import yaml
 
-from configmate.base import operators
-from configmate.components import parsers
+from configmate.base import constants, exceptions, operators
+from configmate.components import parsers, selectors
 
 YAML_EXTENSIONS = ".yml", ".yaml", ".YML", ".YAML"
+STR_TAG = "tag:yaml.org,2002:str"
+MERGE_TAG = "tag:yaml.org,2002:merge"
+YAML_BACKEND_ENV_VAR = "CONFIGMATE_YAML_BACKEND"
+OPT_IN_BACKENDS = ("ryaml",)  # never picked by default, they don't match pyyaml
+# sections are composed into nodes by pyyaml, with libyaml if it's bound
+SECTION_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+try:  # opt-in backend
+    import ryaml
+except ImportError:
+    ryaml = None
+
+
+def available_backends() -> Dict[str, Callable[[Any], Any]]:
+    """The load functions of the installed backends, by preference. The opt-in
+    backends come last.
+    """
+    backends: Dict[str, Callable[[Any], Any]] = {}
+    if hasattr(yaml, "CSafeLoader"):
+        backends["libyaml"] = _load_libyaml
+    backends["pyyaml"] = yaml.safe_load
+    if ryaml is not None:
+        backends["ryaml"] = _load_ryaml
+    return backends
+
+
+def _load_ryaml(input_: Any) -> Any:
+    if not isinstance(input_, str):
+        input_ = bytes(input_).decode("utf-8")
+    return ryaml.loads(input_)
+
+
+def _load_libyaml(input_: Any) -> Any:
+    return yaml.load(input_, Loader=yaml.CSafeLoader)
+
+
+_BACKENDS = available_backends()
 
 
 class YamlParser(parsers.Parser[Any]):
+    input_kinds = (constants.BYTES, constants.TEXT)
+    backend = os.environ.get(YAML_BACKEND_ENV_VAR) or next(
+        name for name in _BACKENDS if name not in OPT_IN_BACKENDS
+    )
+
+    def __init__(
+        self, section: Sequence[str] = (), backend: Optional[str] = None
+    ) -> None:
+        super().__init__()
+        self.section = tuple(section)
+        self.backend = _check_backend(backend or self.backend)
+
     def _transform(self, ctx: operators.Context, input_: Any) -> Any:
-        return yaml.safe_load(input_)
+        if self.section:
+            return self._load_section(ctx, input_)
+        return _BACKENDS[self.backend](input_)
+
+    def with_section(self, section: Sequence[str]) -> "YamlParser":
+        return YamlParser(section, self.backend)
+
+    def cache_identity(self, ctx: operators.Context) -> Optional[str]:
+        return f"{super().cache_identity(ctx)}({self.backend})"
+
+    @classmethod
+    def use_backend(cls, backend: str) -> None:
+        """Sets the backend of the parsers created from now on, the parsers built
+        by configmate are rebuilt.
+        """
+        cls.backend = _check_backend(backend)
+        parsers.FileFormatParserRegistry.invalidate()
+
+    @classmethod
+    def describe(cls) -> str:
+        return f"{cls.__name__}(backend={cls.backend!r}) of {list(_BACKENDS)}"
+
+    def _load_section(self, ctx: operators.Context, input_: Any) -> Any:
+        """Composes the node graph, but only constructs the nodes of the section."""
+        node = yaml.compose(input_, Loader=SECTION_LOADER)
+        for depth, key in enumerate(self.section):
+            if not isinstance(node, yaml.MappingNode):
+                raise exceptions.SectionNotFound(f"{self.section=} not in the yaml")
+            if any(key_node.tag == MERGE_TAG for key_node, _ in node.value):
+                remainder = selectors.KeySelector(self.section[depth:])
+                return remainder(_construct(node), ctx)  # merges need the constructor
+            values = [v for k, v in node.value if k.tag == STR_TAG and k.value == key]
+            if not values:
+                raise exceptions.SectionNotFound(f"{self.section=} not in the yaml")
+            node = values[-1]  # the last of duplicate keys wins, as in safe_load
+        return _construct(node)
+
+
+def _check_backend(backend: str) -> str:
+    if backend not in _BACKENDS:
+        raise ValueError(
+            f"Yaml backend {backend!r} is not installed, choose from {list(_BACKENDS)}"
+        )
+    return backend
+
+
+def _construct(node: yaml.Node) -> Any:
+    loader = SECTION_LOADER("")
+    try:
+        return loader.construct_document(node)
+    finally:
+        loader.dispose()
 
 
 # Register the parser with configmate
@@ -0,0 +1,105 @@
+import pathlib
+from typing import Sequence
+from unittest import mock
+
+import pytest
+import yaml
+
+from configmate.base import exceptions
+from configmate.core import functions
+from configmate_plugins.yaml_parser import YamlParser, yaml_parser
+
+DOCUMENT = """
+base: &base
+  x: 1
+  y: [1, 2]
+services:
+  billing: {port: 80, <<: *base}
+  search:
+    <<: *base
+    z: 3
+  empty:
+"""
+BACKENDS = [
+    backend
+    for backend in yaml_parser.available_backends()
+    if backend not in yaml_parser.OPT_IN_BACKENDS
+]
+
+
+@pytest.mark.parametrize(
+    "section",
+    [
+        ("services",),
+        ("services", "billing"),
+        ("services", "search", "x"),
+        ("services", "empty"),
+        ("base", "y"),
+    ],
+)
+def test_section_matches_full_parse(section: Sequence[str]) -> None:
+    expected = yaml.safe_load(DOCUMENT)
+    for key in section:
+        expected = expected[key]
+    assert YamlParser().with_section(section)(DOCUMENT) == expected
+
+
+@pytest.mark.parametrize(
+    "section", [("missing",), ("services", "empty", "x"), ("base", "y", "z")]
+)
+def test_missing_section(section: Sequence[str]) -> None:
+    with pytest.raises(exceptions.SectionNotFound):
+        YamlParser().with_section(section)(DOCUMENT)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("content", [DOCUMENT, DOCUMENT.encode()])
+def test_backends_conform(backend: str, content: object) -> None:
+    assert YamlParser(backend=backend)(content) == yaml.safe_load(DOCUMENT)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_section_keeps_backend(backend: str) -> None:
+    parser = YamlParser(backend=backend).with_section(["services", "billing"])
+    assert parser.backend == backend
+    assert parser(DOCUMENT) == {"port": 80, "x": 1, "y": [1, 2]}
+
+
+def test_default_backend_is_fastest_available() -> None:
+    assert YamlParser().backend == BACKENDS[0]
+    assert repr(BACKENDS[0]) in YamlParser.describe()
+
+
+def test_opt_in_backends_come_last() -> None:
+    with mock.patch.object(yaml_parser, "ryaml", mock.Mock()):
+        assert list(yaml_parser.available_backends())[-1] == "ryaml"
+    assert YamlParser.backend not in yaml_parser.OPT_IN_BACKENDS
+
+
+def test_use_backend(tmp_path: pathlib.Path) -> None:
+    """Switching backends applies to the parsers configmate built already."""
+    (path := tmp_path / "config.yaml").write_text(DOCUMENT)
+    default = YamlParser.backend
+    assert functions.get_config(path) == yaml.safe_load(DOCUMENT)
+    try:
+        YamlParser.use_backend(BACKENDS[-1])
+        load = mock.Mock(wraps=yaml_parser._BACKENDS[BACKENDS[-1]])
+        with mock.patch.dict(yaml_parser._BACKENDS, {BACKENDS[-1]: load}):
+            functions.get_config(path)
+        load.assert_called_once()
+    finally:
+        YamlParser.use_backend(default)
+
+
+def test_cache_identity_includes_backend() -> None:
+    identities = {YamlParser(backend=b).cache_identity(None) for b in BACKENDS}
+    assert len(identities) == len(BACKENDS)
+
+
+def test_missing_backend() -> None:
+    with pytest.raises(ValueError):
+        YamlParser(backend="missing")
+
+
+if __name__ == "__main__":
+    pytest.main()
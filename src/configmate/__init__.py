@@ -2,23 +2,20 @@
 TODO: docs
 """
 
+from configmate.core.async_functions import aconfigure, aget_config
 from configmate.core.functions import configure, get_config
+from configmate.core.live import LiveConfig
 
-__all__ = ["configure", "get_config"]
+__all__ = ["aconfigure", "aget_config", "configure", "get_config", "LiveConfig"]
 
 ###
-# Loads all plugins from the configmate_plugins package
-# These are optional dependencies that extend configmate.
-# You can find them in the plugins/ directory.
+# Registers all plugins from the configmate_plugins package
+# These are optional dependencies that extend configmate, they are imported
+# lazily on first use. You can find them in the plugins/ directory.
 ###
-try:
-    import configmate_plugins  # type: ignore
-except ImportError:
-    pass  # no plugins
-else:
-    import importlib
-    import pkgutil
+import os as _os
 
-    ## Load all plugins
-    for plugin in pkgutil.iter_modules(configmate_plugins.__path__):  # type: ignore
-        importlib.import_module(f"{configmate_plugins.__name__}.{plugin.name}")  # type: ignore
+from configmate.base import constants as _constants
+from configmate.core import plugins as _plugins
+
+_plugins.register_plugins(_os.environ.get(_constants.PLUGINS_ENV_VAR, "lazy"))
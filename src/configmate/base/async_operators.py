@@ -0,0 +1,120 @@
+""" Async counterparts of the operators, for pipelines run inside an event loop
+"""
+
+import abc
+import asyncio
+import concurrent.futures
+from typing import Generic, Iterable, List, Optional, Type, TypeVar, overload
+
+from configmate.base import operators
+from configmate.base.operators import Callback, Context
+
+T = TypeVar("T")
+T_co = TypeVar("T_co", covariant=True)
+T_contra = TypeVar("T_contra", contravariant=True)
+
+
+class AsyncOperator(abc.ABC, Generic[T_contra, T_co]):
+    input_type: Type[T_contra] = object  # type: ignore
+    output_type: Type[T_co] = object  # type: ignore
+
+    @abc.abstractmethod
+    async def _atransform(self, ctx: Context, input_: T_contra) -> T_co:
+        """Apply the transformation to the input"""
+
+    def __init__(self, *_, **__) -> None:
+        super().__init__()
+        self._callbacks: List[Callback[T_co]] = []
+
+    async def __call__(self, input_: T_contra, _ctx: Optional[Context] = None) -> T_co:
+        _ctx = Context() if _ctx is None else _ctx
+        result = await self._atransform(_ctx, input_)
+        self._run_callbacks(_ctx, result)
+        return result
+
+    @overload
+    def pipe_to(self, step: None) -> "AsyncOperator[T_contra, T_co]": ...
+    @overload
+    def pipe_to(
+        self, step: "AsyncOperator[T_co, T]"
+    ) -> "AsyncPipeline[T_contra, T]": ...
+    def pipe_to(self, step: "Optional[AsyncOperator]") -> "AsyncOperator":
+        return self if step is None else AsyncPipeline(self, step)
+
+    def append_callback(
+        self, callback: Callback[T_co]
+    ) -> "AsyncOperator[T_contra, T_co]":
+        self._callbacks.append(callback)
+        return self
+
+    def _run_callbacks(self, ctx: Context, result) -> None:
+        for callback in self._callbacks:
+            callback(ctx, result)
+
+
+class AsyncPipeline(AsyncOperator[T_contra, T_co]):
+    """A pipeline of async operators that are applied in sequence."""
+
+    def __init__(
+        self, first: AsyncOperator[T_contra, T], second: AsyncOperator[T, T_co]
+    ) -> None:
+        super().__init__()
+        self._first = first
+        self._next = second
+
+    async def _atransform(self, ctx: Context, input_: T_contra) -> T_co:
+        return await self._next(await self._first(input_, ctx), ctx)
+
+    @property
+    def input_type(self) -> Type[T_contra]:  # type: ignore
+        return self._first.input_type
+
+    @property
+    def output_type(self) -> Type[T_co]:  # type: ignore
+        return self._next.output_type
+
+
+class Offload(AsyncOperator[T_contra, T_co]):
+    """Runs a blocking ~operators.Operator on an executor, off the event loop.
+
+    Without an executor the default executor of the running loop is used.
+    """
+
+    def __init__(
+        self,
+        step: operators.Operator[T_contra, T_co],
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> None:
+        super().__init__()
+        self._step = step
+        self._executor = executor
+
+    async def _atransform(self, ctx: Context, input_: T_contra) -> T_co:
+        loop = asyncio.get_running_loop()
+        if isinstance(self._executor, concurrent.futures.ProcessPoolExecutor):
+            # contexts can't cross the process boundary, the call starts afresh
+            return await loop.run_in_executor(self._executor, self._step, input_)
+        return await loop.run_in_executor(self._executor, self._step, input_, ctx)
+
+    @property
+    def input_type(self) -> Type[T_contra]:  # type: ignore
+        return self._step.input_type
+
+    @property
+    def output_type(self) -> Type[T_co]:  # type: ignore
+        return self._step.output_type
+
+
+class AsyncMapIterable(AsyncOperator[Iterable[T_contra], List[T_co]]):
+    """Maps an ~AsyncOperator over an iterable, awaiting all calls concurrently."""
+
+    input_type = Iterable  # type: ignore
+    output_type = List  # type: ignore
+
+    def __init__(self, map_step: AsyncOperator[T_contra, T_co]) -> None:
+        super().__init__()
+        self._map_step = map_step
+
+    async def _atransform(self, ctx: Context, input_: Iterable[T_contra]) -> List[T_co]:
+        calls = (self._map_step(i, ctx.get_child()) for i in input_)
+        return list(await asyncio.gather(*calls))  # gather keeps the input order
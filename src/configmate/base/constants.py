@@ -17,7 +17,26 @@ CLI_SECTION_END_TOKEN = "/"
 CLI_ARGS = sys.argv
 ENVIRONMENT = types.MappingProxyType(os.environ)  # read-only view of the env-vars
 BASH_VAR_PATTERN = re.compile(r"\${(?P<variable>\w+)(?::(?P<default_value>[^}:]+))?}")
+BASH_VAR_MARKER = "${"  # every match of the pattern contains it
 
 OVERLAY: Literal["overlay"] = "overlay"
+DEEP: Literal["deep"] = "deep"
+THREAD: Literal["thread"] = "thread"
+PROCESS: Literal["process"] = "process"
+TEXT: Literal["text"] = "text"
+BYTES: Literal["bytes"] = "bytes"
+MMAP: Literal["mmap"] = "mmap"
 
 INFER_FROM_PATH = configmate_types.Infer()
+
+PLUGINS_ENV_VAR = "CONFIGMATE_PLUGINS"  # "lazy" (default), "eager" or "off"
+PLUGIN_MANIFEST_FILE = "configmate_plugin.json"
+
+PIPELINE_CACHE_SIZE = 128
+TEMPLATE_CACHE_SIZE = 64
+DISPATCH_CACHE_SIZE = 256
+SNIFF_CACHE_SIZE = 1024
+SNIFF_SIZE = 1024  # bytes read from files without a known extension
+XML_ITERPARSE_MIN_BYTES = 16 * 1024 * 1024  # larger files are converted as parsed
+PARSE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+TRACE_MAX_SPANS = 1024  # root spans kept by a tracer, the oldest are dropped
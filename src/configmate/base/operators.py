@@ -1,21 +1,25 @@
 import abc
-import collections
+import concurrent.futures
 import copy
 import itertools
 import types
 from typing import (
+    Any,
     Callable,
-    DefaultDict,
+    Dict,
     Generic,
     Iterable,
     Iterator,
     List,
     Optional,
+    Tuple,
     Type,
     TypeVar,
     overload,
 )
 
+from configmate.base import tracing
+
 T = TypeVar("T")
 U = TypeVar("U")
 T_co = TypeVar("T_co", covariant=True)
@@ -23,27 +27,53 @@ T_contra = TypeVar("T_contra", contravariant=True)
 
 
 class Context:
-    "Holds the context for the configmate pipeline."
-    _namespaces: DefaultDict[int, types.SimpleNamespace]
-    _children: List["Context"]
-
-    def __init__(self) -> None:
-        self._namespaces = collections.defaultdict(types.SimpleNamespace)
-        self._children = []
+    """Holds the context for the configmate pipeline.
+
+    Children look namespaces up along their parents and copy them on first access,
+    so creating a child is cheap and its writes never leak into the parent. Parents
+    only keep references to their children when tracing.
+    """
+
+    __slots__ = ("_namespaces", "_parent", "_children", "tracer", "span")
+
+    def __init__(
+        self,
+        tracer: Optional[tracing.Tracer] = None,
+        parent: Optional["Context"] = None,
+    ) -> None:
+        self._namespaces: Dict[int, types.SimpleNamespace] = {}
+        self._parent = parent
+        self._children: Optional[List["Context"]] = None if tracer is None else []
+        self.tracer = tracer
+        self.span: Optional[tracing.Span] = None if parent is None else parent.span
 
     def __getitem__(self, key: object) -> types.SimpleNamespace:
-        return self._namespaces[id(key)]
+        try:
+            return self._namespaces[id(key)]
+        except KeyError:
+            namespace = self._namespaces[id(key)] = self._inherit(id(key))
+            return namespace
 
     def __copy__(self) -> "Context":
-        new = Context()
-        new._namespaces = copy.copy(self._namespaces)
+        new = Context(self.tracer, self._parent)
+        new._namespaces = {k: copy.copy(v) for k, v in self._namespaces.items()}
+        new.span = self.span
         return new
 
     def get_child(self) -> "Context":
-        child = copy.copy(self)
-        self._children.append(child)
+        child = Context(self.tracer, self)
+        if self._children is not None:
+            self._children.append(child)
         return child
 
+    def _inherit(self, key: int) -> types.SimpleNamespace:
+        parent = self._parent
+        while parent is not None:
+            if (namespace := parent._namespaces.get(key)) is not None:
+                return types.SimpleNamespace(**vars(namespace))
+            parent = parent._parent
+        return types.SimpleNamespace()
+
 
 Callback = Callable[[Context, T_contra], None]
 
@@ -64,9 +94,9 @@ class Operator(abc.ABC, Generic[T_contra, T_co]):
 
     def __call__(self, input_: T_contra, _ctx: Optional[Context] = None) -> T_co:
         _ctx = Context() if _ctx is None else _ctx
-        result = self._transform(_ctx, input_)
-        self._run_callbacks(_ctx, result)
-        return result
+        if _ctx.tracer is not None:
+            return _ctx.tracer.trace(self, _ctx, input_, self._apply)
+        return self._apply(_ctx, input_)
 
     @overload
     def pipe_to(self, step: None) -> "Operator[T_contra, T_co]": ...
@@ -79,6 +109,11 @@ class Operator(abc.ABC, Generic[T_contra, T_co]):
         self._callbacks.append(callback)
         return self
 
+    def _apply(self, ctx: Context, input_: T_contra) -> T_co:
+        result = self._transform(ctx, input_)
+        self._run_callbacks(ctx, result)
+        return result
+
     def _run_callbacks(self, ctx: Context, result) -> None:
         for callback in self._callbacks:
             callback(ctx, result)
@@ -104,6 +139,103 @@ class Pipeline(Operator[T_contra, T_co]):
         return self._next.output_type
 
 
+_Callbacks = Tuple[List[Callback], ...]
+# the step, how it's run, the callbacks to run after that and after calling the step
+_Stage = Tuple[Operator, Callable[[Context, Any], Any], _Callbacks, _Callbacks]
+
+
+class CompiledPipeline(Operator[T_contra, T_co]):
+    """A pipeline flattened into a linear sequence of stages run in a single loop.
+
+    The callbacks of every stage and of every pipeline it was flattened from run in
+    the same order as in the nested pipeline, see `compile_pipeline`. Stages are
+    run by their `_transform` directly, unless they override `__call__`.
+    """
+
+    def __init__(self, pipeline: Operator[T_contra, T_co]) -> None:
+        super().__init__()
+        self._stages: Tuple[_Stage, ...] = tuple(
+            _compile_stage(step, callbacks) for step, callbacks in _flatten(pipeline)
+        )
+
+    def _transform(self, ctx: Context, input_: T_contra) -> T_co:
+        if ctx.tracer is not None:
+            return self._transform_traced(ctx, input_)
+        result: Any = input_
+        for _, transform, callbacks, _ in self._stages:
+            result = transform(ctx, result)
+            for stage_callbacks in callbacks:
+                for callback in stage_callbacks:
+                    callback(ctx, result)
+        return result
+
+    def _transform_traced(self, ctx: Context, input_: T_contra) -> T_co:
+        result: Any = input_
+        for step, _, _, callbacks in self._stages:
+            result = step(result, ctx)  # runs the callbacks of the step itself
+            for stage_callbacks in callbacks:
+                for callback in stage_callbacks:
+                    callback(ctx, result)
+        return result
+
+    @property
+    def input_type(self) -> Type[T_contra]:  # type: ignore
+        return self._stages[0][0].input_type
+
+    @property
+    def output_type(self) -> Type[T_co]:  # type: ignore
+        return self._stages[-1][0].output_type
+
+
+def compile_pipeline(operator: Operator[T_contra, T_co]) -> Operator[T_contra, T_co]:
+    """Flattens a (nested) `Pipeline` into a `CompiledPipeline`, other operators are
+    returned as is.
+    """
+    if isinstance(operator, Pipeline):
+        return CompiledPipeline(operator)
+    return operator
+
+
+def _flatten(operator: Operator) -> List[Tuple[Operator, List[List[Callback]]]]:
+    """Lists the stages of a pipeline, each with the callback lists to run after it:
+    its own, then those of the pipelines that end with it, innermost first.
+    """
+    # pylint: disable=protected-access
+    if isinstance(operator, Pipeline):
+        stages = _flatten(operator._first) + _flatten(operator._next)
+    elif isinstance(operator, CompiledPipeline):
+        stages = [
+            (step, [step._callbacks, *callbacks])
+            for step, _, _, callbacks in operator._stages
+        ]
+    else:
+        return [(operator, [operator._callbacks])]
+    stages[-1][1].append(operator._callbacks)
+    return stages
+
+
+def _compile_stage(step: Operator, callbacks: List[List[Callback]]) -> _Stage:
+    """Stages that override `__call__` are called through it, which runs their own
+    callbacks, the others skip the call overhead and run `_transform` directly.
+    """
+    if type(step).__call__ is not Operator.__call__:
+        return step, _CallStep(step), tuple(callbacks[1:]), tuple(callbacks[1:])
+    transform = step._transform  # pylint: disable=protected-access
+    return step, transform, tuple(callbacks), tuple(callbacks[1:])
+
+
+class _CallStep:
+    """Runs a stage through its `__call__`, picklable unlike a lambda."""
+
+    __slots__ = ("step",)
+
+    def __init__(self, step: Operator) -> None:
+        self.step = step
+
+    def __call__(self, ctx: Context, input_: Any) -> Any:
+        return self.step(input_, ctx)
+
+
 class MapIterable(Operator[Iterable[T_contra], Iterator[T_co]]):
     """Maps an ~Operator over an iterable."""
 
@@ -115,7 +247,31 @@ class MapIterable(Operator[Iterable[T_contra], Iterator[T_co]]):
         self._map_step = map_step
 
     def _transform(self, ctx: Context, input_: Iterable[T_contra]) -> Iterator[T_co]:
-        return (self._map_step(i, ctx.get_child()) for i in input_)
+        return _evaluate_if_traced(
+            ctx, (self._map_step(i, ctx.get_child()) for i in input_)
+        )
+
+
+class ConcurrentMapIterable(MapIterable[T_contra, T_co]):
+    """Maps an ~Operator over an iterable on an executor, keeping the input order."""
+
+    def __init__(
+        self,
+        map_step: Operator[T_contra, T_co],
+        executor: concurrent.futures.Executor,
+    ) -> None:
+        super().__init__(map_step)
+        self._executor = executor
+
+    def _transform(self, ctx: Context, input_: Iterable[T_contra]) -> Iterator[T_co]:
+        if isinstance(self._executor, concurrent.futures.ProcessPoolExecutor):
+            # contexts can't cross the process boundary, every call starts afresh
+            return _evaluate_if_traced(ctx, self._executor.map(self._map_step, input_))
+        inputs = list(input_)
+        contexts = [ctx.get_child() for _ in inputs]
+        return _evaluate_if_traced(
+            ctx, self._executor.map(self._map_step, inputs, contexts)
+        )
 
 
 class JoinOutputs(Operator[T_contra, Iterator[T_co]]):
@@ -128,7 +284,9 @@ class JoinOutputs(Operator[T_contra, Iterator[T_co]]):
         self._steps = steps
 
     def _transform(self, ctx: Context, input_: T_contra) -> Iterator[T_co]:
-        return (step(input_, ctx.get_child()) for step in self._steps)
+        return _evaluate_if_traced(
+            ctx, (step(input_, ctx.get_child()) for step in self._steps)
+        )
 
 
 class ChainOutputs(Operator[T_contra, Iterator[T_co]]):
@@ -141,4 +299,23 @@ class ChainOutputs(Operator[T_contra, Iterator[T_co]]):
         self._steps = steps
 
     def _transform(self, ctx: Context, input_: T_contra) -> Iterator[T_co]:
-        return itertools.chain.from_iterable(self._steps(input_, ctx))
+        return _evaluate_if_traced(
+            ctx, itertools.chain.from_iterable(self._steps(input_, ctx))
+        )
+
+
+class Collect(Operator[Iterable[T], List[T]]):
+    """Materializes an iterable into a list."""
+
+    input_type = Iterable  # type: ignore
+    output_type = List  # type: ignore
+
+    def _transform(self, ctx: Context, input_: Iterable[T]) -> List[T]:
+        return list(input_)
+
+
+def _evaluate_if_traced(ctx: Context, outputs: Iterator[T]) -> Iterator[T]:
+    """Lazy outputs would run after the span of their operator ended, and be timed
+    as part of their consumer. When tracing they're evaluated within the span.
+    """
+    return outputs if ctx.tracer is None else iter(list(outputs))
@@ -1,60 +1,148 @@
 import collections
+import importlib
 from typing import (
     Any,
     Callable,
     Deque,
     Dict,
     Generic,
+    Hashable,
+    List,
     Literal,
     NoReturn,
+    Optional,
     Tuple,
     TypeVar,
 )
 
-from configmate.base import exceptions, types
+from configmate.base import constants, exceptions, types
 
 T = TypeVar("T")
 T_contra = TypeVar("T_contra", contravariant=True)
 
+_GENERATION = 0  # of all the registries
+
+
+def generation() -> int:
+    """Increases with every registration in any registry, so things built from the
+    registered strategies can be cached until then.
+    """
+    return _GENERATION
+
+
+def _bump_generation() -> None:
+    global _GENERATION  # pylint: disable=global-statement
+    _GENERATION += 1
+
 
 class DictRegistryMixin(types.HasDescription, Generic[T_contra, T]):
     _registry: Dict[T_contra, T]
+    _lazy_modules: Dict[T_contra, str]
+    _generation: int
 
     def __init_subclass__(cls, *args, **kwargs) -> None:
         cls._registry: Dict[T_contra, T] = {}
+        cls._lazy_modules: Dict[T_contra, str] = {}
+        cls._generation = 0
         return super().__init_subclass__(*args, **kwargs)
 
+    @classmethod
+    def generation(cls) -> int:
+        """Increases with every `register` or `invalidate`, so lookups can be cached
+        until then.
+        """
+        return cls._generation
+
     @classmethod
     def lookup(cls, key: T_contra) -> T:
         """Retrieves first triggered strategy or raises `~exceptions.NoApplicableStrategy`."""
         if key in cls._registry:
             return cls._registry[key]
+        if key in cls._lazy_modules:
+            cls._import_lazy_module(cls._lazy_modules[key])
+            return cls.lookup(key)
         _raise_missing(cls, key)
 
+    @classmethod
+    def is_registered(cls, key: T_contra) -> bool:
+        """Whether a strategy is registered for `key`, lazily or not."""
+        return key in cls._registry or key in cls._lazy_modules
+
     @classmethod
     def register(cls, key: T_contra, value: T) -> None:
         """Inserts a new strategy at the given rank (position in queue)."""
+        if key in cls._lazy_modules:  # import first, so it can't override us later
+            cls._import_lazy_module(cls._lazy_modules[key])
         cls._registry[key] = value
+        cls.invalidate()
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Bumps the generation, e.g. after a registered strategy is reconfigured,
+        so the caches built from the strategies are rebuilt.
+        """
+        cls._generation += 1
+        _bump_generation()
+
+    @classmethod
+    def register_lazy(cls, key: T_contra, module: str) -> None:
+        """Declares that importing `module` registers a strategy for `key`.
+
+        The module is imported the first time `key` is looked up.
+        """
+        if key not in cls._registry:
+            cls._lazy_modules[key] = module
 
     @classmethod
     def describe(cls) -> str:
         """Returns a string representation of all items in the registry."""
-        return "\n".join(f"{key}: {value}" for key, value in cls._registry.items())
+        return "\n".join(
+            [f"{key}: {_describe(value)}" for key, value in cls._registry.items()]
+            + [f"{key}: <lazy {module}>" for key, module in cls._lazy_modules.items()]
+        )
+
+    @classmethod
+    def _import_lazy_module(cls, module: str) -> None:
+        for key in [k for k, m in cls._lazy_modules.items() if m == module]:
+            del cls._lazy_modules[key]
+        importlib.import_module(module)
 
 
 class StrategyRegistryMixin(types.HasDescription, Generic[T_contra, T]):
-    _registry: Deque[Tuple[Callable[[T_contra], bool], T]]
+    """A priority queue of (trigger, strategy) pairs, the first triggered one wins.
+
+    Lookups are memoized until the next `register`: by the type of the key when all
+    triggers tried for it were declared `type_based`, else by the key itself if it
+    is hashable.
+    """
+
+    _registry: Deque[Tuple[Callable[[T_contra], bool], T, bool]]
+    _lazy_modules: List[str]
+    _type_dispatch: Dict[type, T]
+    _value_dispatch: Dict[Hashable, T]
 
     def __init_subclass__(cls, *args, **kwargs) -> None:
         cls._registry = collections.deque()
+        cls._lazy_modules = []
+        cls._type_dispatch = {}
+        cls._value_dispatch = {}
         return super().__init_subclass__(*args, **kwargs)
 
     @classmethod
     def get_first_match(cls, key: T_contra) -> T:
         """Retrieves first triggered strategy or raises `~exceptions.NoApplicableStrategy`."""
-        for entry in (entry for trigger, entry in cls._registry if trigger(key)):
+        if cls._lazy_modules:
+            cls._import_lazy_modules()
+        if (entry := cls._type_dispatch.get(type(key), _MISSING)) is not _MISSING:
             return entry
-        _raise_missing(cls, key)
+        try:
+            value_key: Optional[Hashable] = (type(key), key)
+            entry = cls._value_dispatch.get(value_key, _MISSING)  # type: ignore
+        except TypeError:  # unhashable keys are never memoized
+            value_key = None
+        if entry is not _MISSING:
+            return entry
+        return cls._dispatch(key, value_key)
 
     @classmethod
     def register(
@@ -62,22 +150,75 @@ class StrategyRegistryMixin(types.HasDescription, Generic[T_contra, T]):
         trigger: Callable[[T_contra], bool],
         entry: T,
         where: Literal["first", "last"] = "last",
+        type_based: bool = False,
     ) -> None:
-        """Inserts a new strategy at the given rank (position in queue)."""
+        """Inserts a new strategy at the given rank (position in queue).
+
+        Declare `type_based` triggers, whose outcome depends only on the type of the
+        key, so the lookups for that type can be memoized.
+        """
+        if cls._lazy_modules:  # keeps the ranks as if the modules were imported eagerly
+            cls._import_lazy_modules()
         if where == "first":
-            cls._registry.appendleft((trigger, entry))
+            cls._registry.appendleft((trigger, entry, type_based))
         elif where == "last":
-            cls._registry.append((trigger, entry))
+            cls._registry.append((trigger, entry, type_based))
         else:
             raise ValueError(f"Invalid rank: {where}")
+        cls._type_dispatch.clear()
+        cls._value_dispatch.clear()
+        _bump_generation()
+
+    @classmethod
+    def register_lazy(cls, module: str) -> None:
+        """Declares that importing `module` registers strategies.
+
+        The module is imported right before the registry is first used.
+        """
+        cls._lazy_modules.append(module)
 
     @classmethod
     def describe(cls) -> str:
         """Returns a string representation of all items in the registry."""
+        if cls._lazy_modules:
+            cls._import_lazy_modules()
         return "\n".join(
             f"{entry[1]} (triggered by: {entry[0].__name__})" for entry in cls._registry
         )
 
+    @classmethod
+    def _dispatch(cls, key: T_contra, value_key: Optional[Hashable]) -> T:
+        by_type = True
+        for trigger, entry, type_based in cls._registry:
+            by_type = by_type and type_based
+            if trigger(key):
+                break
+        else:
+            _raise_missing(cls, key)
+        if by_type:
+            cls._type_dispatch[type(key)] = entry
+        elif value_key is not None:
+            if len(cls._value_dispatch) >= constants.DISPATCH_CACHE_SIZE:
+                cls._value_dispatch.clear()  # keys may be short-lived, e.g. lambdas
+            cls._value_dispatch[value_key] = entry
+        return entry
+
+    @classmethod
+    def _import_lazy_modules(cls) -> None:
+        modules, cls._lazy_modules = cls._lazy_modules, []
+        for module in modules:
+            importlib.import_module(module)
+
+
+_MISSING: Any = object()
+
+
+def _describe(value: Any) -> str:
+    """Strategies that describe themselves, e.g. their configuration, do so."""
+    if isinstance(value, type) and callable(getattr(value, "describe", None)):
+        return value.describe()
+    return str(value)
+
 
 def _raise_missing(cls: types.HasDescription, unfound_key: Any) -> NoReturn:
     raise exceptions.NoApplicableStrategy(
@@ -0,0 +1,148 @@
+""" Opt-in tracing of the operators in a pipeline
+"""
+
+import collections
+import contextlib
+import dataclasses
+import time
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Sized,
+    Tuple,
+    TypeVar,
+)
+
+from configmate.base import constants
+
+T = TypeVar("T")
+
+
+@dataclasses.dataclass
+class Span:
+    """Records a single operator call, nested like the operators themselves."""
+
+    name: str
+    start_time_ns: int
+    end_time_ns: Optional[int] = None
+    input_size: Optional[int] = None
+    output_size: Optional[int] = None
+    error: Optional[str] = None
+    children: List["Span"] = dataclasses.field(default_factory=list)
+
+    @property
+    def duration_ns(self) -> Optional[int]:
+        return (
+            None if self.end_time_ns is None else self.end_time_ns - self.start_time_ns
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Exports the span and its children as plain, serializable dicts."""
+        return {
+            "name": self.name,
+            "start_time_ns": self.start_time_ns,
+            "end_time_ns": self.end_time_ns,
+            "duration_ns": self.duration_ns,
+            "input_size": self.input_size,
+            "output_size": self.output_size,
+            "error": self.error,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+class SpanExporter(Protocol):
+    """Receives every finished root span, e.g. to forward it to OpenTelemetry."""
+
+    def export(self, spans: Sequence[Span]) -> Any: ...
+
+
+class Tracer:
+    """Collects the spans of all operator calls in contexts that carry it.
+
+    Tracing is off unless a tracer is attached to the root `Context`. The calls of
+    `get_config`, `configure`... open a root span that the spans of their steps
+    nest under. Finished root spans are passed to the exporters, and the last
+    `max_spans` of them are kept in `spans`. While tracing, the operators with
+    lazy outputs evaluate them within their own span, so the spans are complete
+    when exported and the work is timed where it's done.
+    """
+
+    def __init__(
+        self, *exporters: SpanExporter, max_spans: int = constants.TRACE_MAX_SPANS
+    ) -> None:
+        self.spans: Deque[Span] = collections.deque(maxlen=max_spans)
+        self._exporters = exporters
+
+    def trace(
+        self,
+        operator: Any,
+        ctx: Any,
+        input_: Any,
+        apply: Callable[[Any, Any], T],
+    ) -> T:
+        """Applies the operator within a new span, child of the current span."""
+        parent, span = self._open(ctx, type(operator).__name__, _size(input_))
+        try:
+            result = apply(ctx, input_)
+        except BaseException as exc:
+            span.error = repr(exc)
+            raise
+        else:
+            span.output_size = _size(result)
+        finally:
+            self._close(ctx, parent, span)
+        return result
+
+    @contextlib.contextmanager
+    def span(self, ctx: Any, name: str) -> Iterator[Span]:
+        """Opens a span named `name`, the spans traced within nest under it."""
+        parent, span = self._open(ctx, name, None)
+        try:
+            yield span
+        except BaseException as exc:
+            span.error = repr(exc)
+            raise
+        finally:
+            self._close(ctx, parent, span)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Exports the trace tree as plain, serializable dicts."""
+        return [span.to_dict() for span in self.spans]
+
+    def _open(
+        self, ctx: Any, name: str, input_size: Optional[int]
+    ) -> Tuple[Optional[Span], Span]:
+        parent: Optional[Span] = ctx.span
+        span = Span(name, time.time_ns(), input_size=input_size)
+        if parent is not None:
+            parent.children.append(span)
+        ctx.span = span
+        return parent, span
+
+    def _close(self, ctx: Any, parent: Optional[Span], span: Span) -> None:
+        """Ends the span, root spans are kept and exported once complete."""
+        span.end_time_ns = time.time_ns()
+        ctx.span = parent
+        if parent is None:
+            self.spans.append(span)
+            for exporter in self._exporters:
+                exporter.export([span])
+
+
+def root_span(ctx: Any, name: str) -> ContextManager[Optional[Span]]:
+    """The span of a call traced by the tracer of `ctx`, a no-op if it has none."""
+    if ctx.tracer is None:
+        return contextlib.nullcontext()
+    return ctx.tracer.span(ctx, name)
+
+
+def _size(obj: Any) -> Optional[int]:
+    return len(obj) if isinstance(obj, Sized) else None
@@ -1,12 +1,15 @@
+import mmap
 import os
 import pathlib
-from typing import Mapping, Protocol, Sequence, TypeVar, Union
+from typing import Literal, Mapping, Protocol, Sequence, TypeVar, Union
 
 T = TypeVar("T")
 
 FilePathTypes = (str, os.PathLike, pathlib.Path)
 FilePath = Union[str, os.PathLike, pathlib.Path]
 CliArgs = Sequence[str]
+ReadMode = Literal["text", "bytes", "mmap"]
+FileContent = Union[str, bytes, mmap.mmap]
 NestedDict = Mapping[str, Union[T, "NestedDict[T]"]]
 
 
@@ -4,8 +4,12 @@
 from configmate.components.aggregators import (
     AggregationSpec,
     AggregatorFactory,
+    DeepMerge,
+    DeepMergeAggregator,
     FunctionAggregator,
     InferredAggregator,
+    LazyAggregator,
+    MergeByKey,
 )
 from configmate.components.cli_readers import (
     ArgSelector,
@@ -17,8 +21,12 @@ from configmate.components.interpolators import (
     InterpolatorChain,
     InterpolatorFactory,
     InterpolatorSpec,
+    LeafIndex,
+    ValueInterpolator,
     VariableInterpolator,
 )
+from configmate.components.lazy import LazyJsonObject, LazyMapping, LazyOverlay
+from configmate.components.parse_cache import CachedParser, ParseCache
 from configmate.components.parsers import (
     FileFormatParserRegistry,
     FunctionParser,
@@ -27,6 +35,7 @@ from configmate.components.parsers import (
     JsonParser,
     ParserFactory,
     ParsingSpec,
+    SelectingParser,
     XmlParser,
 )
 from configmate.components.selectors import (
@@ -34,6 +43,7 @@ from configmate.components.selectors import (
     SectionSelector,
     SectionSelectorFactory,
 )
+from configmate.components.sniffing import FormatSniffer
 from configmate.components.validators import (
     FunctionValidator,
     TypeValidatorFactory,
@@ -48,14 +58,27 @@ __all__ = [
     ## aggregators
     "AggregationSpec",
     "AggregatorFactory",
+    "DeepMerge",
+    "DeepMergeAggregator",
     "FunctionAggregator",
     "InferredAggregator",
+    "LazyAggregator",
+    "MergeByKey",
     ## interpolators
     "FunctionalInterpolator",
     "InterpolatorChain",
     "InterpolatorFactory",
     "InterpolatorSpec",
+    "LeafIndex",
+    "ValueInterpolator",
     "VariableInterpolator",
+    ## lazy
+    "LazyJsonObject",
+    "LazyMapping",
+    "LazyOverlay",
+    ## parse_cache
+    "CachedParser",
+    "ParseCache",
     ## parsers
     "FileFormatParserRegistry",
     "FunctionParser",
@@ -64,7 +87,10 @@ __all__ = [
     "JsonParser",
     "ParserFactory",
     "ParsingSpec",
+    "SelectingParser",
     "XmlParser",
+    ## sniffing
+    "FormatSniffer",
     ## selectors
     "SectionSelectionSpec",
     "SectionSelector",
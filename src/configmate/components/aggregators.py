@@ -2,10 +2,26 @@
 """
 
 import collections
+import dataclasses
 import itertools
-from typing import Any, Callable, Iterable, List, Mapping, Sequence, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
-from configmate.base import exceptions, operators, registry
+from configmate.base import constants, exceptions, operators, registry
+from configmate.components import lazy
 
 T = TypeVar("T")
 U = TypeVar("U")
@@ -17,6 +33,35 @@ _SpecT_co = TypeVar("_SpecT_co", bound=AggregationSpec, covariant=True)
 AggregatorFactoryMethod = Callable[[_SpecT_co], "Aggregator"]
 
 
+@dataclasses.dataclass(frozen=True)
+class MergeByKey:
+    """Merges lists of mappings item by item, matching items on `key`."""
+
+    key: Hashable
+
+
+ListStrategy = Union[Literal["replace", "append"], MergeByKey]
+ConfigPath = Union[str, Tuple[Hashable, ...]]
+
+
+@dataclasses.dataclass(frozen=True)
+class DeepMerge:
+    """Spec for deep merging, `list_strategies` map paths (e.g. "a.b") to strategies.
+
+    The strategies are stored as a tuple of pairs, so specs are hashable and the
+    built pipelines can be memoized.
+    """
+
+    list_strategies: Union[
+        Mapping[ConfigPath, ListStrategy], Tuple[Tuple[ConfigPath, ListStrategy], ...]
+    ] = ()
+    default_list_strategy: ListStrategy = "replace"
+
+    def __post_init__(self) -> None:
+        strategies = dict(self.list_strategies).items()
+        object.__setattr__(self, "list_strategies", tuple(strategies))
+
+
 ###
 # base class for aggregation steps
 ###
@@ -74,12 +119,149 @@ class InferredAggregator(Aggregator[T, T]):
         return dict(chainmap)
 
 
+class DeepMergeAggregator(Aggregator[Mapping, Mapping]):
+    """Merges nested mappings recursively, later configs take priority.
+
+    The configs are merged in one pass. Subtrees only present in a single config
+    are shared with that config instead of being copied, so the result must be
+    treated as read-only. Lists are replaced by default; `list_strategies` can
+    append them or merge them by key at specific paths.
+    """
+
+    def __init__(
+        self,
+        list_strategies: Optional[
+            Union[
+                Mapping[ConfigPath, ListStrategy],
+                Iterable[Tuple[ConfigPath, ListStrategy]],
+            ]
+        ] = None,
+        default_list_strategy: ListStrategy = "replace",
+    ) -> None:
+        super().__init__()
+        self._list_strategies = {
+            (tuple(path.split(".")) if isinstance(path, str) else tuple(path)): strat
+            for path, strat in dict(list_strategies or {}).items()
+        }
+        self._default_list_strategy = default_list_strategy
+
+    def _transform(self, ctx: operators.Context, input_: Iterable[Mapping]) -> Mapping:
+        configs = list(input_)
+        if not all(isinstance(config, Mapping) for config in configs):
+            raise exceptions.AggregationFailure(
+                f"Can only deep merge mappings {configs=}"
+            )
+        return self._merge_mappings(configs, ()) if configs else {}
+
+    def _merge_mappings(self, mappings: List[Mapping], path: Tuple) -> Mapping:
+        if len(mappings) == 1:
+            return mappings[0]  # untouched subtree, shared
+        stacks: Dict[Any, List[Any]] = {}
+        for mapping in mappings:
+            for key, value in mapping.items():
+                stacks.setdefault(key, []).append(value)
+        return {
+            key: self._merge_values(vals, (*path, key)) for key, vals in stacks.items()
+        }
+
+    def _merge_values(self, values: List[Any], path: Tuple) -> Any:
+        if len(values) == 1 or not isinstance(top := values[-1], (Mapping, list)):
+            return values[-1]
+        if isinstance(top, Mapping):
+            return self._merge_mappings(_trailing_run(values, Mapping), path)
+        return self._merge_lists(_trailing_run(values, list), path)
+
+    def _merge_lists(self, lists: List[list], path: Tuple) -> Any:
+        strategy = self._list_strategies.get(path, self._default_list_strategy)
+        if strategy == "replace":
+            return lists[-1]
+        if strategy == "append":
+            return list(itertools.chain.from_iterable(lists))
+        if isinstance(strategy, MergeByKey):
+            return self._merge_lists_by_key(lists, strategy.key, path)
+        raise ValueError(f"Invalid list strategy at {path=}: {strategy}")
+
+    def _merge_lists_by_key(
+        self, lists: List[list], key: Hashable, path: Tuple
+    ) -> List[Any]:
+        """Merges the items matched on `key`, falls back to replacing the lists if
+        an item has an unhashable value at `key`.
+        """
+        stacks: Dict[Any, List[Any]] = {}
+        order: List[Tuple[bool, Any]] = []  # (is keyed, item key or unkeyed item)
+        for item in itertools.chain.from_iterable(lists):
+            if not isinstance(item, Mapping) or key not in item:
+                order.append((False, item))
+                continue
+            try:
+                if item[key] not in stacks:
+                    stacks[item[key]] = []
+                    order.append((True, item[key]))
+            except TypeError:  # unhashable value, the items can't be matched
+                return lists[-1]
+            stacks[item[key]].append(item)
+        return [
+            self._merge_values(stacks[entry], path) if is_keyed else entry
+            for is_keyed, entry in order
+        ]
+
+    @classmethod
+    def from_spec(cls, spec: Union[str, DeepMerge]) -> "DeepMergeAggregator":
+        if isinstance(spec, DeepMerge):
+            return cls(spec.list_strategies, spec.default_list_strategy)
+        return cls()
+
+
+class LazyAggregator(Aggregator[Mapping, Mapping]):
+    """Overlays the configs lazily, each key is resolved across the configs when
+    it's first accessed instead of merging everything upfront.
+    """
+
+    def __init__(self, deep: bool = False) -> None:
+        super().__init__()
+        self._deep = deep
+
+    def _transform(self, ctx: operators.Context, input_: Iterable[Mapping]) -> Mapping:
+        if len(configs := list(input_)) == 1:
+            return configs[0]
+        if not all(isinstance(config, Mapping) for config in configs):
+            return InferredAggregator()(configs, ctx)
+        return lazy.LazyOverlay(configs, self._deep)
+
+    @classmethod
+    def from_spec(cls, spec: AggregationSpec) -> "LazyAggregator":
+        if isinstance(spec, DeepMerge) and (
+            spec.list_strategies or spec.default_list_strategy != "replace"
+        ):
+            raise ValueError(f"Lazy configs replace lists, got {spec=}")
+        if is_deep_merge_spec(spec):
+            return cls(deep=True)
+        if isinstance(spec, str) and spec == constants.OVERLAY:
+            return cls(deep=False)
+        raise ValueError(f"Lazy configs can't be aggregated with {spec=}")
+
+
+def _trailing_run(values: List[Any], type_: type) -> List[Any]:
+    """The longest run of `type_` values at the end, lower values are overridden."""
+    start = len(values)
+    while start > 0 and isinstance(values[start - 1], type_):
+        start -= 1
+    return values[start:]
+
+
 ###
 # register strategies in order of priority
 ###
+def is_deep_merge_spec(spec: AggregationSpec) -> bool:
+    return isinstance(spec, DeepMerge) or (
+        isinstance(spec, str) and spec == constants.DEEP
+    )
+
+
 def always(_: AggregationSpec) -> bool:
     return True
 
 
-AggregatorFactory.register(callable, FunctionAggregator)
-AggregatorFactory.register(always, InferredAggregator)
+AggregatorFactory.register(is_deep_merge_spec, DeepMergeAggregator.from_spec)
+AggregatorFactory.register(callable, FunctionAggregator, type_based=True)
+AggregatorFactory.register(always, InferredAggregator, type_based=True)
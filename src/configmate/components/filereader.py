@@ -1,14 +1,60 @@
 """ Filereading step for the pipeline
 """
+
+import mmap
+import os
 import pathlib
+from typing import Callable, Tuple, Union
+
+from configmate.base import constants, operators, types
+
+FileIdentity = Tuple[str, int, int]
+ReadModeSpec = Union[types.ReadMode, Callable[[types.FilePath], types.ReadMode]]
 
-from configmate.base import operators, types
 
+class FileReader(operators.Operator[types.FilePath, types.FileContent]):
+    """Reads a file as text, as bytes or as a read-only memory map.
 
-class FileReader(operators.Operator[types.FilePath, str]):
-    def __init__(self, encoding: str = "utf-8") -> None:
+    Bytes and memory maps skip decoding the file, for parsers that consume them
+    directly. The mode may also be a function of the path, e.g. to ask the parser
+    inferred for the file which input it prefers.
+    """
+
+    def __init__(
+        self, encoding: str = "utf-8", mode: ReadModeSpec = constants.TEXT
+    ) -> None:
         super().__init__()
         self.encoding = encoding
+        self.mode = mode
+
+    def _transform(
+        self, ctx: operators.Context, input_: types.FilePath
+    ) -> types.FileContent:
+        mode = self.mode(input_) if callable(self.mode) else self.mode
+        if mode == constants.TEXT:
+            return pathlib.Path(input_).read_text(encoding=self.encoding)
+        if mode == constants.BYTES:
+            return pathlib.Path(input_).read_bytes()
+        if mode == constants.MMAP:
+            return read_mmap(input_)
+        raise ValueError(f"Invalid read mode: {mode}")
+
+
+def read_mmap(path: types.FilePath) -> Union[bytes, mmap.mmap]:
+    """Maps the file read-only into memory, the map is closed once released."""
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:  # empty files can't be mapped
+            return b""
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def file_identity(path: types.FilePath) -> FileIdentity:
+    """Identifies a revision of a file by its path, modification time and size.
 
-    def _transform(self, ctx: operators.Context, input_: types.FilePath) -> str:
-        return pathlib.Path(input_).read_text(encoding=self.encoding)
+    Missing files get a fixed identity, so they compare equal until they appear.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return os.fspath(path), -1, -1
+    return os.fspath(path), stat.st_mtime_ns, stat.st_size
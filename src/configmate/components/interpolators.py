@@ -1,11 +1,33 @@
 """ Generic flexible interpolation steps usable in the pipeline
 """
 
+import collections
+import copy
+import hashlib
 import re
-from typing import Callable, Iterable, Literal, Mapping, Set, TypeVar, Union, get_args
+import threading
+import types
 import warnings
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    OrderedDict,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    get_args,
+)
 
 from configmate.base import constants, exceptions, operators, registry
+from configmate.components import lazy
 
 OnMissingSpec = Literal["error", "ignore", "warn"]
 ON_MISSING_KEYS: Set[str] = set(get_args(OnMissingSpec))
@@ -39,6 +61,82 @@ class InterpolatorFactory(
         return cls.get_first_match(key)(key)
 
 
+###
+# compiled interpolation templates
+###
+class Template:
+    """A text split into literal chunks and variable slots by an interpolation
+    pattern, so it can be rendered again without scanning the text.
+    """
+
+    __slots__ = ("chunks", "slots")
+
+    def __init__(self, text: str, pattern: re.Pattern) -> None:
+        chunks: List[str] = []
+        slots: List[Tuple[str, Optional[str], str]] = []
+        position = 0
+        for match in pattern.finditer(text):
+            chunks.append(text[position : match.start()])
+            slots.append((match["variable"], match["default_value"], match[0]))
+            position = match.end()
+        chunks.append(text[position:])
+        self.chunks: Tuple[str, ...] = tuple(chunks)
+        self.slots: Tuple[Tuple[str, Optional[str], str], ...] = tuple(slots)
+
+    def render(self, substitutions: Mapping[str, str]) -> Tuple[str, Set[str]]:
+        """Fills in the slots, returns the text and the names of missing variables.
+
+        Missing variables without a default are left as they were in the text.
+        """
+        if not self.slots:
+            return self.chunks[0], set()
+        missing: Set[str] = set()
+        parts = [self.chunks[0]]
+        for (name, default, raw), chunk in zip(self.slots, self.chunks[1:]):
+            if (value := substitutions.get(name)) is None:
+                if (value := default) is None:
+                    missing.add(name)
+                    value = raw
+            parts.append(value)
+            parts.append(chunk)
+        return "".join(parts), missing
+
+
+class TemplateCache:
+    """A thread-safe LRU cache of templates, keyed by a hash of the text."""
+
+    def __init__(self, maxsize: int = constants.TEMPLATE_CACHE_SIZE) -> None:
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._templates: OrderedDict[Hashable, Template] = collections.OrderedDict()
+
+    def get(self, text: str, pattern: re.Pattern) -> Template:
+        """Returns the template of the text, compiling it if it's not cached."""
+        digest = hashlib.blake2b(text.encode(errors="surrogatepass"), digest_size=20)
+        key = digest.digest(), pattern.pattern, pattern.flags
+        with self._lock:
+            if (template := self._templates.get(key)) is not None:
+                self._templates.move_to_end(key)
+                return template
+        template = Template(text, pattern)
+        with self._lock:
+            self._templates[key] = template
+            while len(self._templates) > self._maxsize:
+                self._templates.popitem(last=False)
+        return template
+
+    def clear(self) -> None:
+        """Drops all templates."""
+        with self._lock:
+            self._templates.clear()
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+
+TEMPLATE_CACHE = TemplateCache()
+
+
 ###
 # concrete interpolation steps
 ###
@@ -80,27 +178,33 @@ class VariableInterpolator(StringInterpolator):
         super().__init__()
         self._sub_pattern = pattern
         self._substitutions = substitutions
-        self._on_missing = missing_env_var_handler
+        # texts without the marker have nothing to interpolate
+        self._marker = (
+            constants.BASH_VAR_MARKER
+            if pattern.pattern == constants.BASH_VAR_PATTERN.pattern
+            else None
+        )
+        # unwrap the staticmethod defaults above, so the step stays picklable
+        self._on_missing = getattr(
+            missing_env_var_handler, "__func__", missing_env_var_handler
+        )
 
     def _transform(self, ctx: operators.Context, input_: str) -> str:
-        missing_vars: Set[str] = set()
-
-        def replacer(match: re.Match) -> str:
-            nonlocal missing_vars
-            env_var_name = match.group("variable")
-            if (value := self._substitutions.get(env_var_name)) is not None:
-                return value
-            if (default := match.group("default_value")) is not None:
-                return default
-            missing_vars.add(env_var_name)
-            return match.group(0)
-
-        subbed_text = self._sub_pattern.sub(replacer, input_)
+        if self._marker is not None and self._marker not in input_:
+            return input_
+        template = TEMPLATE_CACHE.get(input_, self._sub_pattern)
+        subbed_text, missing_vars = template.render(self._substitutions)
         if missing_vars:
             self._on_missing(missing_vars)
 
         return subbed_text
 
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        if isinstance(self._substitutions, types.MappingProxyType):
+            state["_substitutions"] = dict(self._substitutions)  # snapshot the view
+        return state
+
     @classmethod
     def from_sub_mapping(
         cls,
@@ -148,6 +252,110 @@ class InterpolatorChain(StringInterpolator):
         raise ValueError("Only callables and maps supported for chained interpolation.")
 
 
+###
+# interpolation of the values of parsed configs
+###
+LeafPath = Tuple[Union[str, int], ...]
+
+
+class LeafIndex:
+    """The string leaves of a parsed tree that hold placeholders, by their path.
+
+    The leaves are compiled into templates, so the tree can be resolved again
+    against other substitutions without re-reading or re-parsing the file.
+    """
+
+    __slots__ = ("tree", "leaves")
+
+    def __init__(
+        self, tree: Any, pattern: re.Pattern, marker: Optional[str] = None
+    ) -> None:
+        self.tree = tree
+        self.leaves: List[Tuple[LeafPath, Template]] = []
+        stack: List[Tuple[LeafPath, Any]] = [((), tree)]
+        while stack:
+            path, node = stack.pop()
+            if isinstance(node, dict):
+                stack.extend(((*path, key), value) for key, value in node.items())
+            elif isinstance(node, list):
+                stack.extend(((*path, i), value) for i, value in enumerate(node))
+            elif isinstance(node, str) and (marker is None or marker in node):
+                if (template := Template(node, pattern)).slots:
+                    self.leaves.append((path, template))
+
+    def resolve(self, substitutions: Mapping[str, str]) -> Tuple[Any, Set[str]]:
+        """Returns a copy of the tree with the indexed leaves rendered, and the
+        names of the missing variables. Only the containers on the paths to the
+        leaves are copied, the rest of the tree is shared with the parsed one.
+        """
+        missing: Set[str] = set()
+        if not self.leaves:
+            return self.tree, missing
+        if not self.leaves[0][0]:  # the tree is a single string
+            return self.leaves[0][1].render(substitutions)
+        root = copy.copy(self.tree)
+        copies: Dict[LeafPath, Any] = {(): root}
+        for path, template in self.leaves:
+            parent = root
+            for depth in range(1, len(path)):
+                if (child := copies.get(path[:depth])) is None:
+                    child = copies[path[:depth]] = copy.copy(parent[path[depth - 1]])
+                    parent[path[depth - 1]] = child
+                parent = child
+            parent[path[-1]], leaf_missing = template.render(substitutions)
+            missing |= leaf_missing
+        return root, missing
+
+
+class ValueInterpolator(VariableInterpolator):
+    """Interpolates the string leaves of a parsed config instead of the raw text,
+    so substituted values can't break the quoting of the file format.
+
+    Callers that keep parsed trees, like `configure` and `LiveConfig`, keep their
+    `index` instead and `resolve` it again when the substitutions may have changed,
+    without re-reading or re-parsing the files. Lazy configs are interpolated
+    value by value as they are accessed instead.
+    """
+
+    input_type = object
+    output_type = object
+
+    def _transform(self, ctx: operators.Context, input_: Any) -> Any:
+        if isinstance(input_, lazy.LazyMapping):
+            return input_.with_leaf_transform(self._interpolate)
+        return self.resolve(self.index(input_))
+
+    def _interpolate(self, value: Any) -> Any:
+        return self.resolve(self.index(value))
+
+    def index(self, tree: Any) -> LeafIndex:
+        """Indexes the leaves of a parsed tree that hold placeholders."""
+        return LeafIndex(tree, self._sub_pattern, self._marker)
+
+    def resolve(
+        self, index: LeafIndex, substitutions: Optional[Mapping[str, str]] = None
+    ) -> Any:
+        """Resolves the indexed leaves against `substitutions`, by default the ones
+        of the interpolator. Missing variables are handled as configured.
+        """
+        subs = self._substitutions if substitutions is None else substitutions
+        tree, missing_vars = index.resolve(subs)
+        if missing_vars:
+            self._on_missing(missing_vars)
+        return tree
+
+    @classmethod
+    def from_spec(cls, spec: InterpolatorSpec) -> "VariableInterpolator":
+        """Builds the value interpolator of an on-missing spec or a substitution
+        mapping, the other specs only apply to raw text.
+        """
+        if is_on_missing_spec(spec):
+            return cls.from_on_missing(spec)  # type: ignore[arg-type]
+        if isinstance(spec, Mapping):
+            return cls.from_sub_mapping(spec)
+        raise ValueError(f"Values can't be interpolated with {spec=}")
+
+
 ###
 # register concrete interpolation steps in order of preference
 ###
@@ -163,7 +371,11 @@ def is_iterable(s: InterpolatorSpec) -> bool:
     return isinstance(s, Iterable)
 
 
-InterpolatorFactory.register(callable, FunctionalInterpolator)
+InterpolatorFactory.register(callable, FunctionalInterpolator, type_based=True)
 InterpolatorFactory.register(is_on_missing_spec, VariableInterpolator.from_on_missing)
-InterpolatorFactory.register(is_mapping, VariableInterpolator.from_sub_mapping)
-InterpolatorFactory.register(is_iterable, InterpolatorChain.from_factory)
+InterpolatorFactory.register(
+    is_mapping, VariableInterpolator.from_sub_mapping, type_based=True
+)
+InterpolatorFactory.register(
+    is_iterable, InterpolatorChain.from_factory, type_based=True
+)
@@ -0,0 +1,226 @@
+""" Streaming JSON parsing, materializes only the requested section of a document
+"""
+
+import json
+import mmap
+import re
+from typing import (
+    Any,
+    Iterator,
+    NamedTuple,
+    NoReturn,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from configmate.base import constants, exceptions
+
+Buffer = Union[str, bytes, mmap.mmap]
+
+
+class _Tokens(NamedTuple):
+    quote: Any
+    backslash: Any
+    open: Any
+    close: Any
+    obj: Any
+    end: Any
+    comma: Any
+    colon: Any
+
+
+class _Grammar(NamedTuple):
+    whitespace: Pattern
+    string: Pattern
+    filler: Pattern  # everything up to the next bracket, strings included
+    scalar: Pattern
+    tokens: _Tokens
+
+
+_STR_GRAMMAR = _Grammar(
+    whitespace=re.compile(r"[ \t\n\r]*"),
+    string=re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL),
+    filler=re.compile(r'(?:[^"{}\[\]]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.DOTALL),
+    scalar=re.compile(r"[^,:{}\[\]\" \t\n\r]+"),
+    tokens=_Tokens(
+        quote='"',
+        backslash="\\",
+        open="{[",
+        close="}]",
+        obj="{",
+        end="}",
+        comma=",",
+        colon=":",
+    ),
+)
+_BYTES_GRAMMAR = _Grammar(
+    whitespace=re.compile(rb"[ \t\n\r]*"),
+    string=re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL),
+    filler=re.compile(rb'(?:[^"{}\[\]]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.DOTALL),
+    scalar=re.compile(rb"[^,:{}\[\]\" \t\n\r]+"),
+    tokens=_Tokens(
+        quote=b'"',
+        backslash=b"\\",
+        open=b"{[",
+        close=b"}]",
+        obj=b"{",
+        end=b"}",
+        comma=b",",
+        colon=b":",
+    ),
+)
+
+
+def load_section(
+    buffer: Buffer,
+    section: Sequence[str] = (),
+    encoding: str = constants.SYS_DEFAULT_FILE_ENCODING,
+) -> Any:
+    """Parses only the value at `section` of a JSON document.
+
+    The document is scanned without materializing the values that are skipped,
+    so only the selected value is decoded. Bytes buffers must be in an ASCII
+    compatible `encoding`. Unlike `json.loads`, the first of duplicate keys wins.
+    """
+    return load_span(buffer, *locate_section(buffer, section, encoding), encoding)
+
+
+def locate_section(
+    buffer: Buffer,
+    section: Sequence[str] = (),
+    encoding: str = constants.SYS_DEFAULT_FILE_ENCODING,
+) -> Tuple[int, int]:
+    """Returns the start and end position of the value at `section`."""
+    grammar = _grammar(buffer)
+    pos = grammar.whitespace.match(buffer, 0).end()
+    for depth, key in enumerate(section):
+        pos = _find_key(buffer, pos, key, grammar, encoding)
+        if pos < 0:
+            missing = tuple(section[: depth + 1])
+            raise exceptions.SectionNotFound(f"{missing=} not in the document")
+    return pos, _skip_value(buffer, pos, grammar)
+
+
+def iter_members(
+    buffer: Buffer, pos: int, encoding: str = constants.SYS_DEFAULT_FILE_ENCODING
+) -> Iterator[Tuple[str, int, int]]:
+    """Yields the keys of the object at `pos` with the start and end positions of
+    their values, without decoding the values. The object is scanned as far as
+    the members are consumed.
+    """
+    grammar = _grammar(buffer)
+    tokens = grammar.tokens
+    if buffer[pos : pos + 1] != tokens.obj:
+        _raise_invalid("Expecting object", pos)
+    pos = grammar.whitespace.match(buffer, pos + 1).end()
+    if buffer[pos : pos + 1] == tokens.end:
+        return
+    while True:
+        if not (match := grammar.string.match(buffer, pos)):
+            _raise_invalid("Expecting property name", pos)
+        name = match.group()
+        if not isinstance(name, str):
+            name = name.decode(encoding)
+        name = json.loads(name) if tokens.backslash in match.group() else name[1:-1]
+        pos = grammar.whitespace.match(buffer, match.end()).end()
+        if buffer[pos : pos + 1] != tokens.colon:
+            _raise_invalid("Expecting ':' delimiter", pos)
+        start = grammar.whitespace.match(buffer, pos + 1).end()
+        yield name, start, (end := _skip_value(buffer, start, grammar))
+        pos = grammar.whitespace.match(buffer, end).end()
+        delimiter = buffer[pos : pos + 1]
+        if delimiter == tokens.end:
+            return
+        if delimiter != tokens.comma:
+            _raise_invalid("Expecting ',' delimiter", pos)
+        pos = grammar.whitespace.match(buffer, pos + 1).end()
+
+
+def value_start(buffer: Buffer, pos: int = 0) -> int:
+    """Returns the position of the first value at or after `pos`."""
+    return _grammar(buffer).whitespace.match(buffer, pos).end()
+
+
+def is_object(buffer: Buffer, pos: int) -> bool:
+    """Whether the value at `pos` is an object."""
+    return buffer[pos : pos + 1] == _grammar(buffer).tokens.obj
+
+
+def load_span(
+    buffer: Buffer,
+    start: int,
+    end: Optional[int] = None,
+    encoding: str = constants.SYS_DEFAULT_FILE_ENCODING,
+) -> Any:
+    """Decodes the value between `start` and `end`, or the end of the buffer."""
+    value = buffer[start:end]
+    return json.loads(value if isinstance(value, str) else value.decode(encoding))
+
+
+def _grammar(buffer: Buffer) -> _Grammar:
+    return _STR_GRAMMAR if isinstance(buffer, str) else _BYTES_GRAMMAR
+
+
+def _find_key(
+    buffer: Buffer, pos: int, key: str, grammar: _Grammar, encoding: str
+) -> int:
+    """Returns the position of the value of `key` in the object at `pos`, or -1."""
+    tokens = grammar.tokens
+    if buffer[pos : pos + 1] != tokens.obj:
+        return -1
+    pos = grammar.whitespace.match(buffer, pos + 1).end()
+    if buffer[pos : pos + 1] == tokens.end:
+        return -1
+    while True:
+        if not (match := grammar.string.match(buffer, pos)):
+            _raise_invalid("Expecting property name", pos)
+        name = match.group()
+        if not isinstance(name, str):
+            name = name.decode(encoding)
+        name = json.loads(name) if tokens.backslash in match.group() else name[1:-1]
+        pos = grammar.whitespace.match(buffer, match.end()).end()
+        if buffer[pos : pos + 1] != tokens.colon:
+            _raise_invalid("Expecting ':' delimiter", pos)
+        pos = grammar.whitespace.match(buffer, pos + 1).end()
+        if name == key:
+            return pos
+        pos = grammar.whitespace.match(buffer, _skip_value(buffer, pos, grammar)).end()
+        delimiter = buffer[pos : pos + 1]
+        if delimiter == tokens.end:
+            return -1
+        if delimiter != tokens.comma:
+            _raise_invalid("Expecting ',' delimiter", pos)
+        pos = grammar.whitespace.match(buffer, pos + 1).end()
+
+
+def _skip_value(buffer: Buffer, pos: int, grammar: _Grammar) -> int:
+    """Returns the end position of the value starting at `pos`."""
+    tokens = grammar.tokens
+    first = buffer[pos : pos + 1]
+    if first == tokens.quote:
+        if not (match := grammar.string.match(buffer, pos)):
+            _raise_invalid("Unterminated string", pos)
+        return match.end()
+    if not first or first not in tokens.open:
+        if not (match := grammar.scalar.match(buffer, pos)):
+            _raise_invalid("Expecting value", pos)
+        return match.end()
+    depth, pos = 1, pos + 1
+    while depth:
+        pos = grammar.filler.match(buffer, pos).end()
+        token = buffer[pos : pos + 1]
+        if token and token in tokens.open:
+            depth += 1
+        elif token and token in tokens.close:
+            depth -= 1
+        else:
+            _raise_invalid("Unterminated container", pos)
+        pos += 1
+    return pos
+
+
+def _raise_invalid(message: str, pos: int) -> NoReturn:
+    raise ValueError(f"Invalid JSON: {message} at position {pos}")
@@ -0,0 +1,227 @@
+""" Lazy configs, subtrees are parsed when they are first accessed
+"""
+
+import abc
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from configmate.base import constants
+from configmate.components import json_stream
+
+LeafTransform = Callable[[Any], Any]
+
+
+###
+# base class for lazy configs
+###
+class LazyMapping(Mapping[Hashable, Any], abc.ABC):
+    """A read-only mapping that materializes its values on first access and
+    memoizes them. Values that aren't lazy themselves are passed through the
+    leaf transform (e.g. value interpolation) as they are materialized.
+    """
+
+    def __init__(self, leaf_transform: Optional[LeafTransform] = None) -> None:
+        self._leaf_transform = leaf_transform
+        self._values: Dict[Hashable, Any] = {}
+
+    @abc.abstractmethod
+    def _keys(self) -> Mapping[Hashable, Any]:
+        """The keys of the mapping, as the keys of a mapping."""
+
+    @abc.abstractmethod
+    def _load(self, key: Hashable) -> Any:
+        """Materializes the value of `key`, raises `KeyError` if it's missing."""
+
+    @abc.abstractmethod
+    def with_leaf_transform(self, transform: LeafTransform) -> "LazyMapping":
+        """Returns a copy that passes its leaves through `transform` as well."""
+
+    def __getitem__(self, key: Hashable) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        value = self._load(key)
+        if self._leaf_transform is not None and not isinstance(value, LazyMapping):
+            value = self._leaf_transform(value)
+        return self._values.setdefault(key, value)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys()
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._keys())})"
+
+    def __reduce__(self) -> Tuple[type, Tuple[Dict[Hashable, Any]]]:
+        return dict, (self.to_dict(),)  # pickled configs are materialized
+
+    def to_dict(self) -> Dict[Hashable, Any]:
+        """Materializes the whole config into nested dicts."""
+        return {
+            key: value.to_dict() if isinstance(value, LazyMapping) else value
+            for key, value in self.items()
+        }
+
+    def _compose(self, transform: LeafTransform) -> LeafTransform:
+        if (inner := self._leaf_transform) is None:
+            return transform
+        return lambda value: transform(inner(value))
+
+
+###
+# concrete lazy configs
+###
+class LazyJsonObject(LazyMapping):
+    """A JSON object that only indexes the positions of its values, a value is
+    decoded when its key is first accessed. Nested objects are lazy as well.
+
+    The object is scanned only as far as needed to find an accessed key, it is
+    scanned to the end when iterated.
+    """
+
+    def __init__(
+        self,
+        buffer: json_stream.Buffer,
+        start: int = 0,
+        encoding: str = constants.SYS_DEFAULT_FILE_ENCODING,
+        leaf_transform: Optional[LeafTransform] = None,
+    ) -> None:
+        super().__init__(leaf_transform)
+        self._buffer = buffer
+        self._start = start
+        self._encoding = encoding
+        self._spans: Dict[str, Tuple[int, int]] = {}
+        self._members: Optional[Iterator[Tuple[str, int, int]]] = None
+        self._scanned = False
+        self._lock = threading.Lock()
+
+    def _keys(self) -> Mapping[str, Tuple[int, int]]:
+        if not self._scanned:
+            self._scan_until(None)
+        return self._spans
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._spans or self._scan_until(key) is not None  # type: ignore
+
+    def _load(self, key: Hashable) -> Any:
+        if (span := self._spans.get(key)) is None:  # type: ignore[call-overload]
+            if (span := self._scan_until(key)) is None:
+                raise KeyError(key)
+        start, end = span
+        if json_stream.is_object(self._buffer, start):
+            return LazyJsonObject(
+                self._buffer, start, self._encoding, self._leaf_transform
+            )
+        return json_stream.load_span(self._buffer, start, end, self._encoding)
+
+    def _scan_until(self, key: Optional[Hashable]) -> Optional[Tuple[int, int]]:
+        """Indexes the members until `key` is found, to the end if it's not."""
+        with self._lock:
+            if (span := self._spans.get(key)) is not None:  # type: ignore[arg-type]
+                return span
+            if self._members is None and not self._scanned:
+                self._members = json_stream.iter_members(
+                    self._buffer, self._start, self._encoding
+                )
+            for name, start, end in self._members or ():
+                self._spans.setdefault(name, (start, end))  # the first one wins
+                if name == key:
+                    return self._spans[name]
+            self._members, self._scanned = None, True
+        return None
+
+    def with_leaf_transform(self, transform: LeafTransform) -> "LazyJsonObject":
+        return LazyJsonObject(
+            self._buffer, self._start, self._encoding, self._compose(transform)
+        )
+
+
+class LazyOverlay(LazyMapping):
+    """Layered configs resolved key by key, later layers take priority. With
+    `deep`, the mappings under a key are overlaid recursively like `DeepMerge`
+    with replaced lists, otherwise the top layer's value wins.
+    """
+
+    def __init__(
+        self,
+        layers: Sequence[Mapping],
+        deep: bool = False,
+        leaf_transform: Optional[LeafTransform] = None,
+    ) -> None:
+        super().__init__(leaf_transform)
+        self._layers = list(layers)
+        self._deep = deep
+        self._key_order: Optional[Dict[Hashable, None]] = None
+
+    def _keys(self) -> Mapping[Hashable, None]:
+        if self._key_order is None:
+            self._key_order = {}
+            for layer in self._layers:
+                self._key_order.update(dict.fromkeys(layer))
+        return self._key_order
+
+    def _load(self, key: Hashable) -> Any:
+        values: List[Any] = [layer[key] for layer in self._layers if key in layer]
+        if not values:
+            raise KeyError(key)
+        if self._deep and isinstance(top := values[-1], Mapping):
+            start = len(values) - 1
+            while start > 0 and isinstance(values[start - 1], Mapping):
+                start -= 1
+            if start < len(values) - 1:
+                return LazyOverlay(values[start:], self._deep, self._leaf_transform)
+        if isinstance(top := values[-1], LazyMapping) and self._leaf_transform:
+            return top.with_leaf_transform(self._leaf_transform)
+        return top
+
+    def with_leaf_transform(self, transform: LeafTransform) -> "LazyOverlay":
+        return LazyOverlay(self._layers, self._deep, self._compose(transform))
+
+
+class LazyValidated(LazyMapping):
+    """A mapping whose values are validated when their key is first accessed, by
+    the validator `validator_of` returns for the key (`None` passes it through).
+    """
+
+    def __init__(
+        self,
+        mapping: Mapping,
+        validator_of: Callable[[Hashable], Optional[Callable[[Any], Any]]],
+        leaf_transform: Optional[LeafTransform] = None,
+    ) -> None:
+        super().__init__(leaf_transform)
+        self._mapping = mapping
+        self._validator_of = validator_of
+
+    def _keys(self) -> Mapping:
+        return self._mapping
+
+    def _load(self, key: Hashable) -> Any:
+        value = self._mapping[key]
+        if (validate := self._validator_of(key)) is None:
+            return value
+        if isinstance(value, LazyMapping) and self._leaf_transform is not None:
+            value = value.with_leaf_transform(self._leaf_transform)
+        return validate(value)
+
+    def with_leaf_transform(self, transform: LeafTransform) -> "LazyValidated":
+        return LazyValidated(
+            self._mapping, self._validator_of, self._compose(transform)
+        )
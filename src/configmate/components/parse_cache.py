@@ -0,0 +1,180 @@
+""" Persistent cache for parsed configs
+"""
+
+import contextlib
+import hashlib
+import hmac
+import marshal
+import os
+import pickle
+import secrets
+import stat
+import sys
+import tempfile
+from typing import Any, Tuple, Union
+
+from configmate.base import constants, operators, types
+from configmate.components import parsers
+
+_MARSHAL, _PICKLE = b"M", b"P"
+_SUFFIX = ".parsed"
+_SECRET_FILE = ".secret"
+_MAC_SIZE = hashlib.sha256().digest_size
+
+
+class ParseCache:
+    """A size-bounded directory of parsed configs, keyed by content hash.
+
+    Entries are written to a temporary file and atomically renamed into place,
+    so concurrent writers (threads or processes) never expose partial entries.
+    Reading an entry refreshes its mtime, which drives the LRU eviction once the
+    directory grows beyond `max_bytes`.
+
+    Entries are unpickled, so the directory must be private: it's created only
+    accessible by the current user, and rejected with `PermissionError` if others
+    can write to it. Entries are also authenticated with a secret stored in the
+    directory, readable only by its owner; entries that fail the check are parsed
+    again instead of being loaded.
+    """
+
+    def __init__(
+        self,
+        directory: types.FilePath,
+        max_bytes: int = constants.PARSE_CACHE_MAX_BYTES,
+    ) -> None:
+        self._directory = os.fspath(directory)
+        self._max_bytes = max_bytes
+        os.makedirs(self._directory, mode=0o700, exist_ok=True)
+        _check_private(
+            self._directory, os.stat(self._directory), stat.S_IWGRP | stat.S_IWOTH
+        )
+        self._secret = self._load_secret()
+
+    @staticmethod
+    def key(content: Union[str, bytes], parser_identity: str) -> str:
+        """Hashes the content together with the parser and the python version."""
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(f"{sys.version_info[:2]}:{parser_identity}\0".encode())
+        digest.update(content.encode() if isinstance(content, str) else content)
+        return digest.hexdigest()
+
+    def load(self, key: str) -> Tuple[bool, Any]:
+        """Returns `(True, value)` for stored keys, `(False, None)` otherwise."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                mac, data = file.read(_MAC_SIZE), file.read()
+            if not hmac.compare_digest(mac, self._mac(key, data)):
+                raise ValueError(f"Unauthenticated parse cache entry {path}")
+            value = (
+                marshal.loads(data[1:])
+                if data[:1] == _MARSHAL
+                else pickle.loads(data[1:])
+            )
+        except FileNotFoundError:
+            return False, None
+        except Exception:  # pylint: disable=broad-except
+            with contextlib.suppress(OSError):
+                os.unlink(path)  # unreadable entry, parse again
+            return False, None
+        with contextlib.suppress(OSError):
+            os.utime(path)  # most recently used
+        return True, value
+
+    def store(self, key: str, value: Any) -> None:
+        """Stores the value, then evicts the least recently used entries."""
+        try:
+            data = _MARSHAL + marshal.dumps(value)
+        except ValueError:  # e.g. datetimes, marshal only handles builtin types
+            data = _PICKLE + pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        fd, tmp_path = tempfile.mkstemp(dir=self._directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(self._mac(key, data) + data)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+        self._evict()
+
+    def clear(self) -> None:
+        """Removes all entries."""
+        for entry in self._entries():
+            with contextlib.suppress(OSError):
+                os.unlink(entry.path)
+
+    def _evict(self) -> None:
+        entries = []
+        for entry in self._entries():
+            with contextlib.suppress(OSError):  # removed by a concurrent evicter
+                entries.append((entry.stat().st_mtime_ns, entry.stat().st_size, entry))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total_size <= self._max_bytes:
+                break
+            with contextlib.suppress(OSError):
+                os.unlink(entry.path)
+            total_size -= size
+
+    def _entries(self) -> Any:
+        with os.scandir(self._directory) as entries:
+            return [entry for entry in entries if entry.name.endswith(_SUFFIX)]
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory, key + _SUFFIX)
+
+    def _mac(self, key: str, data: bytes) -> bytes:
+        return hmac.new(self._secret, key.encode() + data, hashlib.sha256).digest()
+
+    def _load_secret(self) -> bytes:
+        """Reads the secret of the directory, creating it on first use."""
+        path = os.path.join(self._directory, _SECRET_FILE)
+        if not os.path.exists(path):
+            fd, tmp_path = tempfile.mkstemp(dir=self._directory, prefix=".tmp-")
+            try:  # mkstemp creates the file only readable by the current user
+                with os.fdopen(fd, "wb") as file:
+                    file.write(secrets.token_bytes(32))
+                with contextlib.suppress(FileExistsError):
+                    os.link(tmp_path, path)  # atomic, a concurrent creator may win
+            finally:
+                os.unlink(tmp_path)
+        with open(path, "rb") as file:
+            _check_private(path, os.fstat(file.fileno()), stat.S_IRWXG | stat.S_IRWXO)
+            return file.read()
+
+
+def _check_private(path: str, stat_result: os.stat_result, forbidden: int) -> None:
+    """Raises `PermissionError` unless the current user owns `path` and others
+    don't have the `forbidden` permissions on it.
+    """
+    if not hasattr(os, "getuid"):
+        return  # no posix ownership, e.g. on windows
+    if stat_result.st_uid != os.getuid() or stat_result.st_mode & forbidden:
+        raise PermissionError(
+            f"{path} must be owned by the current user and private, the parse"
+            " cache unpickles its entries"
+        )
+
+
+class CachedParser(parsers.Parser[Any]):
+    """Wraps a parser, so unchanged inputs are loaded from a ~ParseCache."""
+
+    def __init__(self, parser: parsers.Parser[Any], cache: ParseCache) -> None:
+        super().__init__()
+        self._parser = parser
+        self._cache = cache
+
+    def _transform(self, ctx: operators.Context, input_: Any) -> Any:
+        if (identity := self._parser.cache_identity(ctx)) is None:
+            return self._parser(input_, ctx)
+        hit, value = self._cache.load(key := self._cache.key(input_, identity))
+        if not hit:
+            self._cache.store(key, value := self._parser(input_, ctx))
+        return value
+
+    def input_kind(self, path: types.FilePath) -> types.ReadMode:
+        return self._parser.input_kind(path)
+
+    def cache_identity(self, ctx: operators.Context) -> Any:
+        return self._parser.cache_identity(ctx)
@@ -3,13 +3,31 @@
 
 import configparser
 import dataclasses
+import io
 import json
 import os
 import pathlib
-from typing import Any, Callable, Dict, Generic, Literal, Type, TypeVar, Union
+import re
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 from xml.etree import ElementTree as etree
 
-from configmate.base import operators, registry, types
+from configmate.base import constants, exceptions, operators, registry, types
+from configmate.components import json_stream, lazy, selectors, sniffing
 
 T = TypeVar("T")
 T_co = TypeVar("T_co", covariant=True)
@@ -19,15 +37,41 @@ SpecT_co = TypeVar("SpecT_co", bound="ParsingSpec", covariant=True)
 ###
 # Parser base class
 ###
-class Parser(operators.Operator[Any, T_co], Generic[T_co]): ...
+class Parser(operators.Operator[Any, T_co], Generic[T_co]):
+    section: Tuple[str, ...] = ()  # the key path the parser selects, if any
+    input_kinds: Tuple[types.ReadMode, ...] = (constants.TEXT,)  # by preference
+
+    def input_kind(self, path: types.FilePath) -> types.ReadMode:
+        """The kind of file content the parser prefers for the file at `path`."""
+        return self.input_kinds[0]
+
+    def with_section(self, section: Sequence[str]) -> "Optional[Parser[Any]]":
+        """Returns a parser that parses only the given key path of the input, or
+        `None` if this parser can't select sections itself.
+        """
+        return None
+
+    def as_lazy(self) -> "Parser[Any]":
+        """Returns a parser that defers parsing subtrees until they are accessed,
+        or this parser if it can only parse eagerly.
+        """
+        return self
+
+    def cache_identity(self, ctx: operators.Context) -> Optional[str]:
+        """Identifies the parsing logic for caches, `None` if it can't be cached."""
+        identity = f"{type(self).__module__}.{type(self).__qualname__}"
+        return f"{identity}{list(self.section)}" if self.section else identity
 
 
 @dataclasses.dataclass
 class InferFrom(Generic[T_co]):
     source_operator: T_co
+    section: Sequence[str] = ()
+    lazy: bool = False
 
 
 ParsingSpec = Union[
+    Parser[T_co],
     Callable[[str], T_co],
     Union[str, os.PathLike],
     InferFrom[operators.Operator[Any, types.FilePath]],
@@ -40,8 +84,13 @@ ParserFactoryMethod = Callable[[SpecT_co], Parser[T_co]]
 ###
 class ParserFactory(registry.StrategyRegistryMixin[ParsingSpec, ParserFactoryMethod]):
     @classmethod
-    def infer_from(cls, step: operators.Operator[Any, types.FilePath]) -> Parser[Any]:
-        return cls.build_parser(InferFrom(step))
+    def infer_from(
+        cls,
+        step: operators.Operator[Any, types.FilePath],
+        section: Sequence[str] = (),
+        lazy: bool = False,
+    ) -> Parser[Any]:
+        return cls.build_parser(InferFrom(step, section, lazy))
 
     @classmethod
     def build_parser(cls, key: ParsingSpec[T]) -> Parser[T]:
@@ -54,7 +103,7 @@ class ParserFactory(registry.StrategyRegistryMixin[ParsingSpec, ParserFactoryMet
 class FileFormatParserRegistry(registry.DictRegistryMixin[str, Type[Parser[Any]]]):
     @classmethod
     def infer_parser(cls, path_or_extension: types.FilePath) -> Parser[Any]:
-        if suffix := pathlib.Path(path_or_extension).suffix:
+        if suffix := file_suffix(path_or_extension):
             return cls.lookup(suffix)()
         return cls.lookup(cls._normalize_extension(path_or_extension))()
 
@@ -68,6 +117,18 @@ class FileFormatParserRegistry(registry.DictRegistryMixin[str, Type[Parser[Any]]
         return f".{str(extension).lstrip('.')}"
 
 
+def file_suffix(path: types.FilePath) -> str:
+    """The suffix of the file name like `pathlib.PurePath.suffix`, without
+    building a path object for string paths.
+    """
+    if os.altsep:
+        return pathlib.PurePath(path).suffix  # windows paths
+    name = os.fsdecode(path).rstrip(os.sep)
+    name = name[name.rfind(os.sep) + 1 :]
+    dot = name.rfind(".")
+    return name[dot:] if 0 < dot < len(name) - 1 else ""
+
+
 ###
 # concrete parsers
 ###
@@ -79,23 +140,89 @@ class FunctionParser(Parser[T_co]):
     def _transform(self, ctx: operators.Context, input_: Any) -> T_co:
         return self._parser(input_)
 
+    def cache_identity(self, ctx: operators.Context) -> Optional[str]:
+        module = getattr(self._parser, "__module__", None)
+        qualname = getattr(self._parser, "__qualname__", "<unknown>")
+        return None if "<" in qualname else f"{module}.{qualname}"  # lambdas, locals
+
+
+class SelectingParser(Parser[Any]):
+    """Parses the whole input, then selects the section from it. The fallback for
+    parsers that can't select sections themselves.
+    """
+
+    def __init__(self, parser: Parser[Any], section: Sequence[str]) -> None:
+        super().__init__()
+        self._parser = parser
+        self._selector = selectors.KeySelector(section)
+        self.section = tuple(section)
+
+    def _transform(self, ctx: operators.Context, input_: Any) -> Any:
+        return self._selector(self._parser(input_, ctx), ctx)
+
+    def input_kind(self, path: types.FilePath) -> types.ReadMode:
+        return self._parser.input_kind(path)
+
+    def as_lazy(self) -> "SelectingParser":
+        return SelectingParser(self._parser.as_lazy(), self.section)
+
+    def cache_identity(self, ctx: operators.Context) -> Optional[str]:
+        identity = self._parser.cache_identity(ctx)
+        return None if identity is None else f"{identity}{list(self.section)}"
+
 
 class InferredParser(Parser[Any]):
-    """A parser that infers the file format from the file extension."""
+    """A parser that infers the file format from the file extension, or from the
+    first bytes of files without a registered extension. Parsers are built once
+    per format and reused until the format registry changes.
+    """
 
     infer_parser = staticmethod(FileFormatParserRegistry.infer_parser)
+    sniff_format = staticmethod(sniffing.FORMAT_SNIFFER.sniff)
 
     def __init__(
         self, infer_via: InferFrom[operators.Operator[Any, types.FilePath]]
     ) -> None:
         super().__init__()
         self._path_sender = infer_via.source_operator
+        self.section = tuple(infer_via.section)
+        self.lazy = infer_via.lazy
+        self._parsers: Dict[str, Parser[Any]] = {}  # by file suffix
+        self._generation = FileFormatParserRegistry.generation()
         infer_via.source_operator.append_callback(self._store_path)
 
     def _transform(self, ctx: operators.Context, input_: str) -> Any:
-        filename: types.FilePath = ctx[self._path_sender].filepath
-        compatible_parser = self.infer_parser(filename)
-        return compatible_parser(input_)
+        return self._infer(ctx[self._path_sender].filepath)(input_)
+
+    def input_kind(self, path: types.FilePath) -> types.ReadMode:
+        return self._infer(path).input_kind(path)
+
+    def cache_identity(self, ctx: operators.Context) -> Optional[str]:
+        return self._infer(ctx[self._path_sender].filepath).cache_identity(ctx)
+
+    def _infer(self, path: types.FilePath) -> Parser[Any]:
+        extension = self._extension(path)
+        if self._generation != (generation := FileFormatParserRegistry.generation()):
+            self._parsers, self._generation = {}, generation
+        if (parser := self._parsers.get(extension)) is None:
+            parser = self._parsers[extension] = self._build(extension)
+        return parser
+
+    def _extension(self, path: types.FilePath) -> str:
+        suffix = file_suffix(path)
+        if suffix and FileFormatParserRegistry.is_registered(suffix):
+            return suffix
+        return self.sniff_format(path)  # falls back to the content
+
+    def _build(self, extension: str) -> Parser[Any]:
+        parser = self.infer_parser(extension)
+        if self.lazy:
+            parser = parser.as_lazy()
+        if not self.section:
+            return parser
+        return parser.with_section(self.section) or SelectingParser(
+            parser, self.section
+        )
 
     def _store_path(self, ctx: operators.Context, result: types.FilePath) -> None:
         ctx[self._path_sender].filepath = result
@@ -105,39 +232,376 @@ class InferredParser(Parser[Any]):
 # File format specific parsers
 ###
 class JsonParser(Parser[Any]):
+    """Parses JSON documents, selecting the pushed down key path `section`.
+
+    By default the whole document is parsed by `json` and the section selected
+    from it. With `streaming` (or `lazy`) the document is scanned instead, only the
+    section is decoded and the rest is skipped without being validated, and of
+    duplicate keys the first one wins.
+    """
+
+    def __init__(
+        self, section: Sequence[str] = (), lazy: bool = False, streaming: bool = False
+    ) -> None:
+        super().__init__()
+        self.section = tuple(section)
+        self.lazy = lazy
+        self.streaming = streaming
+        if streaming:  # scans memory maps without copying them
+            self.input_kinds = (constants.MMAP, constants.BYTES, constants.TEXT)
+        else:
+            self.input_kinds = (constants.BYTES, constants.TEXT)
+
     def _transform(self, ctx: operators.Context, input_: Any) -> Any:
-        return json.loads(input_)
+        if self.lazy:  # objects are decoded key by key when accessed
+            if self.section:
+                start, end = json_stream.locate_section(input_, self.section)
+            else:
+                start, end = json_stream.value_start(input_), None
+            if json_stream.is_object(input_, start):
+                if not isinstance(input_, (str, bytes)):  # the file may be rewritten
+                    input_, start = input_[start:end], 0  # while the config is alive
+                return lazy.LazyJsonObject(input_, start)
+            return json_stream.load_span(input_, start, end)
+        if self.streaming and self.section:
+            return json_stream.load_section(input_, self.section)  # skips the rest
+        config = json.loads(input_ if isinstance(input_, (str, bytes)) else input_[:])
+        if not self.section:
+            return config
+        return selectors.KeySelector(self.section)(config, ctx)
+
+    def with_section(self, section: Sequence[str]) -> "JsonParser":
+        return JsonParser(section, self.lazy, self.streaming)
+
+    def cache_identity(self, ctx: operators.Context) -> Optional[str]:
+        if self.lazy:  # pickling would materialize the whole object
+            return None
+        identity = super().cache_identity(ctx)
+        return f"{identity}(streaming)" if self.streaming else identity
+
+    def as_lazy(self) -> "JsonParser":
+        return JsonParser(self.section, True, self.streaming)
 
 
 class IniParser(Parser[Any]):
+    """Parses INI files into dicts of sections.
+
+    By default the files are read by `configparser`, with its interpolation. With
+    `interpolation=False`, e.g. when the variables were already interpolated, they
+    are read in a single pass into plain dicts instead, skipping the sections that
+    aren't requested. Only the section of a pushed down key path, or the given
+    `sections`, are loaded. `coerce_types` converts ints, floats, booleans and
+    multi-line values (into lists of values).
+    """
+
+    def __init__(
+        self,
+        section: Sequence[str] = (),
+        coerce_types: bool = False,
+        interpolation: bool = True,
+        sections: Optional[Sequence[str]] = None,
+    ) -> None:
+        super().__init__()
+        self.section = tuple(section)
+        self.coerce_types = coerce_types
+        self.interpolation = interpolation
+        self.sections = None if sections is None else tuple(sections)
+
     def _transform(self, ctx: operators.Context, input_: Any) -> Any:
-        (cnfparser := configparser.ConfigParser()).read_string(input_)
-        return self._convert_ini_to_dict(cnfparser)
+        wanted = self.section[:1] or self.sections
+        if self.interpolation:
+            (cnfparser := configparser.ConfigParser()).read_string(input_)
+            config = self._convert_ini_to_dict(cnfparser, wanted)
+        else:
+            config = self._read_ini(input_, wanted)
+        if self.coerce_types:
+            config = {
+                name: {key: _coerce_ini_value(value) for key, value in items.items()}
+                for name, items in config.items()
+            }
+        if not self.section:
+            return config
+        name, *keys = self.section
+        if name not in config:
+            raise exceptions.SectionNotFound(f"{name=} not in the ini sections")
+        return selectors.KeySelector(keys)(config[name], ctx)
+
+    def with_section(self, section: Sequence[str]) -> "IniParser":
+        return IniParser(section, self.coerce_types, self.interpolation, self.sections)
+
+    def cache_identity(self, ctx: operators.Context) -> Optional[str]:
+        options = (self.coerce_types, self.interpolation, self.sections)
+        identity = super().cache_identity(ctx)
+        return identity if options == (False, True, None) else f"{identity}{options}"
 
     @staticmethod
-    def _convert_ini_to_dict(cnfparser: configparser.ConfigParser) -> Dict[str, Dict]:
-        return {section: dict(cnfparser[section]) for section in cnfparser.sections()}
+    def _convert_ini_to_dict(
+        cnfparser: configparser.ConfigParser, wanted: Optional[Sequence[str]] = None
+    ) -> Dict[str, Dict]:
+        return {
+            section: dict(cnfparser[section])
+            for section in cnfparser.sections()
+            if wanted is None or section in wanted
+        }
+
+    @staticmethod
+    def _read_ini(
+        text: str, wanted: Optional[Sequence[str]] = None
+    ) -> Dict[str, Dict[str, str]]:
+        """Reads the sections like `configparser` without interpolation: keys are
+        lowercased, indented lines continue the value above (blank lines within
+        are kept), and the values of the DEFAULT section are inherited by every
+        section. Malformed option lines are reported together at the end.
+        """
+        defaults: Dict[str, str] = {}
+        config: Dict[str, Dict[str, str]] = {}
+        items: Optional[Dict[str, str]] = None  # None in skipped sections
+        section: Optional[str] = None
+        key, key_indent, blanks = None, 0, 0
+        error: Optional[configparser.ParsingError] = None
+        for lineno, line in enumerate(text.splitlines(), start=1):
+            if not (stripped := line.strip()):
+                blanks += 1  # kept if the value continues after them
+                continue
+            if stripped[0] in "#;":
+                continue
+            indent = len(line) - len(line.lstrip())
+            if key and indent > key_indent:  # not after an empty key either
+                if items is not None:
+                    items[key] += "\n" * (blanks + 1) + stripped
+                blanks = 0
+                continue
+            key_indent, blanks = indent, 0
+            if header := _INI_SECTION.match(stripped):
+                key = None  # sections can't start with a continuation line
+                if (section := header["header"]) == configparser.DEFAULTSECT:
+                    items = defaults
+                elif section in config:
+                    raise configparser.DuplicateSectionError(section, None, lineno)
+                elif wanted is None or section in wanted:
+                    items = config[section] = {}
+                else:
+                    items = None  # skipped without parsing its options
+                continue
+            if section is None:
+                raise configparser.MissingSectionHeaderError("<string>", lineno, line)
+            if items is None:
+                continue
+            if not (match := _INI_OPTION.match(stripped)) or not match["key"]:
+                error = error or configparser.ParsingError("<string>")
+                error.append(lineno, line)
+                if match is None:
+                    continue  # the option above can still continue
+            if (key := match["key"].lower()) in items:
+                raise configparser.DuplicateOptionError(section, key, None, lineno)
+            items[key] = match["value"]
+        if error is not None:
+            raise error
+        return {name: {**defaults, **values} for name, values in config.items()}
+
+
+_INI_SECTION = re.compile(r"\[(?P<header>.+)\]")  # configparser's SECTCRE
+_INI_OPTION = re.compile(r"(?P<key>.*?)\s*[=:]\s*(?P<value>.*)$")
+_INI_INT = re.compile(r"[+-]?\d+$")
+_INI_FLOAT = re.compile(r"[+-]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?$")
+
+
+def _coerce_ini_value(value: str) -> Any:
+    """Converts ints, floats and booleans, multi-line values into lists of them."""
+    if "\n" in value:
+        return [_coerce_ini_value(line) for line in value.splitlines() if line]
+    if _INI_INT.match(value):
+        return int(value)
+    if _INI_FLOAT.match(value):
+        return float(value)
+    if (boolean := configparser.ConfigParser.BOOLEAN_STATES.get(value.lower())) is None:
+        return value
+    return boolean
 
 
 class XmlParser(Parser[Any]):
-    XmlTree = Union[Literal[None], str, Dict[str, "XmlTree"]]
+    """Converts XML into nested dicts iteratively, visiting each element once.
+
+    Leaves become their text, repeated tags are collected into lists. Attributes
+    are kept under "@name" keys, next to the text under "#text". Inputs of
+    `XML_ITERPARSE_MIN_BYTES` or more are converted from the parse events instead
+    of a tree, clearing the elements as soon as they are converted. `lxml` is used
+    for bytes and memory maps when it's installed, without resolving entities.
+    """
+
+    XmlTree = Union[Literal[None], str, Dict[str, "XmlTree"], List["XmlTree"]]
+
+    input_kinds = (constants.MMAP, constants.BYTES, constants.TEXT)
+
+    def __init__(self, section: Sequence[str] = ()) -> None:
+        super().__init__()
+        self.section = tuple(section)
 
     def _transform(self, ctx: operators.Context, input_: Any) -> Any:
-        root = etree.fromstring(input_)
-        return self._convert_etree_to_dict(root)
+        if len(input_) < constants.XML_ITERPARSE_MIN_BYTES:
+            matches = self._convert_tree(_fromstring(input_))
+        elif isinstance(input_, str):
+            events = etree.iterparse(io.StringIO(input_), events=("start", "end"))
+            matches = self._convert_events(events)
+        else:  # memory maps are read as files, without copying them
+            source = io.BytesIO(input_) if isinstance(input_, bytes) else input_
+            events = _iterparse(source, events=("start", "end"))
+            matches = self._convert_events(events)
+        if not matches:
+            raise exceptions.SectionNotFound(f"{self.section=} not in the xml tree")
+        return matches[0] if len(matches) == 1 else matches
+
+    def with_section(self, section: Sequence[str]) -> "XmlParser":
+        return XmlParser(section)
+
+    def _convert_tree(self, root: Any) -> List[XmlTree]:
+        """Converts the elements at the section path, the root without a section."""
+        if not self.section:
+            return [self._convert_element(root)]
+        return [self._convert_element(e) for e in root.iterfind("/".join(self.section))]
+
+    def _convert_element(self, element: Any) -> XmlTree:
+        """Converts an element iteratively, each element is visited once."""
+        element_value = self._element_value
+        stack = [(element, {}, iter(element))]
+        while True:
+            parent, children, iterator = stack[-1]
+            for child in iterator:
+                if len(child):  # descends, resumes the parent afterwards
+                    stack.append((child, {}, iter(child)))
+                    break
+                if not isinstance(tag := child.tag, str):
+                    continue  # unresolved lxml entities
+                value = element_value(child, {}) if child.attrib else child.text
+                if tag in children:
+                    _add_child(children, tag, value)
+                else:  # the common case, inlined
+                    children[tag] = value
+            else:
+                stack.pop()
+                value = element_value(parent, children)
+                if not stack:
+                    return value
+                _add_child(stack[-1][1], parent.tag, value)
+
+    def _convert_events(self, events: Iterable[Tuple[str, Any]]) -> List[XmlTree]:
+        """Converts the elements at the section path, the root without a section.
+
+        Elements are cleared as soon as they are converted, converted children are
+        dropped from their parents in batches to keep the memory bounded.
+        """
+        events = iter(events)
+        section, depth = self.section, len(self.section)
+        frames: List[List[Any]] = []  # the open elements, as subtree frames
+        matched = 0  # levels below the root that match the section
+        matches: List[XmlParser.XmlTree] = []
+        for event, element in events:
+            if event == "start":
+                level = len(frames)  # the root is at level 0
+                if level and level == matched + 1 <= depth:
+                    matched += element.tag == section[level - 1]
+                if level != matched or level != depth:
+                    frames.append([element, None, 0])
+                    continue
+                matches.append(self._convert_subtree(element, events))
+            else:
+                frames.pop()
+            if matched and matched == len(frames):
+                matched -= 1
+            element.clear()
+            if frames:
+                _drop_converted(frames[-1])
+        return matches
+
+    def _convert_subtree(self, root: Any, events: Iterator[Tuple[str, Any]]) -> XmlTree:
+        """Converts an element from the events after its start up to its end."""
+        element_value = self._element_value
+        frames: List[List[Any]] = [[root, None, 0]]  # element, children, dropped
+        for event, element in events:
+            if event == "start":
+                frames.append([element, None, 0])  # children are added lazily
+                continue
+            children = frames.pop()[1]
+            if children is not None or element.attrib:
+                value = element_value(element, children or {})
+            else:
+                value = element.text
+            if not frames:
+                return value
+            element.clear()
+            if (children := (parent := frames[-1])[1]) is None:
+                parent[1] = {element.tag: value}
+            elif (tag := element.tag) in children:
+                _add_child(children, tag, value)
+            else:  # the common case, inlined
+                children[tag] = value
+            _drop_converted(parent)
+        raise etree.ParseError(f"{root.tag=} isn't closed")
 
     @staticmethod
-    def _convert_etree_to_dict(element: etree.Element) -> XmlTree:
-        if not (children := list(element)):
-            return element.text
-        return {
-            child.tag: (
-                child.text
-                if not list(child)
-                else XmlParser._convert_etree_to_dict(child)
-            )
-            for child in children
-        }
+    def _element_value(element: Any, children: Dict[str, Any]) -> XmlTree:
+        text = element.text
+        if not element.attrib:
+            if not children:
+                return text
+            if not text or text.isspace():
+                return children  # owned by the element, not copied
+        value = {f"@{name}": attr for name, attr in element.attrib.items()}
+        value.update(children)
+        if not children and text is not None:
+            value["#text"] = text
+        elif text and not text.isspace():  # mixed content
+            value["#text"] = text.strip()
+        return value
+
+
+_XML_CLEAR_BATCH = 256  # converted children dropped from their parent at once
+
+
+def _drop_converted(frame: List[Any]) -> None:
+    """Counts a converted child of the open element of a frame, and drops the
+    converted children from the element in batches.
+    """
+    frame[2] += 1
+    if frame[2] >= _XML_CLEAR_BATCH:
+        del frame[0][: frame[2]]
+        frame[2] = 0
+
+
+def _add_child(parent: Dict[str, Any], tag: str, value: Any) -> None:
+    """Adds a converted child, repeated tags are collected into a list."""
+    if (existing := parent.setdefault(tag, value)) is value:
+        return
+    if isinstance(existing, list):  # converted elements are never lists
+        existing.append(value)
+    else:
+        parent[tag] = [existing, value]
+
+
+try:  # the faster parser when installed
+    from lxml import etree as _lxml
+except ImportError:
+    _lxml = None
+
+
+# entities are left unresolved and libxml2's size limits kept, like expat lxml is
+# then safe from entity expansion (billion laughs) and external entity attacks
+_LXML_OPTIONS = {"remove_comments": True, "remove_pis": True, "resolve_entities": False}
+
+
+def _fromstring(input_: Any) -> Any:
+    if isinstance(input_, str):  # lxml rejects text with an encoding declaration
+        return etree.fromstring(input_)
+    input_ = input_ if isinstance(input_, bytes) else input_[:]
+    if _lxml is None:
+        return etree.fromstring(input_)
+    return _lxml.fromstring(input_, _lxml.XMLParser(**_LXML_OPTIONS))
+
+
+def _iterparse(source: Any, events: Sequence[str]) -> Iterable[Tuple[str, Any]]:
+    if _lxml is None:
+        return etree.iterparse(source, events=events)
+    return _lxml.iterparse(source, events=events, **_LXML_OPTIONS)
 
 
 ###
@@ -156,6 +620,17 @@ def is_string(spec: ParsingSpec) -> bool:
     return isinstance(spec, str)
 
 
-ParserFactory.register(is_inferred_from, InferredParser)
-ParserFactory.register(callable, FunctionParser)
-ParserFactory.register(is_string, FileFormatParserRegistry.infer_parser)
+def is_parser(spec: ParsingSpec) -> bool:
+    return isinstance(spec, Parser)
+
+
+def use_parser(parser: Parser[T]) -> Parser[T]:
+    return parser
+
+
+ParserFactory.register(is_inferred_from, InferredParser, type_based=True)
+ParserFactory.register(is_parser, use_parser, type_based=True)
+ParserFactory.register(callable, FunctionParser, type_based=True)
+ParserFactory.register(
+    is_string, FileFormatParserRegistry.infer_parser, type_based=True
+)
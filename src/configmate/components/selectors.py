@@ -67,5 +67,5 @@ def is_sequence_or_string(spec: Any) -> bool:
     return isinstance(spec, (Sequence, str))
 
 
-SectionSelectorFactory.register(callable, FunctionSectionSelector)
-SectionSelectorFactory.register(is_sequence_or_string, KeySelector)
+SectionSelectorFactory.register(callable, FunctionSectionSelector, type_based=True)
+SectionSelectorFactory.register(is_sequence_or_string, KeySelector, type_based=True)
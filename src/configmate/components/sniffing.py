@@ -0,0 +1,122 @@
+""" Content sniffing, infers the format of files without a known extension
+"""
+
+import json
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from configmate.base import constants, exceptions, types
+from configmate.components import filereader
+
+_SECTION_HEADER = re.compile(r"\[[^\[\]\"'{},]+\]\s*(?:[#;].*)?$")
+_TABLE_ARRAY_HEADER = re.compile(r"\[\[[^\[\]]+\]\]\s*(?:#.*)?$")
+_KEY_VALUE = re.compile(r"[\w.\-\"' ]+?\s*(?P<delimiter>[=:])\s*(?P<value>.*)$")
+_TOML_VALUE = re.compile(r"(?:[\"'\[{]|true\b|false\b|[+-]?(?:\d|inf\b|nan\b))")
+_YAML_ITEM = re.compile(r"(?:[\w.\-\"']+\s*:|-)(?:\s|$)")
+
+
+def sniff_format(head: bytes, truncated: bool = False) -> Optional[str]:
+    """Infers the extension of the format of a file from its first bytes, or
+    `None` if it's not recognized. Pass `truncated` if the file is longer.
+
+    JSON and XML are recognized by their first character, YAML by its document
+    markers or `key: value` lines, INI and TOML by their section headers or, for
+    TOML, `key = value` lines before any header. Sections with only TOML values
+    (quoted strings, numbers, booleans, arrays and tables) are taken as TOML.
+    """
+    text = head.decode("utf-8", errors="ignore").lstrip("\ufeff")  # byte order mark
+    if (stripped := text.lstrip()).startswith("<"):
+        return ".xml"
+    if stripped.startswith("{") or _is_json_array(stripped, truncated):
+        return ".json"
+    lines = text.splitlines()[:-1] if truncated else text.splitlines()
+    if not (lines := _significant_lines(lines)):
+        return None
+    first = lines[0]
+    if first.startswith(("---", "%YAML")):
+        return ".yaml"
+    if _TABLE_ARRAY_HEADER.match(first):
+        return ".toml"
+    if _SECTION_HEADER.match(first):
+        return ".toml" if _has_toml_values(lines[1:]) else ".ini"
+    if first.startswith("["):
+        return ".json"
+    if (match := _KEY_VALUE.match(first)) and match["delimiter"] == "=":
+        return ".toml"  # ini files start with a section header
+    if _YAML_ITEM.match(first):
+        return ".yaml"
+    return None
+
+
+def _is_json_array(text: str, truncated: bool) -> bool:
+    """Whether a whole head is a JSON array, e.g. `[1]` which looks like a section
+    header. Arrays cut off by the head are told apart by their first line later.
+    """
+    if truncated or not text.startswith("["):
+        return False
+    try:
+        return isinstance(json.loads(text), list)
+    except ValueError:
+        return False
+
+
+def _significant_lines(lines: List[str]) -> List[str]:
+    stripped = (line.strip() for line in lines)
+    return [line for line in stripped if line and not line.startswith(("#", ";"))]
+
+
+def _has_toml_values(lines: List[str]) -> bool:
+    values = [
+        match
+        for line in lines
+        if not _SECTION_HEADER.match(line) and (match := _KEY_VALUE.match(line))
+    ]
+    return bool(values) and all(
+        match["delimiter"] == "=" and _TOML_VALUE.match(match["value"])
+        for match in values
+    )
+
+
+class FormatSniffer:
+    """Infers the format of files from their first bytes. The decision is cached
+    per path until the identity (mtime and size) of the file changes.
+    """
+
+    def __init__(
+        self,
+        size: int = constants.SNIFF_SIZE,
+        maxsize: int = constants.SNIFF_CACHE_SIZE,
+    ) -> None:
+        self._size = size
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._decisions: Dict[str, Tuple[filereader.FileIdentity, str]] = {}
+
+    def sniff(self, path: types.FilePath) -> str:
+        """Returns the extension of the format of the file at `path`."""
+        identity = filereader.file_identity(path)
+        with self._lock:
+            cached = self._decisions.get(identity[0])
+        if cached is not None and cached[0] == identity:
+            return cached[1]
+        with open(path, "rb") as file:
+            head = file.read(self._size + 1)
+        extension = sniff_format(head[: self._size], len(head) > self._size)
+        if extension is None:
+            raise exceptions.NoApplicableStrategy(
+                f"Can't infer the format of {path=} from its extension or content"
+            )
+        with self._lock:
+            if len(self._decisions) >= self._maxsize:
+                self._decisions.clear()
+            self._decisions[identity[0]] = identity, extension
+        return extension
+
+    def clear(self) -> None:
+        """Drops all cached decisions."""
+        with self._lock:
+            self._decisions.clear()
+
+
+FORMAT_SNIFFER = FormatSniffer()
@@ -1,9 +1,12 @@
 """ Generic flexible validation step usable in the pipeline
 """
 
-from typing import Any, Callable, Type, TypeVar, Union
+import typing
+from typing import Any, Callable, ClassVar, Dict, Hashable, Mapping, Optional, Type
+from typing import TypeVar, Union
 
-from configmate.base import operators, registry
+from configmate.base import exceptions, operators, registry
+from configmate.components import lazy
 
 T_co = TypeVar("T_co", covariant=True)
 T_contra = TypeVar("T_contra", contravariant=True)
@@ -43,7 +46,66 @@ class FunctionValidator(TypeValidator[T_contra, T_co]):
         return self._method(input_)
 
 
+class LazyValidator(TypeValidator[Mapping, Mapping]):
+    """Validates the values of a lazy config when their key is first accessed,
+    each by the validator of its annotation on the validation type (a pydantic
+    model, dataclass, TypedDict...). The result is a read-only mapping of the
+    validated values rather than an instance of the type.
+    """
+
+    def __init__(self, field_types: Mapping[str, Any]) -> None:
+        super().__init__()
+        self._field_types = dict(field_types)
+        self._validators: Dict[Hashable, Optional[Callable[[Any], Any]]] = {}
+
+    def _transform(self, ctx: operators.Context, input_: Mapping) -> Mapping:
+        return lazy.LazyValidated(input_, self._validator_of)
+
+    def _validator_of(self, key: Hashable) -> Optional[Callable[[Any], Any]]:
+        if key not in self._validators:  # built on first access as well
+            field_type = self._field_types.get(key)  # type: ignore[call-overload]
+            self._validators[key] = (
+                TypeValidatorFactory.build_validator(field_type)
+                if _is_validatable(field_type)
+                else None
+            )
+        return self._validators[key]
+
+    @staticmethod
+    def field_types(spec: ValidationSpec) -> Dict[str, Any]:
+        """The annotated fields of a validation type, empty if it has none."""
+        if not isinstance(spec, type) or spec.__module__ == "builtins":
+            return {}
+        try:
+            hints = typing.get_type_hints(spec)
+        except (NameError, TypeError):
+            return {}
+        return {
+            name: hint
+            for name, hint in hints.items()
+            if not name.startswith("_")
+            and hint is not ClassVar
+            and typing.get_origin(hint) is not ClassVar
+        }
+
+
+def _is_validatable(field_type: Any) -> bool:
+    """Whether a field annotation has a validator. Typing annotations such as
+    `Optional[int]` can't be called, they're passed through unless a registered
+    validator (e.g. pydantic) understands them.
+    """
+    if field_type is None or field_type is Any:
+        return False
+    if isinstance(field_type, type):
+        return True
+    try:
+        strategy = TypeValidatorFactory.get_first_match(field_type)
+    except exceptions.NoApplicableStrategy:
+        return False
+    return strategy is not FunctionValidator
+
+
 ###
 # register strategies in order of priority
 ###
-TypeValidatorFactory.register(callable, FunctionValidator)
+TypeValidatorFactory.register(callable, FunctionValidator, type_based=True)
@@ -1 +1,3 @@
+from configmate.core.async_functions import aget_config, aconfigure
 from configmate.core.functions import get_config, configure
+from configmate.core.live import LiveConfig
@@ -0,0 +1,307 @@
+""" Async counterparts of the core functions of configmate.
+.. autofunction:: configmate.core.async_functions.aget_config
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import itertools
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from configmate.base import async_operators, constants, operators, tracing, types
+from configmate.components import (
+    aggregators,
+    interpolators,
+    parsers,
+    selectors,
+    validators,
+)
+from configmate.core import builders, caching
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+
+@overload
+async def aget_config(  # if no validation is specified, we get the output of the aggregation
+    *config_files: types.FilePath,
+    ## file reading
+    interpolation: Optional[interpolators.InterpolatorSpec] = constants.ENVIRONMENT,
+    parsing: Union[types.Infer, parsers.ParsingSpec[U]] = constants.INFER_FROM_PATH,
+    section: Optional[selectors.SectionSelectionSpec] = None,
+    streaming: bool = False,
+    interpolate_values: bool = False,
+    aggregation: Optional[str] = None,
+    validation: None = None,
+    ## CLI overlay options
+    cli_section_name: Optional[str] = None,
+    cli_section_end: Optional[str] = constants.CLI_SECTION_END_TOKEN,
+    cli_overlay_file_prefix: str = constants.CLI_OVERLAY_FILE_PREFIX,
+    cli_overlay_arg_key_prefix: str = constants.CLI_OVERLAY_KWARG_KEY_PREFIX,
+    cli_overlay_arg_key_delimiter: str = constants.CLI_OVERLAY_KWARG_KEY_DELIMITER,
+    cli_overlay_arg_parser: Callable[
+        [str], Any
+    ] = constants.CLI_OVERLAY_KWARG_VAL_PARSER,
+    ## encoding
+    file_encoding: str = constants.SYS_DEFAULT_FILE_ENCODING,
+    ## caching
+    parse_cache_dir: Optional[types.FilePath] = None,
+    ## concurrency
+    executor: builders.ExecutorSpec = None,
+    ## observability
+    tracer: Optional[tracing.Tracer] = None,
+) -> U: ...
+@overload  # if no validation is specified, we get the output of the aggregation
+async def aget_config(
+    *config_files: types.FilePath,
+    ## file reading
+    interpolation: Optional[interpolators.InterpolatorSpec] = constants.ENVIRONMENT,
+    parsing: Union[types.Infer, parsers.ParsingSpec] = constants.INFER_FROM_PATH,
+    section: Optional[selectors.SectionSelectionSpec] = None,
+    streaming: bool = False,
+    interpolate_values: bool = False,
+    aggregation: aggregators.AggregationSpec[T, U] = ...,
+    validation: None = None,
+    ## CLI overlay options
+    cli_section_name: Optional[str] = None,
+    cli_section_end: Optional[str] = constants.CLI_SECTION_END_TOKEN,
+    cli_overlay_file_prefix: str = constants.CLI_OVERLAY_FILE_PREFIX,
+    cli_overlay_arg_key_prefix: str = constants.CLI_OVERLAY_KWARG_KEY_PREFIX,
+    cli_overlay_arg_key_delimiter: str = constants.CLI_OVERLAY_KWARG_KEY_DELIMITER,
+    cli_overlay_arg_parser: Callable[
+        [str], Any
+    ] = constants.CLI_OVERLAY_KWARG_VAL_PARSER,
+    ## encoding
+    file_encoding: str = constants.SYS_DEFAULT_FILE_ENCODING,
+    ## caching
+    parse_cache_dir: Optional[types.FilePath] = None,
+    ## concurrency
+    executor: builders.ExecutorSpec = None,
+    ## observability
+    tracer: Optional[tracing.Tracer] = None,
+) -> U: ...
+@overload  # the validation determines the return type
+async def aget_config(
+    *config_files: types.FilePath,
+    ## file reading
+    interpolation: Optional[interpolators.InterpolatorSpec] = constants.ENVIRONMENT,
+    parsing: Union[types.Infer, parsers.ParsingSpec] = constants.INFER_FROM_PATH,
+    section: Optional[selectors.SectionSelectionSpec] = None,
+    streaming: bool = False,
+    interpolate_values: bool = False,
+    aggregation: aggregators.AggregationSpec = constants.OVERLAY,
+    validation: validators.ValidationSpec[T, U] = ...,
+    ## CLI overlay options
+    cli_section_name: Optional[str] = None,
+    cli_section_end: Optional[str] = constants.CLI_SECTION_END_TOKEN,
+    cli_overlay_file_prefix: str = constants.CLI_OVERLAY_FILE_PREFIX,
+    cli_overlay_arg_key_prefix: str = constants.CLI_OVERLAY_KWARG_KEY_PREFIX,
+    cli_overlay_arg_key_delimiter: str = constants.CLI_OVERLAY_KWARG_KEY_DELIMITER,
+    cli_overlay_arg_parser: Callable[
+        [str], Any
+    ] = constants.CLI_OVERLAY_KWARG_VAL_PARSER,
+    ## encoding
+    file_encoding: str = constants.SYS_DEFAULT_FILE_ENCODING,
+    ## caching
+    parse_cache_dir: Optional[types.FilePath] = None,
+    ## concurrency
+    executor: builders.ExecutorSpec = None,
+    ## observability
+    tracer: Optional[tracing.Tracer] = None,
+) -> U: ...
+async def aget_config(  # pylint: disable=too-many-arguments,too-many-locals
+    *config_files: types.FilePath,
+    ## file reading
+    interpolation: Optional[interpolators.InterpolatorSpec] = constants.ENVIRONMENT,
+    parsing: Union[types.Infer, parsers.ParsingSpec] = constants.INFER_FROM_PATH,
+    section: Optional[selectors.SectionSelectionSpec] = None,
+    streaming: bool = False,
+    interpolate_values: bool = False,
+    aggregation: aggregators.AggregationSpec = constants.OVERLAY,
+    validation: Optional[validators.ValidationSpec] = None,
+    ## CLI overlay options
+    cli_section_name: Optional[str] = None,
+    cli_section_end: Optional[str] = constants.CLI_SECTION_END_TOKEN,
+    cli_overlay_file_prefix: str = constants.CLI_OVERLAY_FILE_PREFIX,
+    cli_overlay_arg_key_prefix: str = constants.CLI_OVERLAY_KWARG_KEY_PREFIX,
+    cli_overlay_arg_key_delimiter: str = constants.CLI_OVERLAY_KWARG_KEY_DELIMITER,
+    cli_overlay_arg_parser: Callable[
+        [str], Any
+    ] = constants.CLI_OVERLAY_KWARG_VAL_PARSER,
+    ## encoding
+    file_encoding: str = constants.SYS_DEFAULT_FILE_ENCODING,
+    ## caching
+    parse_cache_dir: Optional[types.FilePath] = None,
+    ## concurrency
+    executor: builders.ExecutorSpec = None,
+    ## observability
+    tracer: Optional[tracing.Tracer] = None,
+):
+    """Get the config without blocking the event loop, see `get_config`.
+
+    The files are read, interpolated and parsed concurrently on `executor`, either
+    "thread", "process" or a `concurrent.futures.Executor` (the default executor
+    of the running loop if none is given), pass "process" for CPU-heavy parsers.
+    The CLI arguments, aggregation and validation run on the default executor.
+    """
+    file_processing_pipeline = builders.build_fileprocessor(
+        interpolation=interpolation,
+        parsing=parsing,
+        section=section,
+        streaming=streaming,
+        interpolate_values=interpolate_values,
+        file_encoding=file_encoding,
+        parse_cache_dir=parse_cache_dir,
+    )
+    cli_reader = builders.build_cli_reader(
+        section_name=cli_section_name,
+        section_end=cli_section_end,
+        file_arg_prefix=cli_overlay_file_prefix,
+        cli_overlay_file_parser=file_processing_pipeline,
+        kwarg_key_delimiter=cli_overlay_arg_key_delimiter,
+        kwarg_key_prefix=cli_overlay_arg_key_prefix,
+        kwarg_value_parser=cli_overlay_arg_parser,
+    )
+    config_merger = builders.build_config_merger(
+        aggregation=aggregation,
+        validation=validation,
+    )
+    ctx = operators.Context(tracer)
+    with tracing.root_span(ctx, "aget_config"):
+        with builders.open_executor(executor) as pool:
+            layers = await _aresolve_layers(
+                file_processing_pipeline, cli_reader, config_files, pool, ctx
+            )
+        return await async_operators.Offload(config_merger)(layers, ctx)
+
+
+def aconfigure(  # pylint: disable=too-many-arguments,too-many-locals
+    *config_files: types.FilePath,
+    ## file reading
+    interpolation: Optional[interpolators.InterpolatorSpec] = constants.ENVIRONMENT,
+    parsing: Union[types.Infer, parsers.ParsingSpec] = constants.INFER_FROM_PATH,
+    section: Optional[selectors.SectionSelectionSpec] = None,
+    streaming: bool = False,
+    interpolate_values: bool = False,
+    aggregation: aggregators.AggregationSpec = constants.OVERLAY,
+    validation: Optional[validators.ValidationSpec] = None,
+    ## CLI overlay options
+    cli_section_name: Optional[str] = None,
+    cli_section_end: Optional[str] = constants.CLI_SECTION_END_TOKEN,
+    cli_overlay_file_prefix: str = constants.CLI_OVERLAY_FILE_PREFIX,
+    cli_overlay_arg_key_prefix: str = constants.CLI_OVERLAY_KWARG_KEY_PREFIX,
+    cli_overlay_arg_key_delimiter: str = constants.CLI_OVERLAY_KWARG_KEY_DELIMITER,
+    cli_overlay_arg_parser: Callable[
+        [str], Any
+    ] = constants.CLI_OVERLAY_KWARG_VAL_PARSER,
+    ## encoding
+    file_encoding: str = constants.SYS_DEFAULT_FILE_ENCODING,
+    ## caching
+    parse_cache_dir: Optional[types.FilePath] = None,
+    check_staleness: bool = False,
+    ## concurrency
+    executor: builders.ExecutorSpec = None,
+    ## observability
+    tracer: Optional[tracing.Tracer] = None,
+) -> Callable[[Callable[..., Awaitable[U]]], Callable[..., Awaitable[U]]]:
+    """Decorator to configure a coroutine function with the given config.
+
+    Mirrors `configure`, the layers are resolved as in `aget_config`.
+    """
+    file_processing_pipeline = builders.build_fileprocessor(
+        interpolation=interpolation,
+        parsing=parsing,
+        section=section,
+        streaming=streaming,
+        interpolate_values=interpolate_values,
+        file_encoding=file_encoding,
+        parse_cache_dir=parse_cache_dir,
+    )
+    cli_reader = builders.build_cli_reader(
+        section_name=cli_section_name,
+        section_end=cli_section_end,
+        file_arg_prefix=cli_overlay_file_prefix,
+        cli_overlay_file_parser=file_processing_pipeline,
+        kwarg_key_delimiter=cli_overlay_arg_key_delimiter,
+        kwarg_key_prefix=cli_overlay_arg_key_prefix,
+        kwarg_value_parser=cli_overlay_arg_parser,
+    )
+    value_interpolator = builders.build_value_interpolator(
+        interpolation, interpolate_values
+    )
+    file_parser = builders.build_fileprocessor(  # values are interpolated per call
+        interpolation=None if value_interpolator is not None else interpolation,
+        parsing=parsing,
+        section=section,
+        streaming=streaming,
+        file_encoding=file_encoding,
+        parse_cache_dir=parse_cache_dir,
+    )
+    config_merger = async_operators.Offload(
+        builders.build_config_merger(
+            aggregation=aggregation,
+            validation=validation,
+        )
+    )
+
+    async def resolve_layers(ctx: operators.Context) -> List[Any]:
+        with builders.open_executor(executor) as pool:
+            layers = await _aresolve_layers(
+                file_parser, cli_reader, config_files, pool, ctx
+            )
+        if value_interpolator is not None:
+            for i in range(len(config_files)):  # the file layers come first
+                layers[i] = value_interpolator.index(layers[i])
+        return layers
+
+    def decorator(func: Callable[..., Awaitable[U]]) -> Callable[..., Awaitable[U]]:
+        layer_cache: caching.LayerCache[Any] = caching.LayerCache(
+            config_files,
+            constants.CLI_ARGS,
+            check_staleness=check_staleness,
+            value_interpolator=value_interpolator,
+        )
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> U:
+            kwargs.update(dict(zip(func.__code__.co_varnames, args)))
+            ctx = operators.Context(tracer)
+            with tracing.root_span(ctx, "aconfigure"):
+                layers = await layer_cache.aget(functools.partial(resolve_layers, ctx))
+                new_kwargs = await config_merger(
+                    itertools.chain(layers, (kwargs,)), ctx
+                )
+            return await func(**new_kwargs)
+
+        wrapper.invalidate_config = layer_cache.invalidate  # type: ignore
+        return wrapper
+
+    return decorator
+
+
+async def _aresolve_layers(
+    file_processor: operators.Operator[types.FilePath, T],
+    cli_reader: operators.Operator[types.CliArgs, Iterable[Any]],
+    config_files: Iterable[types.FilePath],
+    executor: Optional[concurrent.futures.Executor],
+    ctx: operators.Context,
+) -> List[Any]:
+    file_loader = async_operators.AsyncMapIterable(
+        async_operators.Offload(file_processor, executor)
+    )
+    cli_loader = async_operators.Offload(cli_reader.pipe_to(operators.Collect()))
+    file_layers, cli_layers = await asyncio.gather(
+        file_loader(config_files, ctx),
+        cli_loader(constants.CLI_ARGS, ctx.get_child()),  # runs on another thread
+    )
+    return list(itertools.chain(file_layers, cli_layers))
@@ -1,5 +1,19 @@
+import codecs
+import concurrent.futures
+import contextlib
 import pathlib
-from typing import Callable, Iterable, Iterator, Optional, TypeVar, Union
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from configmate.base import constants, operators, types
 from configmate.components import (
@@ -7,11 +21,12 @@ from configmate.components import (
     cli_readers,
     filereader,
     interpolators,
+    parse_cache,
     parsers,
     selectors,
     validators,
 )
-from configmate.core import composers
+from configmate.core import caching, composers
 
 T = TypeVar("T")
 T_co = TypeVar("T_co", covariant=True)
@@ -27,7 +42,10 @@ build_config_section_selector = selectors.SectionSelectorFactory.build_selector
 build_aggregator = aggregators.AggregatorFactory.build_aggregator
 build_validator = validators.TypeValidatorFactory.build_validator
 
+ExecutorSpec = Union[None, Literal["thread", "process"], concurrent.futures.Executor]
+
 
+@caching.memoize_pipeline()
 def build_cli_reader(
     cli_overlay_file_parser: operators.Operator[types.FilePath, T_co],
     file_arg_prefix: str = constants.CLI_OVERLAY_FILE_PREFIX,
@@ -46,39 +64,161 @@ def build_cli_reader(
     )
 
 
+@caching.memoize_pipeline()
 def build_fileprocessor(
     interpolation: Optional[interpolators.InterpolatorSpec] = constants.ENVIRONMENT,
     parsing: Union[types.Infer, parsers.ParsingSpec[T]] = constants.INFER_FROM_PATH,
     section: Optional[selectors.SectionSelectionSpec[T, U]] = None,
     file_encoding: str = constants.SYS_DEFAULT_FILE_ENCODING,
+    parse_cache_dir: Optional[types.FilePath] = None,
+    streaming: bool = False,
+    interpolate_values: bool = False,
+    lazy: bool = False,
 ) -> Union[
     operators.Operator[types.FilePath, T], operators.Operator[types.FilePath, U]
 ]:
+    path_factory = validators.FunctionValidator(pathlib.Path)
+    value_interpolator = build_value_interpolator(  # lazy configs interpolate on access
+        interpolation, interpolate_values or lazy
+    )
+    if value_interpolator is not None:
+        interpolation = None  # the raw text is parsed as it is
+    key_path = _as_key_path(section)
+    if streaming:
+        _check_streamable(interpolation, parsing, file_encoding)
+        parser = parsers.JsonParser(key_path or (), lazy, streaming=True)
+    elif isinstance(parsing, types.Infer):  # selects after parsing if can't push down
+        parser = build_runtime_inferred_parser(path_factory, key_path or (), lazy)
+    else:
+        parser = build_parser(parsing)
+        parser = parser.as_lazy() if lazy else parser
+        if key_path and (sectioned := parser.with_section(key_path)) is not None:
+            parser = sectioned
+    if key_path and parser.section == key_path:
+        section = None  # pushed down into the parser
+    if parse_cache_dir is not None:
+        parser = parse_cache.CachedParser(
+            parser, parse_cache.ParseCache(parse_cache_dir)
+        )
+    read_mode: filereader.ReadModeSpec = parser.input_kind  # asked per file
+    if streaming:
+        read_mode = constants.MMAP
+    elif interpolation is not None or not _is_utf8(file_encoding):
+        read_mode = constants.TEXT  # parsers decode bytes as utf-8 themselves
     return composers.compose_file_processor(
-        path_validator=(path_factory := validators.FunctionValidator(pathlib.Path)),
-        file_reader=filereader.FileReader(encoding=file_encoding),
+        path_validator=path_factory,
+        file_reader=filereader.FileReader(encoding=file_encoding, mode=read_mode),
         interpolator=(
             build_interpolator(interpolation) if interpolation is not None else None
         ),
-        parser=(
-            build_runtime_inferred_parser(path_factory)
-            if isinstance(parsing, types.Infer)
-            else build_parser(parsing)
-        ),
+        parser=parser,
         section_selector=(
             build_config_section_selector(section) if section is not None else None
         ),
+        value_interpolator=value_interpolator,
     )
 
 
+def build_value_interpolator(
+    interpolation: Optional[interpolators.InterpolatorSpec],
+    interpolate_values: bool,
+) -> Optional[interpolators.ValueInterpolator]:
+    """The interpolator of the parsed values, if they're interpolated at all."""
+    if interpolate_values and interpolation is not None:
+        return interpolators.ValueInterpolator.from_spec(interpolation)
+    return None
+
+
+def _check_streamable(
+    interpolation: Optional[interpolators.InterpolatorSpec],
+    parsing: Union[types.Infer, parsers.ParsingSpec],
+    file_encoding: str,
+) -> None:
+    """Streaming parses JSON files from a memory map, key path sections are pushed
+    down so the rest of the document is never materialized.
+    """
+    if interpolation is not None:
+        raise ValueError(
+            "Streaming parses the raw files, pass interpolation=None"
+            " or interpolate_values=True"
+        )
+    if not _is_utf8(file_encoding):
+        raise ValueError(f"Streaming requires utf-8 files, got {file_encoding=}")
+    if not isinstance(parsing, types.Infer) and not (
+        isinstance(parsing, str)
+        and parsers.FileFormatParserRegistry.lookup(f".{parsing.lstrip('.')}")
+        is parsers.JsonParser
+    ):
+        raise ValueError(f"Streaming only supports JSON files, got {parsing=}")
+
+
+def _is_utf8(encoding: str) -> bool:
+    return codecs.lookup(encoding).name in ("utf-8", "ascii")
+
+
+def _as_key_path(
+    section: Optional[selectors.SectionSelectionSpec],
+) -> Optional[Tuple[str, ...]]:
+    """The key path of a section spec, `None` if it's not a key path."""
+    if isinstance(section, str):
+        return (section,)
+    if isinstance(section, Sequence) and all(isinstance(k, str) for k in section):
+        return tuple(section)
+    return None
+
+
+@caching.memoize_pipeline()
 def build_config_merger(
     aggregation: aggregators.AggregationSpec[T_contra, U],
     validation: Optional[validators.ValidationSpec[U, V]] = None,
+    lazy: bool = False,
 ) -> Union[
     operators.Operator[Iterable[T_contra], U],
-    operators.Pipeline[Iterable[T_contra], V],
+    operators.Operator[Iterable[T_contra], V],
 ]:
+    if lazy:
+        return composers.compose_config_merger(
+            aggregators.LazyAggregator.from_spec(aggregation),
+            build_lazy_validator(validation) if validation is not None else None,
+        )
     return composers.compose_config_merger(
         build_aggregator(aggregation),
         build_validator(validation) if validation is not None else None,
     )
+
+
+def build_lazy_validator(
+    validation: validators.ValidationSpec[T_contra, U],
+) -> validators.TypeValidator[T_contra, Union[U, Mapping]]:
+    """Validates the fields of a lazy config on first access if the validation
+    type annotates them, else validates the whole lazy mapping at once.
+    """
+    if field_types := validators.LazyValidator.field_types(validation):
+        return validators.LazyValidator(field_types)
+    return build_validator(validation)
+
+
+def build_file_mapper(
+    file_processor: operators.Operator[types.FilePath, T],
+    executor: Optional[concurrent.futures.Executor] = None,
+) -> operators.Operator[Iterable[types.FilePath], Iterator[T]]:
+    if executor is None:
+        return operators.MapIterable(file_processor)
+    return operators.ConcurrentMapIterable(file_processor, executor)
+
+
+@contextlib.contextmanager
+def open_executor(
+    spec: ExecutorSpec,
+) -> Iterator[Optional[concurrent.futures.Executor]]:
+    """Yields the executor for a spec, pools created here are shut down on exit."""
+    if spec is None or isinstance(spec, concurrent.futures.Executor):
+        yield spec  # caller-supplied executors are left running
+    elif spec == constants.THREAD:
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            yield executor
+    elif spec == constants.PROCESS:
+        with concurrent.futures.ProcessPoolExecutor() as executor:
+            yield executor
+    else:
+        raise ValueError(f"Invalid executor: {spec}")
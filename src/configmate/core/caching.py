@@ -0,0 +1,271 @@
+""" Caches that keep resolved config state alive between calls
+"""
+
+import asyncio
+import collections
+import functools
+import inspect
+import threading
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    Hashable,
+    Iterable,
+    Mapping,
+    NoReturn,
+    Optional,
+    OrderedDict,
+    Tuple,
+    TypeVar,
+)
+
+from configmate.base import constants, registry, types
+from configmate.components import filereader, interpolators
+
+T = TypeVar("T")
+BuilderT = TypeVar("BuilderT", bound=Callable[..., Any])
+
+
+class LayerCache(Generic[T]):
+    """Caches the file and CLI layers of a config, so they are resolved only once.
+
+    The layers are keyed by the identity (path, mtime, size) of every config file
+    and by the CLI arguments. By default the key is taken once, at the first
+    resolution; with `check_staleness` it is recomputed on every lookup and the
+    layers are resolved again whenever it changed.
+
+    Layers resolved to a `LeafIndex` are kept as such, and their placeholders are
+    resolved by `value_interpolator` on every lookup, so they follow changes of
+    the substitutions (e.g. the environment) without re-parsing.
+
+    The cached trees are frozen (see `freeze`), so the configs merged from them
+    can't alter what later lookups return.
+    """
+
+    def __init__(
+        self,
+        config_files: Iterable[types.FilePath],
+        cli_args: types.CliArgs,
+        check_staleness: bool = False,
+        value_interpolator: Optional[interpolators.ValueInterpolator] = None,
+    ) -> None:
+        self._config_files = tuple(config_files)
+        self._value_interpolator = value_interpolator
+        self._cli_args = cli_args
+        self._check_staleness = check_staleness
+        self._lock = threading.Lock()
+        self._key: Optional[Hashable] = None
+        self._layers: Optional[Tuple[T, ...]] = None
+        self._pending: Optional[Tuple[Hashable, asyncio.Future]] = None
+
+    def get(self, resolve: Callable[[], Iterable[T]]) -> Tuple[T, ...]:
+        """Returns the cached layers, calling `resolve` if they are missing or stale."""
+        with self._lock:
+            if self._layers is None or self._check_staleness:
+                key = self.current_key()  # taken before resolving, no edit is missed
+                if self._layers is None or key != self._key:
+                    self._layers, self._key = _freeze_layers(resolve()), key
+            layers = self._layers
+        return self._resolve_leaves(layers)
+
+    async def aget(
+        self, resolve: Callable[[], Awaitable[Iterable[T]]]
+    ) -> Tuple[T, ...]:
+        """Async counterpart of `get`, the layers are resolved by awaiting `resolve`.
+
+        Concurrent callers on the same event loop await a single resolution.
+        """
+        if (layers := self._layers) is not None and not self._check_staleness:
+            return self._resolve_leaves(layers)
+        key = self.current_key()
+        if (layers := self._layers) is not None and key == self._key:
+            return self._resolve_leaves(layers)
+        with self._lock:  # the lock can't be held across awaits, the task is shared
+            pending = self._pending
+            if (
+                pending is None
+                or pending[0] != key
+                or pending[1].get_loop() is not asyncio.get_running_loop()
+            ):
+                pending = self._pending = key, asyncio.ensure_future(resolve())
+        try:
+            layers = _freeze_layers(await asyncio.shield(pending[1]))
+        except BaseException:
+            with self._lock:  # failures are not cached, the next caller retries
+                if self._pending is pending and pending[1].done():
+                    self._pending = None
+            raise
+        with self._lock:
+            if self._pending is pending:
+                self._layers, self._key, self._pending = layers, key, None
+        return self._resolve_leaves(layers)
+
+    def invalidate(self) -> None:
+        """Drops the cached layers, the next lookup resolves them again."""
+        with self._lock:
+            self._layers = self._key = self._pending = None
+
+    def _resolve_leaves(self, layers: Tuple[Any, ...]) -> Tuple[T, ...]:
+        if (interpolator := self._value_interpolator) is None:
+            return layers
+        return tuple(
+            (
+                interpolator.resolve(layer)
+                if isinstance(layer, interpolators.LeafIndex)
+                else layer
+            )
+            for layer in layers
+        )
+
+    def current_key(self) -> Hashable:
+        """Computes the key of the layers as they would be resolved right now."""
+        return (
+            tuple(map(filereader.file_identity, self._config_files)),
+            tuple(self._cli_args),
+        )
+
+
+class FrozenDict(dict):
+    """A read-only dict, its copies (`dict(...)`, `copy`, pickling) are plain dicts."""
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(f"{type(self).__name__} is read-only, copy it with dict()")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self) -> Tuple[type, Tuple[dict]]:
+        return dict, (dict(self),)
+
+
+class FrozenList(list):
+    """A read-only list, its copies (`list(...)`, `copy`, pickling) are plain lists."""
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(f"{type(self).__name__} is read-only, copy it with list()")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __reduce__(self) -> Tuple[type, Tuple[list]]:
+        return list, (list(self),)
+
+
+def freeze(tree: T) -> T:
+    """Copies the dicts and lists of a parsed tree into read-only ones, once, so
+    they can be handed out on every call without copying them again.
+    """
+    if isinstance(tree, dict) and not isinstance(tree, FrozenDict):
+        return FrozenDict((k, freeze(v)) for k, v in tree.items())  # type: ignore
+    if isinstance(tree, list) and not isinstance(tree, FrozenList):
+        return FrozenList(map(freeze, tree))  # type: ignore
+    return tree
+
+
+def _freeze_layers(layers: Iterable[Any]) -> Tuple[Any, ...]:
+    frozen = []
+    for layer in layers:
+        if isinstance(layer, interpolators.LeafIndex):  # resolved by copying paths
+            layer.tree = freeze(layer.tree)
+        else:
+            layer = freeze(layer)
+        frozen.append(layer)
+    return tuple(frozen)
+
+
+class PipelineCache:
+    """A thread-safe LRU cache of built pipelines."""
+
+    def __init__(self, maxsize: int = constants.PIPELINE_CACHE_SIZE) -> None:
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, Any] = collections.OrderedDict()
+
+    def get_or_build(self, key: Hashable, build: Callable[[], T]) -> T:
+        """Returns the pipeline stored under `key`, building it if missing."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        pipeline = build()  # built outside the lock, builders may be slow
+        with self._lock:
+            pipeline = self._entries.setdefault(key, pipeline)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return pipeline
+
+    def clear(self) -> None:
+        """Drops all cached pipelines."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+PIPELINE_CACHE = PipelineCache()
+
+
+def memoize_pipeline(
+    cache: PipelineCache = PIPELINE_CACHE,
+) -> Callable[[BuilderT], BuilderT]:
+    """Decorator that memoizes a pipeline builder on its normalized arguments.
+
+    Calls with arguments that can't be normalized into a hashable key bypass the
+    cache and build a fresh pipeline. Registering a strategy in any registry
+    invalidates the pipelines built before, since they may have picked another one.
+    """
+
+    def decorator(builder: BuilderT) -> BuilderT:
+        signature = inspect.signature(builder)
+
+        @functools.wraps(builder)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            (arguments := signature.bind(*args, **kwargs)).apply_defaults()
+            try:
+                arguments_key = arguments.args, tuple(arguments.kwargs.items())
+                key = (
+                    builder.__qualname__,
+                    registry.generation(),
+                    normalize_spec(arguments_key),
+                )
+            except TypeError:
+                return builder(*args, **kwargs)
+            return cache.get_or_build(key, functools.partial(builder, *args, **kwargs))
+
+        return wrapper  # type: ignore
+
+    return decorator
+
+
+def normalize_spec(spec: Any) -> Hashable:
+    """Turns a spec into a hashable key or raises `TypeError`.
+
+    Mappings are keyed by identity since the pipeline steps read them lazily
+    (e.g. `os.environ`), sequences are keyed by their normalized items.
+    """
+    if isinstance(spec, (str, bytes)):
+        return type(spec), spec
+    if isinstance(spec, Mapping):
+        return _IdentityKey(spec)
+    if isinstance(spec, (list, tuple)):
+        return type(spec), tuple(map(normalize_spec, spec))
+    return type(spec), spec, hash(spec)
+
+
+class _IdentityKey:
+    """Hashes and compares an object by identity, keeping it alive meanwhile."""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any) -> None:
+        self.obj = obj
+
+    def __hash__(self) -> int:
+        return id(self.obj)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _IdentityKey) and other.obj is self.obj
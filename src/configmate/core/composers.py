@@ -18,11 +18,17 @@ def compose_cli_processor(
     kwarg_selector: operators.Operator[types.CliArgs, Iterable[Tuple[str, str]]],
     kwarg_parser: operators.Operator[Tuple[str, str], T_co],
 ) -> operators.Operator[types.CliArgs, Iterator[T_co]]:
-    return section_reader.pipe_to(
-        operators.ChainOutputs(  # itertools.chain over the outputs of the following:
-            operators.JoinOutputs(  # join: parsed files, then parsed args
-                filepath_selector.pipe_to(operators.MapIterable(file_parser)),
-                kwarg_selector.pipe_to(operators.MapIterable(kwarg_parser)),
+    return operators.compile_pipeline(
+        section_reader.pipe_to(
+            operators.ChainOutputs(  # itertools.chain over the outputs of the following:
+                operators.JoinOutputs(  # join: parsed files, then parsed args
+                    operators.compile_pipeline(
+                        filepath_selector.pipe_to(operators.MapIterable(file_parser))
+                    ),
+                    operators.compile_pipeline(
+                        kwarg_selector.pipe_to(operators.MapIterable(kwarg_parser))
+                    ),
+                )
             )
         )
     )
@@ -30,18 +36,20 @@ def compose_cli_processor(
 
 def compose_file_processor(
     path_validator: operators.Operator[types.FilePath, pathlib.Path],
-    file_reader: operators.Operator[pathlib.Path, str],
+    file_reader: operators.Operator[pathlib.Path, types.FileContent],
     interpolator: Optional[operators.Operator[str, str]],
-    parser: operators.Operator[str, T],
+    parser: operators.Operator[types.FileContent, T],
     section_selector: Optional[operators.Operator[T, U]],
+    value_interpolator: Optional[operators.Operator[U, U]] = None,
 ) -> Union[
     operators.Operator[types.FilePath, T], operators.Operator[types.FilePath, U]
 ]:
-    return (
-        path_validator.pipe_to(file_reader)  # reads in the file as a string
+    return operators.compile_pipeline(
+        path_validator.pipe_to(file_reader)  # reads the file as text, bytes or mmap
         .pipe_to(interpolator)  # OPTIONAL: interpolate the string file
         .pipe_to(parser)  # parse the file into an object
         .pipe_to(section_selector)  # OPTIONAL: select the section from the config
+        .pipe_to(value_interpolator)  # OPTIONAL: interpolate the parsed values
     )
 
 
@@ -50,6 +58,7 @@ def compose_config_merger(
     validator: Optional[operators.Operator[U_contra, V]],
 ) -> Union[
     operators.Operator[Iterable[T_contra], U_contra],
-    operators.Pipeline[Iterable[T_contra], V],
+    operators.Operator[Iterable[T_contra], V],
 ]:
-    return aggregator.pipe_to(validator)  # validator may be none
+    # validator may be none, then the aggregator is returned as is
+    return operators.compile_pipeline(aggregator.pipe_to(validator))
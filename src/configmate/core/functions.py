@@ -4,9 +4,9 @@
 
 import functools
 import itertools
-from typing import Any, Callable, Optional, TypeVar, Union, overload
+from typing import Any, Callable, Iterable, Optional, TypeVar, Union, overload
 
-from configmate.base import constants, operators, types
+from configmate.base import constants, operators, tracing, types
 from configmate.components import (
     aggregators,
     interpolators,
@@ -14,7 +14,7 @@ from configmate.components import (
     selectors,
     validators,
 )
-from configmate.core import builders
+from configmate.core import builders, caching
 
 T = TypeVar("T")
 U = TypeVar("U")
@@ -27,6 +27,9 @@ def get_config(  # if no validation is specified, we get the output of the aggre
     interpolation: Optional[interpolators.InterpolatorSpec] = constants.ENVIRONMENT,
     parsing: Union[types.Infer, parsers.ParsingSpec[U]] = constants.INFER_FROM_PATH,
     section: Optional[selectors.SectionSelectionSpec] = None,
+    streaming: bool = False,
+    interpolate_values: bool = False,
+    lazy: bool = False,
     aggregation: Optional[str] = None,
     validation: None = None,
     ## CLI overlay options
@@ -40,6 +43,12 @@ def get_config(  # if no validation is specified, we get the output of the aggre
     ] = constants.CLI_OVERLAY_KWARG_VAL_PARSER,
     ## encoding
     file_encoding: str = constants.SYS_DEFAULT_FILE_ENCODING,
+    ## caching
+    parse_cache_dir: Optional[types.FilePath] = None,
+    ## concurrency
+    executor: builders.ExecutorSpec = None,
+    ## observability
+    tracer: Optional[tracing.Tracer] = None,
 ) -> U: ...
 @overload  # if no validation is specified, we get the output of the aggregation
 def get_config(
@@ -48,6 +57,9 @@ def get_config(
     interpolation: Optional[interpolators.InterpolatorSpec] = constants.ENVIRONMENT,
     parsing: Union[types.Infer, parsers.ParsingSpec] = constants.INFER_FROM_PATH,
     section: Optional[selectors.SectionSelectionSpec] = None,
+    streaming: bool = False,
+    interpolate_values: bool = False,
+    lazy: bool = False,
     aggregation: aggregators.AggregationSpec[T, U] = ...,
     validation: None = None,
     ## CLI overlay options
@@ -61,6 +73,12 @@ def get_config(
     ] = constants.CLI_OVERLAY_KWARG_VAL_PARSER,
     ## encoding
     file_encoding: str = constants.SYS_DEFAULT_FILE_ENCODING,
+    ## caching
+    parse_cache_dir: Optional[types.FilePath] = None,
+    ## concurrency
+    executor: builders.ExecutorSpec = None,
+    ## observability
+    tracer: Optional[tracing.Tracer] = None,
 ) -> U: ...
 @overload  # the validation determines the return type
 def get_config(
@@ -69,6 +87,9 @@ def get_config(
     interpolation: Optional[interpolators.InterpolatorSpec] = constants.ENVIRONMENT,
     parsing: Union[types.Infer, parsers.ParsingSpec] = constants.INFER_FROM_PATH,
     section: Optional[selectors.SectionSelectionSpec] = None,
+    streaming: bool = False,
+    interpolate_values: bool = False,
+    lazy: bool = False,
     aggregation: aggregators.AggregationSpec = constants.OVERLAY,
     validation: validators.ValidationSpec[T, U] = ...,
     ## CLI overlay options
@@ -82,6 +103,12 @@ def get_config(
     ] = constants.CLI_OVERLAY_KWARG_VAL_PARSER,
     ## encoding
     file_encoding: str = constants.SYS_DEFAULT_FILE_ENCODING,
+    ## caching
+    parse_cache_dir: Optional[types.FilePath] = None,
+    ## concurrency
+    executor: builders.ExecutorSpec = None,
+    ## observability
+    tracer: Optional[tracing.Tracer] = None,
 ) -> U: ...
 def get_config(  # pylint: disable=too-many-arguments,too-many-locals
     *config_files: types.FilePath,
@@ -89,6 +116,9 @@ def get_config(  # pylint: disable=too-many-arguments,too-many-locals
     interpolation: Optional[interpolators.InterpolatorSpec] = constants.ENVIRONMENT,
     parsing: Union[types.Infer, parsers.ParsingSpec] = constants.INFER_FROM_PATH,
     section: Optional[selectors.SectionSelectionSpec] = None,
+    streaming: bool = False,
+    interpolate_values: bool = False,
+    lazy: bool = False,
     aggregation: aggregators.AggregationSpec = constants.OVERLAY,
     validation: Optional[validators.ValidationSpec] = None,
     ## CLI overlay options
@@ -102,6 +132,12 @@ def get_config(  # pylint: disable=too-many-arguments,too-many-locals
     ] = constants.CLI_OVERLAY_KWARG_VAL_PARSER,
     ## encoding
     file_encoding: str = constants.SYS_DEFAULT_FILE_ENCODING,
+    ## caching
+    parse_cache_dir: Optional[types.FilePath] = None,
+    ## concurrency
+    executor: builders.ExecutorSpec = None,
+    ## observability
+    tracer: Optional[tracing.Tracer] = None,
 ):
     """Get the config from the given files and CLI arguments.
 
@@ -115,6 +151,20 @@ def get_config(  # pylint: disable=too-many-arguments,too-many-locals
         The parsing strategy to use.
     section
         The section selection strategy to use.
+    streaming
+        Parses the files as JSON from a memory map without interpolation, for
+        very large files. A key path `section` is then parsed on its own, the
+        rest of the document is skipped without being materialized.
+    interpolate_values
+        Interpolates the string values of the parsed config instead of the raw
+        text, so substituted values can't break the quoting of the file format.
+    lazy
+        Returns a read-only mapping whose JSON subtrees are parsed, interpolated
+        and memoized when they are first accessed. The files are overlaid key by
+        key as keys are accessed, with "overlay" or "deep" aggregation. Values
+        are always interpolated rather than the raw text. If the validation type
+        annotates its fields, each key is validated by its annotation on first
+        access and a mapping of the validated values is returned.
     aggregation
         The aggregation strategy to use.
     validation
@@ -133,13 +183,27 @@ def get_config(  # pylint: disable=too-many-arguments,too-many-locals
         The parser of CLI overlay keyword arguments.
     file_encoding
         The encoding of the files.
+    parse_cache_dir
+        Directory of a persistent cache of parsed files, keyed by their content.
+        Unchanged files are then loaded from it instead of being parsed again.
+    executor
+        Reads, interpolates and parses the files in parallel when given: either
+        "thread", "process" or a `concurrent.futures.Executor`. The files are
+        still aggregated in the order they were given.
+    tracer
+        Records the wall time, input and output sizes and errors of every step
+        into a trace tree, see `configmate.base.tracing.Tracer`.
     """
 
     file_processing_pipeline = builders.build_fileprocessor(
         interpolation=interpolation,
         parsing=parsing,
         section=section,
+        streaming=streaming,
+        interpolate_values=interpolate_values,
+        lazy=lazy,
         file_encoding=file_encoding,
+        parse_cache_dir=parse_cache_dir,
     )
     cli_reader = builders.build_cli_reader(
         section_name=cli_section_name,
@@ -153,13 +217,18 @@ def get_config(  # pylint: disable=too-many-arguments,too-many-locals
     config_merger = builders.build_config_merger(
         aggregation=aggregation,
         validation=validation,
+        lazy=lazy,
     )
-    return config_merger(
-        itertools.chain(
-            operators.MapIterable(file_processing_pipeline)(config_files),
-            cli_reader(constants.CLI_ARGS),  # pylint: disable=not-callable
+    ctx = operators.Context(tracer)
+    with tracing.root_span(ctx, "get_config"), builders.open_executor(executor) as pool:
+        file_mapper = builders.build_file_mapper(file_processing_pipeline, pool)
+        return config_merger(
+            itertools.chain(
+                file_mapper(config_files, ctx),
+                cli_reader(constants.CLI_ARGS, ctx),  # pylint: disable=not-callable
+            ),
+            ctx,
         )
-    )
 
 
 def configure(  # pylint: disable=too-many-arguments,too-many-locals
@@ -168,6 +237,8 @@ def configure(  # pylint: disable=too-many-arguments,too-many-locals
     interpolation: Optional[interpolators.InterpolatorSpec] = constants.ENVIRONMENT,
     parsing: Union[types.Infer, parsers.ParsingSpec] = constants.INFER_FROM_PATH,
     section: Optional[selectors.SectionSelectionSpec] = None,
+    streaming: bool = False,
+    interpolate_values: bool = False,
     aggregation: aggregators.AggregationSpec = constants.OVERLAY,
     validation: Optional[validators.ValidationSpec] = None,
     ## CLI overlay options
@@ -181,13 +252,33 @@ def configure(  # pylint: disable=too-many-arguments,too-many-locals
     ] = constants.CLI_OVERLAY_KWARG_VAL_PARSER,
     ## encoding
     file_encoding: str = constants.SYS_DEFAULT_FILE_ENCODING,
+    ## caching
+    parse_cache_dir: Optional[types.FilePath] = None,
+    check_staleness: bool = False,
+    ## concurrency
+    executor: builders.ExecutorSpec = None,
+    ## observability
+    tracer: Optional[tracing.Tracer] = None,
 ) -> Callable[[Callable[..., U]], Callable[..., U]]:
-    """Decorator to configure a function with the given config."""
+    """Decorator to configure a function with the given config.
+
+    The file and CLI layers are resolved on the first call and cached, only the
+    call arguments are merged on top of them on every call. The nested dicts and
+    lists the function gets are read-only (copy them with `dict()` or `list()`),
+    so the function can't change what later calls get. Pass
+    `check_staleness=True` to re-resolve the layers whenever a config file or the
+    CLI arguments changed, or call `invalidate_config()` on the decorated function
+    to drop the cached layers explicitly. See `get_config` for `executor` and
+    `tracer`.
+    """
     file_processing_pipeline = builders.build_fileprocessor(
         interpolation=interpolation,
         parsing=parsing,
         section=section,
+        streaming=streaming,
+        interpolate_values=interpolate_values,
         file_encoding=file_encoding,
+        parse_cache_dir=parse_cache_dir,
     )
     cli_reader = builders.build_cli_reader(
         section_name=cli_section_name,
@@ -198,24 +289,53 @@ def configure(  # pylint: disable=too-many-arguments,too-many-locals
         kwarg_key_prefix=cli_overlay_arg_key_prefix,
         kwarg_value_parser=cli_overlay_arg_parser,
     )
+    value_interpolator = builders.build_value_interpolator(
+        interpolation, interpolate_values
+    )
+    file_parser = builders.build_fileprocessor(  # values are interpolated per call
+        interpolation=None if value_interpolator is not None else interpolation,
+        parsing=parsing,
+        section=section,
+        streaming=streaming,
+        file_encoding=file_encoding,
+        parse_cache_dir=parse_cache_dir,
+    )
     config_merger = builders.build_config_merger(
         aggregation=aggregation,
         validation=validation,
     )
 
+    def resolve_layers(ctx: operators.Context) -> Iterable[Any]:
+        with builders.open_executor(executor) as pool:
+            file_mapper = builders.build_file_mapper(file_parser, pool)
+            file_layers = file_mapper(config_files, ctx)
+            if value_interpolator is not None:
+                file_layers = map(value_interpolator.index, file_layers)
+            return tuple(
+                itertools.chain(
+                    file_layers,
+                    cli_reader(constants.CLI_ARGS, ctx),  # pylint: disable=not-callable
+                )
+            )
+
     def decorator(func: Callable[..., U]) -> Callable[..., U]:
+        layer_cache: caching.LayerCache[Any] = caching.LayerCache(
+            config_files,
+            constants.CLI_ARGS,
+            check_staleness=check_staleness,
+            value_interpolator=value_interpolator,
+        )
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> U:
             kwargs.update(dict(zip(func.__code__.co_varnames, args)))
-            new_kwargs = config_merger(
-                itertools.chain(
-                    operators.MapIterable(file_processing_pipeline)(config_files),
-                    cli_reader(constants.CLI_ARGS),  # pylint: disable=not-callable
-                    (kwargs,),
-                )
-            )
+            ctx = operators.Context(tracer)
+            with tracing.root_span(ctx, "configure"):
+                layers = layer_cache.get(functools.partial(resolve_layers, ctx))
+                new_kwargs = config_merger(itertools.chain(layers, (kwargs,)), ctx)
             return func(**new_kwargs)
 
+        wrapper.invalidate_config = layer_cache.invalidate  # type: ignore
         return wrapper
 
     return decorator
@@ -0,0 +1,357 @@
+""" Live configs that follow changes of their source files
+"""
+
+import abc
+import ctypes
+import ctypes.util
+import itertools
+import os
+import select
+import struct
+import sys
+import threading
+import warnings
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Set,
+    TypeVar,
+    Union,
+)
+
+from configmate.base import constants, operators, tracing, types
+from configmate.components import (
+    aggregators,
+    filereader,
+    interpolators,
+    parsers,
+    selectors,
+    validators,
+)
+from configmate.core import builders
+
+T = TypeVar("T")
+
+WatchSpec = Literal["auto", "inotify", "poll"]
+Subscriber = Callable[[T], None]
+
+
+###
+# Watchers for the source files
+###
+class Watcher(abc.ABC):
+    """Detects which of the watched files changed their identity."""
+
+    def __init__(self, paths: Iterable[types.FilePath]) -> None:
+        self._identities = {path: filereader.file_identity(path) for path in paths}
+
+    @abc.abstractmethod
+    def poll(self, timeout: float) -> Set[types.FilePath]:
+        """Waits up to `timeout` seconds and returns the files that changed."""
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """Releases the watcher and wakes up a pending `poll`."""
+
+    def _changed_files(self) -> Set[types.FilePath]:
+        changed = set()
+        for path, identity in self._identities.items():
+            if (new_identity := filereader.file_identity(path)) != identity:
+                self._identities[path] = new_identity
+                changed.add(path)
+        return changed
+
+
+class PollingWatcher(Watcher):
+    """Compares the (path, mtime, size) identity of the files on every poll."""
+
+    def __init__(self, paths: Iterable[types.FilePath]) -> None:
+        super().__init__(paths)
+        self._closed = threading.Event()
+
+    def poll(self, timeout: float) -> Set[types.FilePath]:
+        self._closed.wait(timeout)
+        return self._changed_files()
+
+    def close(self) -> None:
+        self._closed.set()
+
+
+class InotifyWatcher(Watcher):
+    """Waits for inotify events on the parent directories of the files.
+
+    Directories are watched instead of the files, so atomic replacements (e.g.
+    editors or mounted secrets swapping symlinks) are picked up as well.
+    """
+
+    IN_MODIFY, IN_CLOSE_WRITE, IN_MOVED_TO, IN_CREATE, IN_DELETE = (
+        0x002,
+        0x008,
+        0x080,
+        0x100,
+        0x200,
+    )
+    WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    READ_SIZE = 64 * 1024
+
+    def __init__(self, paths: Iterable[types.FilePath]) -> None:
+        super().__init__(paths)
+        self._fd = self._wakeup_r = self._wakeup_w = -1
+        self._closed = False
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on linux")
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        if (fd := libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)) < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._fd = fd
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        directories = {os.path.dirname(os.path.abspath(p)) for p in self._identities}
+        for directory in directories:
+            if libc.inotify_add_watch(fd, os.fsencode(directory), self.WATCH_MASK) < 0:
+                self._release()
+                raise OSError(ctypes.get_errno(), f"can't watch {directory}")
+
+    def poll(self, timeout: float) -> Set[types.FilePath]:
+        if self._closed:
+            self._release()
+            return set()
+        readable, _, _ = select.select([self._fd, self._wakeup_r], [], [], timeout)
+        if self._wakeup_r in readable or self._fd not in readable:
+            return set()
+        try:
+            while os.read(self._fd, self.READ_SIZE):  # drain, events only wake us
+                pass
+        except BlockingIOError:
+            pass
+        return self._changed_files()
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            os.write(self._wakeup_w, b"\0")  # fds are released by the polling side
+
+    def __del__(self) -> None:
+        self._release()
+
+    def _release(self) -> None:
+        for fd in (self._fd, self._wakeup_r, self._wakeup_w):
+            if fd >= 0:
+                os.close(fd)
+        self._fd = self._wakeup_r = self._wakeup_w = -1
+
+
+def create_watcher(paths: Iterable[types.FilePath], watch: WatchSpec) -> Watcher:
+    """Creates the watcher for a spec, "auto" falls back to polling without inotify."""
+    if watch == "poll":
+        return PollingWatcher(paths)
+    if watch == "inotify":
+        return InotifyWatcher(paths)
+    if watch == "auto":
+        try:
+            return InotifyWatcher(paths := list(paths))
+        except (OSError, AttributeError):  # AttributeError: libc without inotify
+            return PollingWatcher(paths)
+    raise ValueError(f"Invalid watch spec: {watch}")
+
+
+###
+# Live config
+###
+class LiveConfig(Generic[T]):  # pylint: disable=too-many-instance-attributes
+    """A config that is kept up to date with its source files.
+
+    Takes the same specs as `get_config`. Every file is processed once upfront;
+    when a file changes only that file is read and parsed again, after which the
+    aggregation and validation re-run over the cached layers. The new config is
+    published atomically to `config` and then passed to all subscribers. Reload
+    errors keep the previous config and are passed to `on_error`.
+
+    Changes are detected by `watch` ("inotify" on linux, "poll" for mtime polling,
+    "auto" for the first available) every `poll_interval` seconds, and are only
+    applied once no further change arrived for `debounce` seconds. A `tracer`
+    records every processing and merge as a root span.
+
+    With `interpolate_values`, the placeholders of the parsed files are kept
+    indexed and resolved on every merge; call `reinterpolate` to publish a config
+    resolved against the current substitutions without re-reading the files.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-locals
+        self,
+        *config_files: types.FilePath,
+        ## file reading
+        interpolation: Optional[interpolators.InterpolatorSpec] = constants.ENVIRONMENT,
+        parsing: Union[types.Infer, parsers.ParsingSpec] = constants.INFER_FROM_PATH,
+        section: Optional[selectors.SectionSelectionSpec] = None,
+        streaming: bool = False,
+        interpolate_values: bool = False,
+        aggregation: aggregators.AggregationSpec = constants.OVERLAY,
+        validation: Optional[validators.ValidationSpec] = None,
+        ## CLI overlay options
+        cli_section_name: Optional[str] = None,
+        cli_section_end: Optional[str] = constants.CLI_SECTION_END_TOKEN,
+        cli_overlay_file_prefix: str = constants.CLI_OVERLAY_FILE_PREFIX,
+        cli_overlay_arg_key_prefix: str = constants.CLI_OVERLAY_KWARG_KEY_PREFIX,
+        cli_overlay_arg_key_delimiter: str = constants.CLI_OVERLAY_KWARG_KEY_DELIMITER,
+        cli_overlay_arg_parser: Callable[
+            [str], Any
+        ] = constants.CLI_OVERLAY_KWARG_VAL_PARSER,
+        ## encoding
+        file_encoding: str = constants.SYS_DEFAULT_FILE_ENCODING,
+        ## caching
+        parse_cache_dir: Optional[types.FilePath] = None,
+        ## watching
+        watch: WatchSpec = "auto",
+        poll_interval: float = 1.0,
+        debounce: float = 0.1,
+        on_error: Callable[[Exception], None] = lambda exc: warnings.warn(
+            f"Config reload failed: {exc!r}"
+        ),
+        ## observability
+        tracer: Optional[tracing.Tracer] = None,
+    ) -> None:
+        cli_reader = builders.build_cli_reader(
+            section_name=cli_section_name,
+            section_end=cli_section_end,
+            file_arg_prefix=cli_overlay_file_prefix,
+            cli_overlay_file_parser=builders.build_fileprocessor(
+                interpolation=interpolation,
+                parsing=parsing,
+                section=section,
+                streaming=streaming,
+                interpolate_values=interpolate_values,
+                file_encoding=file_encoding,
+                parse_cache_dir=parse_cache_dir,
+            ),
+            kwarg_key_delimiter=cli_overlay_arg_key_delimiter,
+            kwarg_key_prefix=cli_overlay_arg_key_prefix,
+            kwarg_value_parser=cli_overlay_arg_parser,
+        )
+        self._value_interpolator = builders.build_value_interpolator(
+            interpolation, interpolate_values
+        )
+        if self._value_interpolator is not None:
+            interpolation = None  # the parsed values are resolved on every merge
+        self._file_processor = builders.build_fileprocessor(
+            interpolation=interpolation,
+            parsing=parsing,
+            section=section,
+            streaming=streaming,
+            file_encoding=file_encoding,
+            parse_cache_dir=parse_cache_dir,
+        )
+        self._config_merger = builders.build_config_merger(
+            aggregation=aggregation,
+            validation=validation,
+        )
+        self._config_files: Sequence[types.FilePath] = config_files
+        self._watcher = create_watcher(config_files, watch)
+        self._poll_interval = poll_interval
+        self._debounce = debounce
+        self._on_error = on_error
+        self._tracer = tracer
+        self._subscribers: List[Subscriber[T]] = []
+        self._reload_lock = threading.RLock()  # subscribers may reload
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        ctx = operators.Context(tracer)
+        with tracing.root_span(ctx, "LiveConfig"):
+            self._file_layers: Dict[int, Any] = {
+                i: self._process(path, ctx) for i, path in enumerate(config_files)
+            }
+            self._cli_layers = list(cli_reader(constants.CLI_ARGS, ctx.get_child()))
+            self._config: T = self._merge(ctx)
+
+    @property
+    def config(self) -> T:
+        """The latest published config."""
+        return self._config
+
+    def subscribe(self, subscriber: Subscriber[T]) -> Callable[[], None]:
+        """Calls `subscriber` with every new config, returns an unsubscribe function."""
+        self._subscribers.append(subscriber)
+        return lambda: self._subscribers.remove(subscriber)
+
+    def start(self) -> "LiveConfig[T]":
+        """Starts watching the files on a daemon thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._watch, name="configmate-live-config", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops watching the files, the last config stays available."""
+        self._stopped.set()
+        self._watcher.close()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def reload(self, changed_files: Iterable[types.FilePath]) -> T:
+        """Re-processes the given files, then re-aggregates and publishes the config."""
+        changed_files = set(changed_files)
+        ctx = operators.Context(self._tracer)
+        with self._reload_lock:  # published in order of the reloads
+            with tracing.root_span(ctx, "LiveConfig.reload"):
+                for i, path in enumerate(self._config_files):
+                    if path in changed_files:
+                        self._file_layers[i] = self._process(path, ctx)
+                self._config = config = self._merge(ctx)
+            return self._publish(config)
+
+    def reinterpolate(self) -> T:
+        """Resolves the placeholders of the parsed files again, e.g. after the
+        environment changed, then re-aggregates and publishes the config.
+        """
+        ctx = operators.Context(self._tracer)
+        with self._reload_lock:
+            with tracing.root_span(ctx, "LiveConfig.reinterpolate"):
+                self._config = config = self._merge(ctx)
+            return self._publish(config)
+
+    def __enter__(self) -> "LiveConfig[T]":
+        return self.start()
+
+    def __exit__(self, *_: Any) -> None:
+        self.stop()
+
+    def _process(self, path: types.FilePath, ctx: operators.Context) -> Any:
+        layer = self._file_processor(path, ctx.get_child())
+        if self._value_interpolator is not None:
+            return self._value_interpolator.index(layer)
+        return layer
+
+    def _publish(self, config: T) -> T:
+        for subscriber in list(self._subscribers):
+            subscriber(config)
+        return config
+
+    def _merge(self, ctx: operators.Context) -> T:
+        layers = (self._file_layers[i] for i in range(len(self._config_files)))
+        if (interpolator := self._value_interpolator) is not None:
+            layers = (interpolator.resolve(layer) for layer in layers)
+        return self._config_merger(
+            itertools.chain(layers, self._cli_layers), ctx.get_child()
+        )
+
+    def _watch(self) -> None:
+        while not self._stopped.is_set():
+            if not (changed := self._watcher.poll(self._poll_interval)):
+                continue
+            while more := self._watcher.poll(self._debounce):  # wait for quiet
+                changed |= more
+            if self._stopped.is_set():
+                break
+            try:
+                self.reload(changed)
+            except Exception as exc:  # pylint: disable=broad-except
+                self._on_error(exc)
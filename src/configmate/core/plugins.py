@@ -0,0 +1,76 @@
+""" Discovery of the plugins in the configmate_plugins namespace package
+
+Plugins ship a small `configmate_plugin.json` manifest next to their code:
+
+.. code-block:: json
+
+    {
+        "module": "configmate_plugins.yaml_parser.yaml_parser",
+        "file_extensions": [".yml", ".yaml"],
+        "strategy_registries": []
+    }
+
+Discovery only reads the manifests. The plugin module is imported the first time
+one of its file extensions is looked up in `FileFormatParserRegistry`, or right
+before one of the named strategy registries (e.g. "TypeValidatorFactory") is
+first used. Plugins without a manifest are imported eagerly.
+
+Set the `CONFIGMATE_PLUGINS` environment variable to "eager" to import all
+plugins upfront, or to "off" to skip them (e.g. to measure the import time).
+"""
+
+import importlib
+import json
+import os
+import pkgutil
+from typing import Any, Dict, Iterator, Type
+
+from configmate.base import constants, registry
+from configmate.components import (
+    aggregators,
+    interpolators,
+    parsers,
+    selectors,
+    validators,
+)
+
+STRATEGY_REGISTRIES: Dict[str, Type[registry.StrategyRegistryMixin]] = {
+    "AggregatorFactory": aggregators.AggregatorFactory,
+    "InterpolatorFactory": interpolators.InterpolatorFactory,
+    "ParserFactory": parsers.ParserFactory,
+    "SectionSelectorFactory": selectors.SectionSelectorFactory,
+    "TypeValidatorFactory": validators.TypeValidatorFactory,
+}
+
+
+def register_plugins(mode: str = "lazy") -> None:
+    """Registers all plugins found in the configmate_plugins namespace."""
+    if mode == "off":
+        return
+    for name, manifest in _discover_plugins():
+        if manifest is None or mode == "eager":
+            importlib.import_module(manifest["module"] if manifest else name)
+            continue
+        for extension in manifest.get("file_extensions", ()):
+            parsers.FileFormatParserRegistry.register_lazy(
+                extension, manifest["module"]
+            )
+        for registry_name in manifest.get("strategy_registries", ()):
+            STRATEGY_REGISTRIES[registry_name].register_lazy(manifest["module"])
+
+
+def _discover_plugins() -> Iterator[Any]:
+    try:
+        import configmate_plugins  # type: ignore # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return  # no plugins
+    for plugin in pkgutil.iter_modules(configmate_plugins.__path__):
+        name = f"{configmate_plugins.__name__}.{plugin.name}"
+        directory = getattr(plugin.module_finder, "path", None)
+        try:
+            path = os.path.join(directory, plugin.name, constants.PLUGIN_MANIFEST_FILE)
+            with open(path, encoding="utf-8") as manifest_file:
+                manifest = json.load(manifest_file)
+        except (TypeError, OSError):  # no manifest (e.g. zipped or older plugins)
+            manifest = None
+        yield name, manifest
@@ -53,5 +53,67 @@ def test_aggregator_factory_build_inferred_aggregator_for_any_spec():
     assert isinstance(aggregator, aggregators.InferredAggregator)
 
 
+def test_deep_merge_aggregator_merges_nested_mappings() -> None:
+    base = {"db": {"host": "localhost", "port": 1}, "log": {"level": "info"}}
+    override = {"db": {"port": 2}, "new": 1}
+    merged = aggregators.DeepMergeAggregator()([base, override])
+    assert merged == {
+        "db": {"host": "localhost", "port": 2},
+        "log": {"level": "info"},
+        "new": 1,
+    }
+    assert merged["log"] is base["log"]  # untouched subtrees are shared
+
+
+@pytest.mark.parametrize(
+    "strategy,expected",
+    [
+        ("replace", [{"name": "b", "port": 3}]),
+        (
+            "append",
+            [
+                {"name": "a", "port": 1},
+                {"name": "b", "port": 2},
+                {"name": "b", "port": 3},
+            ],
+        ),
+        (
+            aggregators.MergeByKey("name"),
+            [{"name": "a", "port": 1}, {"name": "b", "port": 3}],
+        ),
+    ],
+)
+def test_deep_merge_aggregator_list_strategies(
+    strategy: aggregators.ListStrategy, expected: list
+) -> None:
+    base = {"svc": {"servers": [{"name": "a", "port": 1}, {"name": "b", "port": 2}]}}
+    override = {"svc": {"servers": [{"name": "b", "port": 3}]}}
+    aggregator = aggregators.AggregatorFactory.build_aggregator(
+        aggregators.DeepMerge(list_strategies={"svc.servers": strategy})
+    )
+    assert aggregator([base, override]) == {"svc": {"servers": expected}}
+
+
+def test_merge_by_key_replaces_lists_with_unhashable_keys() -> None:
+    base = {"servers": [{"name": ["a"], "port": 1}]}
+    override = {"servers": [{"name": ["a"], "port": 2}]}
+    aggregator = aggregators.DeepMergeAggregator(
+        {"servers": aggregators.MergeByKey("name")}
+    )
+    assert aggregator([base, override]) == override
+
+
+def test_deep_merge_spec_is_hashable() -> None:
+    spec = aggregators.DeepMerge({"a.b": "append", "c": aggregators.MergeByKey("n")})
+    assert hash(spec) == hash(
+        aggregators.DeepMerge((("a.b", "append"), ("c", aggregators.MergeByKey("n"))))
+    )
+
+
+def test_aggregator_factory_build_deep_merge_aggregator():
+    aggregator = aggregators.AggregatorFactory.build_aggregator("deep")
+    assert isinstance(aggregator, aggregators.DeepMergeAggregator)
+
+
 if __name__ == "__main__":
     pytest.main()
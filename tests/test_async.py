@@ -0,0 +1,91 @@
+import asyncio
+import concurrent.futures
+import os
+import pathlib
+from typing import Any, Dict, Iterator, List
+from unittest import mock
+
+import pytest
+
+from configmate import aconfigure, aget_config, get_config
+from configmate.core import caching
+
+TEST_FILE_FOLDER = "./tests/test_files/"
+FILES = [
+    os.path.join(TEST_FILE_FOLDER, "test.json"),
+    os.path.join(TEST_FILE_FOLDER, "test_override.json"),
+]
+
+
+@pytest.fixture(name="executor", params=[None, "thread", "process", "pool"])
+def fixture_executor(request: pytest.FixtureRequest) -> Iterator[Any]:
+    if request.param != "pool":
+        yield request.param
+        return
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+def test_aget_config_matches_get_config(executor: Any) -> None:
+    with mock.patch.dict(os.environ, {"BAN": "1"}, clear=True):
+        config = asyncio.run(aget_config(*FILES, validation=dict, executor=executor))
+        assert config == get_config(*FILES, validation=dict) == {"foo": "bar", "hax": 1}
+
+
+def test_aconfigure() -> None:
+    @aconfigure(*FILES)
+    async def func(foo: str, hax: Any) -> Dict[str, Any]:
+        return {"foo": foo, "hax": hax}
+
+    with mock.patch.dict(os.environ, {}, clear=True):
+        assert asyncio.run(func()) == {"foo": "bar", "hax": 2}
+        assert asyncio.run(func(hax=3)) == {"foo": "bar", "hax": 3}
+
+
+def test_aconfigure_calls_get_read_only_layers(tmp_path: pathlib.Path) -> None:
+    (config_file := tmp_path / "config.json").write_text('{"db": {"host": "h"}}')
+
+    @aconfigure(str(config_file), interpolation=None)
+    async def func(db: Dict[str, str]) -> Dict[str, str]:
+        with pytest.raises(TypeError):
+            db["host"] = "mutated"
+        return dict(db)
+
+    assert asyncio.run(func()) == asyncio.run(func()) == {"host": "h"}
+
+
+def test_layer_cache_resolves_once_for_concurrent_callers() -> None:
+    calls: List[int] = []
+
+    async def resolve() -> List[Dict[str, int]]:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return [{"a": 1}]
+
+    async def get_all() -> List[Any]:
+        layer_cache: caching.LayerCache[Any] = caching.LayerCache([], [])
+        return await asyncio.gather(*(layer_cache.aget(resolve) for _ in range(5)))
+
+    assert asyncio.run(get_all()) == [({"a": 1},)] * 5
+    assert len(calls) == 1
+
+
+def test_layer_cache_does_not_cache_failures() -> None:
+    outcomes = [ValueError("first"), [{"a": 1}]]
+
+    async def resolve() -> Any:
+        if isinstance(outcome := outcomes.pop(0), Exception):
+            raise outcome
+        return outcome
+
+    async def get_twice() -> Any:
+        layer_cache: caching.LayerCache[Any] = caching.LayerCache([], [])
+        with pytest.raises(ValueError):
+            await layer_cache.aget(resolve)
+        return await layer_cache.aget(resolve)
+
+    assert asyncio.run(get_twice()) == ({"a": 1},)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,101 @@
+import json
+import pathlib
+from typing import Any, Dict
+
+import pytest
+
+from configmate import configure
+from configmate.base import registry
+from configmate.core import builders, caching
+
+
+def write_config(path: pathlib.Path, config: Dict[str, Any]) -> None:
+    path.write_text(json.dumps(config), encoding="utf-8")
+
+
+@pytest.fixture(name="config_file")
+def fixture_config_file(tmp_path: pathlib.Path) -> pathlib.Path:
+    write_config(config_file := tmp_path / "config.json", {"a": 1, "b": 2})
+    return config_file
+
+
+def test_configure_resolves_layers_once(config_file: pathlib.Path) -> None:
+    @configure(str(config_file), interpolation=None)
+    def func(a: int, b: int) -> Dict[str, int]:
+        return {"a": a, "b": b}
+
+    assert func() == {"a": 1, "b": 2}
+    write_config(config_file, {"a": 10, "b": 20})
+    assert func(b=3) == {"a": 1, "b": 3}  # cached file layer, call kwargs on top
+    func.invalidate_config()  # type: ignore
+    assert func() == {"a": 10, "b": 20}
+
+
+def test_configure_calls_get_read_only_layers(config_file: pathlib.Path) -> None:
+    write_config(config_file, {"db": {"host": "localhost", "ports": [1]}})
+
+    @configure(str(config_file), interpolation=None)
+    def func(db: Dict[str, Any]) -> Dict[str, Any]:
+        with pytest.raises(TypeError):
+            db["host"] = "mutated"
+        with pytest.raises(TypeError):
+            db["ports"].append(2)
+        (copied := dict(db))["host"] = "copied"
+        return copied
+
+    assert func() == func() == {"host": "copied", "ports": [1]}
+
+
+def test_configure_check_staleness(config_file: pathlib.Path) -> None:
+    @configure(str(config_file), interpolation=None, check_staleness=True)
+    def func(a: int, b: int) -> Dict[str, int]:
+        return {"a": a, "b": b}
+
+    assert func() == {"a": 1, "b": 2}
+    write_config(config_file, {"a": 100, "b": 2})  # size changes with the content
+    assert func() == {"a": 100, "b": 2}
+
+
+def test_builders_reuse_pipelines_for_equal_specs() -> None:
+    pipeline = builders.build_fileprocessor(section=["a", "b"])
+    assert builders.build_fileprocessor(section=["a", "b"]) is pipeline
+    assert builders.build_fileprocessor(section=["a", "c"]) is not pipeline
+
+
+def test_registering_a_strategy_invalidates_pipelines() -> None:
+    @caching.memoize_pipeline(caching.PipelineCache())
+    def build(spec: Any) -> object:
+        return object()
+
+    class Registry(registry.DictRegistryMixin[str, int]):
+        pass
+
+    pipeline = build(1)
+    assert build(1) is pipeline
+    Registry.register("key", 1)
+    assert build(1) is not pipeline
+
+
+def test_memoize_pipeline_evicts_least_recently_used() -> None:
+    @caching.memoize_pipeline(cache := caching.PipelineCache(maxsize=2))
+    def build(spec: Any) -> object:
+        return object()
+
+    first, second = build(1), build(2)
+    assert build(1) is first  # refreshes 1, so 2 is evicted next
+    build(3)
+    assert len(cache) == 2
+    assert build(1) is first and build(2) is not second
+
+
+def test_memoize_pipeline_bypasses_unhashable_specs() -> None:
+    @caching.memoize_pipeline(cache := caching.PipelineCache())
+    def build(spec: Any) -> object:
+        return object()
+
+    assert build([{1}]) is not build([{1}])
+    assert len(cache) == 0
+
+
+if __name__ == "__main__":
+    pytest.main()
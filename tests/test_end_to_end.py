@@ -1,5 +1,6 @@
+import concurrent.futures
 import os
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 from unittest import mock
 
 import pytest
@@ -54,5 +55,24 @@ def test_end_to_end(files: List[str], env: Dict[str, str], target: Any) -> None:
         assert config == target, f"Expected {target}, got {config}"
 
 
+@pytest.fixture(name="executor", params=["thread", "process", "pool"])
+def fixture_executor(request: pytest.FixtureRequest) -> Iterator[Any]:
+    if request.param != "pool":
+        yield request.param
+        return
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        yield executor  # caller-supplied executors are left running by get_config
+
+
+def test_end_to_end_with_executor(executor: Any) -> None:
+    files = [
+        os.path.join(TEST_FILE_FOLDER, BASE_FILE),
+        os.path.join(TEST_FILE_FOLDER, OVERRIDE_FILE),  # must still override JSON
+    ]
+    with mock.patch.dict(os.environ, {"BAN": "1"}, clear=True):
+        config = get_config(*files, validation=dict, executor=executor)
+        assert config == {"foo": "bar", "hax": 1}
+
+
 if __name__ == "__main__":
     pytest.main()
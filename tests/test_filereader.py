@@ -0,0 +1,75 @@
+import json
+import mmap
+import pathlib
+from typing import Any, Dict
+from unittest import mock
+
+import pytest
+
+from configmate import get_config
+from configmate.base import constants
+from configmate.components import filereader, parsers
+from configmate.core import builders
+
+CONFIG = {"section": {"key": "välue", "list": [1, 2.5, None]}}
+
+
+@pytest.fixture(name="json_file")
+def fixture_json_file(tmp_path: pathlib.Path) -> pathlib.Path:
+    (path := tmp_path / "config.json").write_text(json.dumps(CONFIG), encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize(
+    "mode, content_type",
+    [(constants.TEXT, str), (constants.BYTES, bytes), (constants.MMAP, mmap.mmap)],
+)
+def test_read_modes(json_file: pathlib.Path, mode: Any, content_type: type) -> None:
+    content = filereader.FileReader(mode=mode)(json_file)
+    assert isinstance(content, content_type)
+    assert parsers.JsonParser()(content) == CONFIG
+    assert parsers.JsonParser(["section"])(content) == CONFIG["section"]
+
+
+def test_mode_resolved_per_file(tmp_path: pathlib.Path) -> None:
+    reader = filereader.FileReader(mode=lambda path: constants.BYTES)
+    (path := tmp_path / "empty.ini").write_text("")
+    assert reader(path) == b""
+    assert filereader.FileReader(mode=constants.MMAP)(path) == b""  # can't be mapped
+
+
+@pytest.mark.parametrize(
+    "path, kind",
+    [("a.json", constants.BYTES), ("a.xml", constants.MMAP), ("a.ini", constants.TEXT)],
+)
+def test_inferred_input_kind(path: str, kind: str) -> None:
+    parser = parsers.ParserFactory.infer_from(parsers.FunctionParser(str))
+    assert parser.input_kind(path) == kind
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"interpolation": None},
+        {"interpolation": None, "section": "section"},
+        {"interpolation": None, "streaming": True},
+        {"interpolation": None, "parsing": "json"},
+        {},
+    ],
+)
+def test_get_config_read_modes(json_file: pathlib.Path, kwargs: Dict) -> None:
+    expected = CONFIG["section"] if "section" in kwargs else CONFIG
+    with mock.patch("sys.argv", ["test.py"]):
+        assert get_config(json_file, **kwargs) == expected
+
+
+def test_interpolation_reads_text(json_file: pathlib.Path) -> None:
+    processor = builders.build_fileprocessor(parsing="json")
+    with mock.patch.object(
+        filereader.pathlib.Path, "read_bytes", side_effect=AssertionError
+    ):
+        assert processor(json_file) == CONFIG
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -72,3 +72,61 @@ def test_warning_raised(
     """Verifies that a warning is raised under specific conditions."""
     with mock.patch.dict(os.environ, env, clear=True), pytest.warns(Warning):
         functions.get_config(file, interpolation=missing_handling_str)
+
+
+@pytest.mark.parametrize(
+    "text, env",
+    [
+        ("no variables here", {}),
+        ("${A}", {"A": "a"}),
+        ("x${A}y${B:b}z${A}", {"A": "a"}),
+        ("${A:default} and ${B}", {"B": ""}),
+        ("$A ${ unclosed ${A", {"A": "a"}),
+    ],
+)
+def test_template_matches_regex_substitution(text: str, env: Dict[str, str]) -> None:
+    """Rendering a compiled template gives the same text as substituting directly."""
+
+    def replacer(match: Any) -> str:
+        if (value := env.get(match["variable"])) is not None:
+            return value
+        return match["default_value"] or match[0]
+
+    expected = interpolators.constants.BASH_VAR_PATTERN.sub(replacer, text)
+    template = interpolators.Template(text, interpolators.constants.BASH_VAR_PATTERN)
+    assert template.render(env)[0] == expected
+
+
+def test_template_reports_missing_variables() -> None:
+    """Missing variables are reported and left as they were in the text."""
+    template = interpolators.Template(
+        "${A}-${B:b}-${C}", interpolators.constants.BASH_VAR_PATTERN
+    )
+    assert template.render({}) == ("${A}-b-${C}", {"A", "C"})
+
+
+def test_templates_are_compiled_once_per_content() -> None:
+    """Re-rendering the same text with a new environment doesn't rescan it."""
+    text = '{"a": "${A}"}'
+    interpolators.TEMPLATE_CACHE.clear()
+    with mock.patch.object(
+        interpolators, "Template", wraps=interpolators.Template
+    ) as compile_:
+        for value in ("1", "2"):
+            interpolator = interpolators.VariableInterpolator.from_sub_mapping(
+                {"A": value}
+            )
+            assert interpolator(text) == f'{{"a": "{value}"}}'
+    assert compile_.call_count == 1
+
+
+def test_text_without_variables_is_not_compiled() -> None:
+    """Texts without the `${` marker are returned as they are."""
+    interpolators.TEMPLATE_CACHE.clear()
+    interpolator = interpolators.VariableInterpolator.from_sub_mapping({})
+    assert interpolator('{"a": 1}') == '{"a": 1}'
+    assert len(interpolators.TEMPLATE_CACHE) == 0
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,95 @@
+import json
+import os
+from typing import Any, Sequence
+from unittest import mock
+
+import pytest
+
+from configmate import get_config
+from configmate.base import exceptions
+from configmate.components import json_stream
+
+TEST_FILE_FOLDER = "./tests/test_files/"
+DOCUMENT = {
+    "services": {
+        "billing": {"port": 8080, "hosts": ["a", "b"], "tls": True},
+        "search": {"query": 'say "}]"', "nested": [{"x": None}, [1.5e3, -2]]},
+    },
+    "name": "ü€",
+    "": {"empty": {}},
+}
+
+
+@pytest.mark.parametrize(
+    "dump",
+    [
+        json.dumps,
+        lambda doc: json.dumps(doc, indent=4),
+        lambda doc: json.dumps(doc, ensure_ascii=False).encode("utf-8"),
+    ],
+)
+@pytest.mark.parametrize(
+    "section",
+    [
+        (),
+        ("services",),
+        ("services", "billing"),
+        ("services", "search", "nested"),
+        ("name",),
+        ("", "empty"),
+    ],
+)
+def test_load_section(dump: Any, section: Sequence[str]) -> None:
+    expected = DOCUMENT
+    for key in section:
+        expected = expected[key]
+    assert json_stream.load_section(dump(DOCUMENT), section, "utf-8") == expected
+
+
+@pytest.mark.parametrize(
+    "section", [("missing",), ("services", "billing", "port", "x"), ("name", "x")]
+)
+def test_load_missing_section(section: Sequence[str]) -> None:
+    with pytest.raises(exceptions.SectionNotFound):
+        json_stream.load_section(json.dumps(DOCUMENT), section)
+
+
+@pytest.mark.parametrize("text", ['{"a": [1, 2', '{"a" 1}', "", '{"a": "b}'])
+def test_load_invalid(text: str) -> None:
+    with pytest.raises(ValueError):
+        json_stream.load_section(text)
+
+
+@pytest.mark.parametrize(
+    "buffer", ['{"a": 1, "b\\n": {"c": [2]}}', b' {"a":1,"b\\n":{"c":[2]}}']
+)
+def test_iter_members(buffer) -> None:
+    start = json_stream.value_start(buffer)
+    spans = {
+        key: json_stream.load_span(buffer, begin, end)
+        for key, begin, end in json_stream.iter_members(buffer, start)
+    }
+    assert spans == {"a": 1, "b\n": {"c": [2]}}
+
+
+def test_get_config_streaming(tmp_path) -> None:
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps(DOCUMENT), encoding="utf-8")
+    with mock.patch("sys.argv", ["test.py"]):
+        assert get_config(
+            path, section=["services", "billing"], interpolation=None, streaming=True
+        ) == get_config(path, section=["services", "billing"], interpolation=None)
+        assert get_config(
+            os.path.join(TEST_FILE_FOLDER, "test.json"),
+            interpolation=None,
+            streaming=True,
+        ) == {"foo": "bar", "hax": "ban"}
+
+
+def test_streaming_requires_raw_files() -> None:
+    with pytest.raises(ValueError):
+        get_config(os.path.join(TEST_FILE_FOLDER, "test.json"), streaming=True)
+
+
+if __name__ == "__main__":
+    pytest.main()
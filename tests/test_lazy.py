@@ -0,0 +1,174 @@
+import dataclasses
+import json
+import os
+import pathlib
+import pickle
+from typing import Any, Dict, List, Optional, Tuple
+from unittest import mock
+
+import pytest
+
+from configmate.base import constants, exceptions
+from configmate.components import aggregators, filereader, lazy, parsers, selectors
+from configmate.core import functions
+
+DOCUMENT = {"a": {"b": {"c": 1}, "d": [1, 2]}, "e": "x", "f": None}
+
+
+def test_lazy_object_equals_parsed() -> None:
+    """A lazy object compares, iterates and materializes like the parsed one."""
+    config = lazy.LazyJsonObject(json.dumps(DOCUMENT).encode())
+    assert config == DOCUMENT
+    assert list(config) == list(DOCUMENT)
+    assert config.to_dict() == DOCUMENT
+    assert isinstance(config["a"], lazy.LazyMapping)
+    assert "missing" not in config
+
+
+def test_values_are_decoded_on_access() -> None:
+    """Only the accessed values are decoded, once."""
+    config = lazy.LazyJsonObject(json.dumps(DOCUMENT))
+    with mock.patch.object(
+        lazy.json_stream, "load_span", wraps=lazy.json_stream.load_span
+    ) as load:
+        assert config["a"]["b"]["c"] == 1
+        assert config["a"]["b"]["c"] == 1
+    assert load.call_count == 1
+
+
+def test_object_is_scanned_as_far_as_needed() -> None:
+    """Keys before the end are found without scanning the rest of the object."""
+    config = lazy.LazyJsonObject('{"a": 1, "b": {"c": 2}, "d": [unterminated')
+    assert config["a"] == 1 and "b" in config
+    with pytest.raises(ValueError):
+        list(config)
+
+
+def test_lazy_object_pickles_as_dict() -> None:
+    """Pickled lazy configs are materialized."""
+    config = lazy.LazyJsonObject(json.dumps(DOCUMENT))
+    assert pickle.loads(pickle.dumps(config)) == DOCUMENT
+
+
+@pytest.mark.parametrize(
+    "layers, deep, expected",
+    [
+        ([{"a": 1, "b": {"c": 1}}, {"b": {"d": 2}}], False, {"a": 1, "b": {"d": 2}}),
+        (
+            [{"a": 1, "b": {"c": 1}}, {"b": {"d": 2}}],
+            True,
+            {"a": 1, "b": {"c": 1, "d": 2}},
+        ),
+        ([{"a": {"b": 1}}, {"a": 2}, {"a": {"c": 3}}], True, {"a": {"c": 3}}),
+        ([{"a": [1]}, {"a": [2]}], True, {"a": [2]}),
+    ],
+)
+def test_overlay_matches_eager_aggregation(
+    layers: List[Dict[str, Any]], deep: bool, expected: Dict[str, Any]
+) -> None:
+    """Key by key overlays match the eager aggregators."""
+    eager = (
+        aggregators.DeepMergeAggregator() if deep else aggregators.InferredAggregator()
+    )
+    overlay = lazy.LazyOverlay(
+        [lazy.LazyJsonObject(json.dumps(layer)) for layer in layers], deep
+    )
+    assert overlay == eager(layers) == expected
+
+
+def test_key_selector_on_lazy_config() -> None:
+    """Lazy configs satisfy the mapping protocol the selectors rely on."""
+    config = lazy.LazyJsonObject(json.dumps(DOCUMENT))
+    assert selectors.KeySelector(["a", "b"])(config) == {"c": 1}
+    with pytest.raises(exceptions.SectionNotFound):
+        selectors.KeySelector(["a", "missing"])(config)
+
+
+def test_get_config_lazy(tmp_path: pathlib.Path) -> None:
+    """Lazy configs are interpolated and overlaid as they are accessed."""
+    (base := tmp_path / "base.json").write_text(json.dumps({"a": {"b": "${B}"}}))
+    (top := tmp_path / "top.json").write_text(json.dumps({"a": {"c": 1}, "d": 2}))
+    with mock.patch.dict(os.environ, {"B": "b"}, clear=True):
+        config = functions.get_config(
+            base, top, aggregation="deep", interpolate_values=True, lazy=True
+        )
+        assert isinstance(config, lazy.LazyOverlay)
+        assert config == {"a": {"b": "b", "c": 1}, "d": 2}
+        section = functions.get_config(base, section="a", lazy=True)
+        assert section == {"b": "b"}
+
+
+def test_lazy_interpolates_values_by_default(tmp_path: pathlib.Path) -> None:
+    """Lazy configs interpolate the values they materialize, not the raw text."""
+    (path := tmp_path / "config.json").write_text('{"a": "${A}", "b": "x\\"y"}')
+    with mock.patch.dict(os.environ, {"A": 'quoted "value"'}, clear=True):
+        config = functions.get_config(path, lazy=True)
+        assert config == {"a": 'quoted "value"', "b": 'x"y'}
+
+
+def test_lazy_validation_is_per_key(tmp_path: pathlib.Path) -> None:
+    """Annotated fields are validated when they are first accessed."""
+
+    validated: List[Any] = []
+
+    class Port(int):
+        def __new__(cls, value: Any) -> "Port":
+            validated.append(value)
+            return super().__new__(cls, value)
+
+    class Spec:  # pylint: disable=too-few-public-methods
+        port: Port
+        name: str
+
+    document = {"port": "8080", "name": "x", "other": {"y": 1}}
+    (path := tmp_path / "config.json").write_text(json.dumps(document))
+    config = functions.get_config(path, lazy=True, validation=Spec)
+    assert isinstance(config, lazy.LazyValidated)
+    assert config["name"] == "x" and config["other"] == {"y": 1}
+    assert not validated
+    assert config["port"] == 8080 and validated == ["8080"]
+
+
+def test_lazy_validation_passes_typing_annotations_through(
+    tmp_path: pathlib.Path,
+) -> None:
+    """Typing annotations can't be called, only plain classes are validated."""
+
+    @dataclasses.dataclass
+    class Spec:
+        port: int
+        timeout: Optional[int]
+        hosts: List[str]
+
+    document = {"port": "80", "timeout": None, "hosts": ["a", "b"]}
+    (path := tmp_path / "config.json").write_text(json.dumps(document))
+    config = functions.get_config(path, lazy=True, validation=Spec)
+    assert config == {"port": 80, "timeout": None, "hosts": ["a", "b"]}
+
+
+@pytest.mark.parametrize("section", [(), ("a",)])
+def test_lazy_objects_outlive_rewritten_files(
+    tmp_path: pathlib.Path, section: Tuple[str, ...]
+) -> None:
+    """Lazy objects never keep a view of the memory map of their file."""
+    (path := tmp_path / "config.json").write_text(json.dumps(DOCUMENT))
+    assert parsers.JsonParser(lazy=True).input_kind(path) != constants.MMAP
+    parser = parsers.JsonParser(section, lazy=True, streaming=True)
+    config = parser(filereader.read_mmap(path))
+    assert isinstance(config._buffer, bytes)  # pylint: disable=protected-access
+    path.write_text("{}")  # truncated in place
+    expected: Any = DOCUMENT
+    for key in section:
+        expected = expected[key]
+    assert config == expected
+
+
+def test_lazy_rejects_eager_aggregation(tmp_path: pathlib.Path) -> None:
+    """Only overlays can be resolved key by key."""
+    (path := tmp_path / "config.json").write_text("{}")
+    with pytest.raises(ValueError):
+        functions.get_config(path, path, aggregation=dict, lazy=True)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,96 @@
+import json
+import os
+import pathlib
+import sys
+import threading
+from typing import Any, Dict, List
+from unittest import mock
+
+import pytest
+
+from configmate import LiveConfig
+
+
+def write_config(path: pathlib.Path, config: Dict[str, Any]) -> None:
+    path.write_text(json.dumps(config), encoding="utf-8")
+
+
+@pytest.mark.parametrize(
+    "watch",
+    [
+        "poll",
+        pytest.param(
+            "inotify",
+            marks=pytest.mark.skipif(
+                not sys.platform.startswith("linux"), reason="inotify is linux only"
+            ),
+        ),
+    ],
+)
+def test_live_config_follows_file_changes(tmp_path: pathlib.Path, watch: str) -> None:
+    write_config(base := tmp_path / "base.json", {"a": 1, "b": 1})
+    write_config(override := tmp_path / "override.json", {"b": 2})
+    published: List[Dict[str, Any]] = []
+    received = threading.Event()
+
+    def subscriber(config: Dict[str, Any]) -> None:
+        published.append(config)
+        received.set()
+
+    live = LiveConfig(
+        str(base),
+        str(override),
+        interpolation=None,
+        watch=watch,  # type: ignore
+        poll_interval=0.01,
+        debounce=0.01,
+    )
+    assert live.config == {"a": 1, "b": 2}
+    live.subscribe(subscriber)
+    with live:
+        write_config(base, {"a": 10, "b": 10})
+        assert received.wait(timeout=5)
+    assert live.config == published[-1] == {"a": 10, "b": 2}  # override still wins
+
+
+def test_live_config_reload(tmp_path: pathlib.Path) -> None:
+    write_config(path := tmp_path / "config.json", {"a": 1})
+    live = LiveConfig(str(path), interpolation=None, watch="poll")
+    write_config(path, {"a": 2})
+    assert live.config == {"a": 1}  # not started, nothing is watched
+    assert live.reload([str(path)]) == live.config == {"a": 2}
+
+
+def test_live_config_publishes_reloads_in_order(tmp_path: pathlib.Path) -> None:
+    write_config(path := tmp_path / "config.json", {"a": 1})
+    live = LiveConfig(str(path), interpolation=None, watch="poll")
+    published: List[Dict[str, Any]] = []
+    overlapping = threading.Thread(target=live.reload, args=([str(path)],))
+
+    def subscriber(config: Dict[str, Any]) -> None:
+        if not published and not overlapping.is_alive():
+            write_config(path, {"a": 3})
+            overlapping.start()  # e.g. the watcher, while this publish is slow
+            overlapping.join(timeout=0.2)
+        published.append(config)
+
+    live.subscribe(subscriber)
+    write_config(path, {"a": 2})
+    live.reload([str(path)])
+    overlapping.join()
+    assert published == [{"a": 2}, {"a": 3}]
+    assert live.config == published[-1]
+
+
+def test_live_config_reinterpolate(tmp_path: pathlib.Path) -> None:
+    write_config(path := tmp_path / "config.json", {"a": "${A}"})
+    with mock.patch.dict(os.environ, {"A": "1"}, clear=True):
+        live = LiveConfig(str(path), interpolate_values=True, watch="poll")
+    assert live.config == {"a": "1"}
+    write_config(path, {"a": "not read again"})
+    with mock.patch.dict(os.environ, {"A": "2"}, clear=True):
+        assert live.reinterpolate() == live.config == {"a": "2"}
+
+
+if __name__ == "__main__":
+    pytest.main()
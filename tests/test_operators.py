@@ -0,0 +1,113 @@
+import gc
+import tracemalloc
+from typing import List, Optional, Tuple
+
+import pytest
+
+from configmate.base import operators, tracing
+
+
+class Add(operators.Operator[int, int]):
+    def __init__(self, value: int) -> None:
+        super().__init__()
+        self.value = value
+
+    def _transform(self, ctx: operators.Context, input_: int) -> int:
+        return input_ + self.value
+
+
+def build(log: List[Tuple[str, int]]) -> operators.Operator[int, int]:
+    def record(name: str) -> operators.Callback[int]:
+        return lambda _, result: log.append((name, result))
+
+    inner = Add(1).append_callback(record("a")).pipe_to(Add(10))
+    inner.append_callback(record("inner"))
+    outer = inner.pipe_to(Add(100).append_callback(record("c")))
+    return outer.append_callback(record("outer"))
+
+
+def test_compiled_pipeline_matches_nested() -> None:
+    nested_log: List[Tuple[str, int]] = []
+    compiled_log: List[Tuple[str, int]] = []
+    nested = build(nested_log)
+    compiled = operators.compile_pipeline(build(compiled_log))
+
+    assert isinstance(compiled, operators.CompiledPipeline)
+    assert compiled(0) == nested(0) == 111
+    assert compiled_log == nested_log
+    assert nested_log == [("a", 1), ("inner", 11), ("c", 111), ("outer", 111)]
+
+
+def test_compiled_pipeline_is_flat() -> None:
+    pipeline = Add(1).pipe_to(Add(2)).pipe_to(Add(3))
+    compiled = operators.compile_pipeline(operators.compile_pipeline(pipeline))
+    assert len(compiled._stages) == 3  # pylint: disable=protected-access
+    assert operators.compile_pipeline(Add(1)).__class__ is Add
+
+
+class Doubled(Add):
+    def __call__(self, input_: int, _ctx: Optional[operators.Context] = None) -> int:
+        return super().__call__(input_ * 2, _ctx)
+
+
+@pytest.mark.parametrize("tracer", [None, tracing.Tracer()])
+def test_compiled_pipeline_respects_call_overrides(tracer) -> None:
+    log: List[Tuple[str, int]] = []
+    step = Doubled(1).append_callback(lambda _, result: log.append(("d", result)))
+    pipeline = Add(1).pipe_to(step).append_callback(lambda _, r: log.append(("p", r)))
+    compiled = operators.compile_pipeline(pipeline)
+    assert compiled(0, operators.Context(tracer)) == pipeline(0) == 3
+    assert log == [("d", 3), ("p", 3)] * 2
+
+
+def test_compiled_pipeline_traced() -> None:
+    log: List[Tuple[str, int]] = []
+    tracer = tracing.Tracer()
+    compiled = operators.compile_pipeline(build(log))
+    assert compiled(0, operators.Context(tracer)) == 111
+    assert log == [("a", 1), ("inner", 11), ("c", 111), ("outer", 111)]
+    (span,) = tracer.spans
+    assert [child.name for child in span.children] == ["Add", "Add", "Add"]
+
+
+def test_context_children_copy_on_access() -> None:
+    key = object()
+    parent = operators.Context()
+    parent[key].value = 1
+    child = parent.get_child()
+    grandchild = child.get_child()
+
+    assert grandchild[key].value == 1  # looked up along the parents
+    grandchild[key].value = 2
+    assert parent[key].value == 1 and child[key].value == 1  # no leaking writes
+    assert grandchild[key].value == 2
+
+
+@pytest.mark.parametrize("tracer", [None, tracing.Tracer()])
+def test_context_retains_children_only_when_tracing(tracer) -> None:
+    parent = operators.Context(tracer)
+    child = parent.get_child()
+    children = parent._children  # pylint: disable=protected-access
+    assert children == ([child] if tracer is not None else None)
+
+
+def test_map_iterable_memory_is_flat() -> None:
+    mapper = operators.MapIterable(Add(1))
+    ctx = operators.Context()  # long-lived, every mapped item gets a child of it
+
+    def allocated_after(calls: int) -> int:
+        for _ in range(calls):
+            list(mapper(range(10), ctx))
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0]
+
+    tracemalloc.start()
+    try:
+        baseline = allocated_after(1_000)
+        assert allocated_after(10_000) - baseline < 64 * 1024
+    finally:
+        tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    pytest.main()
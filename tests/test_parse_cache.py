@@ -0,0 +1,77 @@
+import json
+import os
+import pathlib
+from typing import Any
+
+import pytest
+
+from configmate import get_config
+from configmate.base import operators
+from configmate.components import lazy, parse_cache, parsers
+
+
+class CountingParser(parsers.Parser[Any]):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def _transform(self, ctx: operators.Context, input_: Any) -> Any:
+        self.calls += 1
+        return json.loads(input_)
+
+
+def test_cached_parser_skips_parsing_unchanged_content(tmp_path: pathlib.Path) -> None:
+    parser = parse_cache.CachedParser(
+        counting_parser := CountingParser(), parse_cache.ParseCache(tmp_path)
+    )
+    assert parser('{"a": 1}') == parser('{"a": 1}') == {"a": 1}
+    assert counting_parser.calls == 1
+    assert parser('{"a": 2}') == {"a": 2}
+    assert counting_parser.calls == 2
+
+
+def test_parse_cache_evicts_least_recently_used(tmp_path: pathlib.Path) -> None:
+    cache = parse_cache.ParseCache(tmp_path, max_bytes=300)  # 2 entries
+    for i in range(3):
+        cache.store(str(i), "x" * 100)
+        os.utime(tmp_path / f"{i}.parsed", ns=(i, i))  # deterministic mtimes
+    cache.store("3", "x" * 100)
+    assert [cache.load(str(i))[0] for i in range(4)] == [False, False, True, True]
+
+
+def test_parse_cache_rejects_tampered_entries(tmp_path: pathlib.Path) -> None:
+    cache = parse_cache.ParseCache(tmp_path)
+    cache.store("key", {"a": 1})
+    entry = tmp_path / "key.parsed"
+    entry.write_bytes(entry.read_bytes()[:-1] + b"\0")
+    assert cache.load("key") == (False, None)
+    assert not entry.exists()
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="posix permissions")
+def test_parse_cache_rejects_shared_directories(tmp_path: pathlib.Path) -> None:
+    os.chmod(tmp_path, 0o777)
+    with pytest.raises(PermissionError):
+        parse_cache.ParseCache(tmp_path)
+
+
+def test_get_config_with_parse_cache(tmp_path: pathlib.Path) -> None:
+    config_file = "./tests/test_files/test.json"
+    expected = get_config(config_file)
+    for _ in range(2):  # miss, then hit
+        assert get_config(config_file, parse_cache_dir=tmp_path) == expected
+    assert len(list(tmp_path.glob("*.parsed"))) == 1
+
+
+def test_lazy_configs_bypass_parse_cache(tmp_path: pathlib.Path) -> None:
+    """Lazy configs aren't cached, they stay lazy and don't reuse eager entries."""
+    config_file = "./tests/test_files/test.json"
+    expected = get_config(config_file, parse_cache_dir=tmp_path)
+    for _ in range(2):
+        config = get_config(config_file, parse_cache_dir=tmp_path, lazy=True)
+        assert isinstance(config, lazy.LazyMapping) and config == expected
+    assert len(list(tmp_path.glob("*.parsed"))) == 1
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,259 @@
+import configparser
+import pathlib
+from typing import Any, Optional, Type
+from unittest import mock
+
+import pytest
+
+from configmate.base import constants, exceptions, operators
+from configmate.components import parsers, sniffing, validators
+from configmate.core import functions
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["a.json", "/x/y.tar.gz", ".bashrc", "a.", "dir.d/file", "a.json/", "a..b"],
+)
+def test_file_suffix_matches_pathlib(path: str) -> None:
+    assert parsers.file_suffix(path) == pathlib.PurePath(path).suffix
+
+
+@pytest.fixture(name="file_format_registry")
+def fixture_file_format_registry(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Type[parsers.FileFormatParserRegistry]:
+    """The file format registry, restored after the test."""
+    registry = parsers.FileFormatParserRegistry
+    registered = dict(registry._registry)  # pylint: disable=protected-access
+    monkeypatch.setattr(registry, "_registry", registered)
+    monkeypatch.setattr(registry, "_generation", registry.generation())
+    return registry
+
+
+def test_inferred_parsers_are_reused(
+    file_format_registry: Type[parsers.FileFormatParserRegistry],
+) -> None:
+    """Files with the same extension share one parser, until the registry changes."""
+    path_step = validators.FunctionValidator(pathlib.Path)
+    inferred = parsers.ParserFactory.infer_from(path_step)
+    # pylint: disable=protected-access
+    parser = inferred._infer("a.json")
+    assert inferred._infer("dir/b.json") is parser
+    assert inferred._infer("c.ini") is not parser
+
+    class CustomParser(parsers.Parser[Any]):
+        def _transform(self, ctx: operators.Context, input_: Any) -> Any:
+            return input_
+
+    file_format_registry.add_strategy(CustomParser, ".custom-ext")
+    assert inferred._infer("a.json") is not parser
+    assert isinstance(inferred._infer("a.custom-ext"), CustomParser)
+    # pylint: enable=protected-access
+
+
+@pytest.mark.parametrize(
+    "head, extension",
+    [
+        (b'  {"a": 1}', ".json"),
+        (b"[1, 2]", ".json"),
+        (b"[1]", ".json"),
+        (b"[[1]]\n", ".json"),
+        (b"[1]\nkey = value\n", ".ini"),
+        (b'\xef\xbb\xbf<?xml version="1.0"?><a/>', ".xml"),
+        (b"<config><a>1</a></config>", ".xml"),
+        (b"# comment\n[server]\nhost = localhost\nport: 80\n", ".ini"),
+        (b'[server]\nhost = "localhost"\nport = 80\n', ".toml"),
+        (b"[[servers]]\nname = 'a'\n", ".toml"),
+        (b'title = "x"\n[server]\n', ".toml"),
+        (b"---\na: 1\n", ".yaml"),
+        (b"a:\n  b: 1\n", ".yaml"),
+        (b"- 1\n- 2\n", ".yaml"),
+        (b"just some text", None),
+        (b"", None),
+    ],
+)
+def test_sniff_format(head: bytes, extension: Optional[str]) -> None:
+    assert sniffing.sniff_format(head) == extension
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        ('{"a": 1}', {"a": 1}),
+        ("[section]\nkey = value\n", {"section": {"key": "value"}}),
+        ("<config><a>1</a></config>", {"a": "1"}),
+    ],
+)
+def test_extensionless_files_are_sniffed(
+    tmp_path: pathlib.Path, content: str, expected: Any
+) -> None:
+    (path := tmp_path / "config").write_text(content)
+    assert functions.get_config(path, interpolation=None) == expected
+
+
+def test_sniffed_format_is_cached_per_identity(tmp_path: pathlib.Path) -> None:
+    """Files are sniffed again only when their identity changed."""
+    sniffer = sniffing.FormatSniffer()
+    (path := tmp_path / "config").write_text('{"a": 1}')
+    with mock.patch.object(
+        sniffing, "sniff_format", wraps=sniffing.sniff_format
+    ) as sniff:
+        assert sniffer.sniff(path) == sniffer.sniff(path) == ".json"
+        assert sniff.call_count == 1
+        path.write_text("[section]\nkey = value\n")
+        assert sniffer.sniff(path) == ".ini"
+        assert sniff.call_count == 2
+
+
+def test_unrecognized_content_raises(tmp_path: pathlib.Path) -> None:
+    (path := tmp_path / "config.unknown").write_text("just some text")
+    with pytest.raises(exceptions.NoApplicableStrategy):
+        functions.get_config(path, interpolation=None)
+
+
+XML = """<config version="2">
+    <server port="80">a</server>
+    <server>b</server>
+    <empty/>
+    <mixed>text<child>1</child></mixed>
+    <nested><item><name>x</name></item><item><name>y</name></item></nested>
+</config>"""
+
+
+@pytest.mark.parametrize("iterparse", [False, True], ids=["tree", "iterparse"])
+@pytest.mark.parametrize(
+    "section, expected",
+    [
+        (
+            (),
+            {
+                "@version": "2",
+                "server": [{"@port": "80", "#text": "a"}, "b"],
+                "empty": None,
+                "mixed": {"child": "1", "#text": "text"},
+                "nested": {"item": [{"name": "x"}, {"name": "y"}]},
+            },
+        ),
+        (("server",), [{"@port": "80", "#text": "a"}, "b"]),
+        (("nested", "item", "name"), ["x", "y"]),
+        (("mixed", "child"), "1"),
+    ],
+)
+def test_xml_conversion(
+    monkeypatch: pytest.MonkeyPatch,
+    iterparse: bool,
+    section: Any,
+    expected: Any,
+) -> None:
+    """Repeated tags become lists and attributes are kept, for both conversions."""
+    monkeypatch.setattr(constants, "XML_ITERPARSE_MIN_BYTES", 0 if iterparse else 1e9)
+    assert parsers.XmlParser(section)(XML) == expected
+    assert parsers.XmlParser(section)(XML.encode()) == expected
+
+
+def test_xml_iterparse_clears_converted_elements(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Converted elements are dropped from their parents as the file is parsed."""
+    iterparse, root_sizes = parsers.etree.iterparse, []
+
+    def tracking_iterparse(*args: Any, **kwargs: Any) -> Any:
+        root = None
+        for event, element in iterparse(*args, **kwargs):
+            root = element if root is None else root
+            yield event, element
+            root_sizes.append(len(root))
+
+    monkeypatch.setattr(constants, "XML_ITERPARSE_MIN_BYTES", 0)
+    monkeypatch.setattr(parsers, "_iterparse", tracking_iterparse)
+    items = "".join(f"<item>{i:>20}</item>" for i in range(5000))
+    config = parsers.XmlParser()(f"<c>{items}</c>".encode())
+    assert config == {"item": [f"{i:>20}" for i in range(5000)]}
+    assert max(root_sizes) < 5000
+
+
+INI = """
+# comment
+[DEFAULT]
+shared = yes
+
+[Server]
+Host = localhost
+port: 8080
+ratio = 0.5
+paths =
+    /a
+    ; comment inside the value
+    /b
+shared = no
+
+[empty]
+
+[other]
+not an option line
+"""
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        INI.replace("not an option line", "key = value"),
+        "[a] ; comment\nkey = 1\n[b] x]\nkey = 2",
+        "[a]\nkey =\n    x\n\n    ; comment\n\n    y\n\n\nnext = 1\n",
+        "[a]\nkey = 1\n   [b]\n[c]\n  key = 2\n",
+    ],
+    ids=["example", "header-comments", "blank-lines-in-values", "indented-headers"],
+)
+def test_single_pass_ini_matches_configparser(text: str) -> None:
+    (cnfparser := configparser.ConfigParser(interpolation=None)).read_string(text)
+    expected = {name: dict(cnfparser[name]) for name in cnfparser.sections()}
+    assert parsers.IniParser(interpolation=False)(text) == expected
+
+
+def test_single_pass_ini_skips_unrequested_sections() -> None:
+    """Skipped sections aren't parsed, so their errors don't surface."""
+    parser = parsers.IniParser(interpolation=False, sections=["Server", "empty"])
+    assert list(parser(INI)) == ["Server", "empty"]
+    assert parser.with_section(["Server", "port"])(INI) == "8080"
+    with pytest.raises(configparser.ParsingError):
+        parsers.IniParser(interpolation=False)(INI)
+
+
+@pytest.mark.parametrize("interpolation", [False, True])
+def test_ini_type_coercion(interpolation: bool) -> None:
+    parser = parsers.IniParser(
+        ["Server"], coerce_types=True, interpolation=interpolation
+    )
+    assert parser(INI.replace("not an option line", "")) == {
+        "host": "localhost",
+        "port": 8080,
+        "ratio": 0.5,
+        "paths": ["/a", "/b"],
+        "shared": False,
+    }
+
+
+@pytest.mark.parametrize(
+    "text, exception",
+    [
+        ("key = value", configparser.MissingSectionHeaderError),
+        ("[a]\n[a]", configparser.DuplicateSectionError),
+        ("[a]\nkey = 1\nKEY = 2", configparser.DuplicateOptionError),
+        ("[a]\n= value", configparser.ParsingError),
+        ("[a]\nkey = 1\n= 2\nline", configparser.ParsingError),
+    ],
+)
+def test_single_pass_ini_errors(text: str, exception: type) -> None:
+    with pytest.raises(exception):
+        parsers.IniParser(interpolation=False)(text)
+
+
+def test_parser_instances_as_parsing_spec(tmp_path: pathlib.Path) -> None:
+    """Configured parsers are used as they are, and keep their options."""
+    (path := tmp_path / "config.ini").write_text("[a]\nport = ${PORT:80}\n")
+    parser = parsers.IniParser(coerce_types=True, interpolation=False)
+    assert functions.get_config(path, parsing=parser, section="a") == {"port": 80}
+
+
+if __name__ == "__main__":
+    pytest.main()
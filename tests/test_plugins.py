@@ -0,0 +1,43 @@
+import json
+import pathlib
+import sys
+
+import pytest
+
+from configmate.components import parsers
+from configmate.core import plugins
+
+PLUGIN_MODULE = "configmate_plugins.fake_parser.fake_parser"
+
+
+@pytest.fixture(name="fake_plugin")
+def fixture_fake_plugin(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    (plugin_dir := tmp_path / "configmate_plugins" / "fake_parser").mkdir(parents=True)
+    (plugin_dir / "__init__.py").write_text("")
+    (plugin_dir / "fake_parser.py").write_text(
+        "from configmate.components import parsers\n"
+        "class FakeParser(parsers.JsonParser): ...\n"
+        "parsers.FileFormatParserRegistry.add_strategy(FakeParser, '.fake')\n"
+    )
+    (plugin_dir / "configmate_plugin.json").write_text(
+        json.dumps({"module": PLUGIN_MODULE, "file_extensions": [".fake"]})
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for module in [m for m in sys.modules if m.startswith("configmate_plugins")]:
+        monkeypatch.delitem(sys.modules, module)
+    yield
+    for module in [m for m in sys.modules if m.startswith("configmate_plugins")]:
+        del sys.modules[module]
+
+
+@pytest.mark.usefixtures("fake_plugin")
+def test_plugins_are_imported_on_first_use() -> None:
+    plugins.register_plugins()
+    assert PLUGIN_MODULE not in sys.modules
+    parser = parsers.FileFormatParserRegistry.infer_parser("config.fake")
+    assert PLUGIN_MODULE in sys.modules
+    assert type(parser).__name__ == "FakeParser"
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,69 @@
+from typing import Any, List
+
+import pytest
+
+from configmate.base import exceptions, registry
+
+
+def make_registry() -> Any:
+    class Registry(registry.StrategyRegistryMixin[Any, str]):
+        pass
+
+    return Registry
+
+
+def counting(calls: List[Any], trigger: Any) -> Any:
+    def counted(key: Any) -> bool:
+        calls.append(key)
+        return trigger(key)
+
+    return counted
+
+
+def test_type_based_dispatch_is_memoized_by_type() -> None:
+    calls: List[Any] = []
+    reg = make_registry()
+    reg.register(counting(calls, lambda k: isinstance(k, int)), "int", type_based=True)
+    reg.register(counting(calls, lambda k: True), "any", type_based=True)
+
+    assert reg.get_first_match(1) == "int"
+    assert reg.get_first_match("a") == "any"
+    n_calls = len(calls)
+    assert reg.get_first_match(2) == "int"
+    assert reg.get_first_match("b") == "any"
+    assert len(calls) == n_calls  # dispatched without evaluating any trigger
+
+
+def test_value_dispatch_for_hashable_keys() -> None:
+    calls: List[Any] = []
+    reg = make_registry()
+    reg.register(counting(calls, lambda k: k == "deep"), "deep")
+    reg.register(lambda k: True, "any", type_based=True)
+
+    assert [reg.get_first_match(k) for k in ["deep", "deep", "x"]] == [
+        "deep",
+        "deep",
+        "any",
+    ]
+    assert calls == ["deep", "x"]
+    assert reg.get_first_match(["deep"]) == "any"  # unhashable, not memoized
+
+
+def test_register_invalidates_dispatch() -> None:
+    reg = make_registry()
+    reg.register(lambda k: True, "any", type_based=True)
+    assert reg.get_first_match(1) == "any"
+    reg.register(lambda k: isinstance(k, int), "int", where="first", type_based=True)
+    assert reg.get_first_match(1) == "int"
+    assert reg.describe().splitlines()[0].startswith("int")
+
+
+def test_missing_strategy_raises() -> None:
+    reg = make_registry()
+    reg.register(lambda k: isinstance(k, int), "int", type_based=True)
+    with pytest.raises(exceptions.NoApplicableStrategy):
+        reg.get_first_match("a")
+
+
+if __name__ == "__main__":
+    pytest.main()
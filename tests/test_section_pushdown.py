@@ -0,0 +1,112 @@
+import json
+from typing import Any, Callable, Dict, Sequence
+from unittest import mock
+
+import pytest
+
+from configmate import get_config
+from configmate.base import exceptions
+from configmate.components import parsers
+
+CONFIG = {
+    "services": {"billing": {"port": "8080", "host": "a"}, "search": {"port": "9"}},
+    "name": {"first": "x"},
+}
+INI = """
+[services]
+billing = 1
+[name]
+first = x
+"""
+XML = """<config>
+    <services>
+        <billing><port>8080</port><host>a</host></billing>
+        <search><port>9</port></search>
+    </services>
+    <name><first>x</first></name>
+</config>"""
+
+
+def select(config: Any, section: Sequence[str]) -> Any:
+    for key in section:
+        config = config[key]
+    return config
+
+
+@pytest.mark.parametrize(
+    "parser, text",
+    [
+        (parsers.JsonParser, json.dumps(CONFIG)),
+        (parsers.IniParser, INI),
+        (parsers.XmlParser, XML),
+    ],
+)
+@pytest.mark.parametrize(
+    "section", [("services",), ("services", "billing"), ("name", "first")]
+)
+def test_pushdown_matches_full_parse(
+    parser: Callable[[], parsers.Parser], text: str, section: Sequence[str]
+) -> None:
+    full = parser()(text)
+    try:
+        expected = select(full, section)
+    except (KeyError, TypeError):
+        with pytest.raises(exceptions.SectionNotFound):
+            parser().with_section(section)(text)
+    else:
+        assert parser().with_section(section)(text) == expected
+
+
+@pytest.mark.parametrize(
+    "parser, text",
+    [
+        (parsers.JsonParser, json.dumps(CONFIG)),
+        (parsers.IniParser, INI),
+        (parsers.XmlParser, XML),
+    ],
+)
+def test_pushdown_missing_section(
+    parser: Callable[[], parsers.Parser], text: str
+) -> None:
+    with pytest.raises(exceptions.SectionNotFound):
+        parser().with_section(("missing", "key"))(text)
+
+
+@pytest.mark.parametrize(
+    "text", ['{"a": {"x": 1}, "a": {"x": 2}}', '{"a": {"x": 1}, "b": [1, 2}, "c": tru}']
+)
+def test_json_pushdown_is_strict_unless_streaming(text: str) -> None:
+    try:
+        expected = json.loads(text)["a"]
+    except json.JSONDecodeError:
+        with pytest.raises(json.JSONDecodeError):
+            parsers.JsonParser().with_section(("a",))(text)
+    else:
+        assert parsers.JsonParser().with_section(("a",))(text) == expected
+    assert parsers.JsonParser(("a",), streaming=True)(text) == {"x": 1}  # lenient
+
+
+def test_fallback_selects_after_parsing() -> None:
+    function_parser = parsers.FunctionParser(json.loads)
+    assert function_parser.with_section(("name",)) is None
+    selecting = parsers.SelectingParser(function_parser, ("name", "first"))
+    assert selecting(json.dumps(CONFIG)) == "x"
+
+
+@pytest.mark.parametrize("parsing", [None, ".json", json.loads])
+def test_get_config_section(tmp_path, parsing: Any) -> None:
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps(CONFIG), encoding="utf-8")
+    kwargs: Dict[str, Any] = {} if parsing is None else {"parsing": parsing}
+    with mock.patch("sys.argv", ["test.py"]):
+        assert get_config(path, section=["services", "billing"], **kwargs) == {
+            "port": "8080",
+            "host": "a",
+        }
+        assert get_config(path, section=lambda c: c["name"], **kwargs) == {"first": "x"}
+        with pytest.raises(exceptions.SectionNotFound):
+            get_config(path, section=["services", "missing"], **kwargs)
+
+
+if __name__ == "__main__":
+    pytest.main()
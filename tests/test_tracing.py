@@ -0,0 +1,125 @@
+import asyncio
+import os
+from typing import Any, Dict, Iterator, List
+from unittest import mock
+
+import pytest
+
+from configmate import LiveConfig, aget_config, configure, get_config
+from configmate.base import operators, tracing
+
+TEST_FILE_FOLDER = "./tests/test_files/"
+FILES = [
+    os.path.join(TEST_FILE_FOLDER, "test.json"),
+    os.path.join(TEST_FILE_FOLDER, "test_override.json"),
+]
+
+
+class ListExporter:
+    def __init__(self) -> None:
+        self.exported: List[Dict[str, Any]] = []  # snapshots taken at export
+
+    def export(self, spans):
+        self.exported.extend(span.to_dict() for span in spans)
+
+
+def walk(span: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield span
+    for child in span["children"]:
+        yield from walk(child)
+
+
+def test_get_config_trace_tree() -> None:
+    exporter = ListExporter()
+    tracer = tracing.Tracer(exporter)
+    with mock.patch("sys.argv", ["test.py"]):
+        get_config(*FILES, tracer=tracer)
+
+    # a single tree per call, exported once complete
+    (root,) = exporter.exported
+    assert root == tracer.to_dicts()[0]
+    assert root["name"] == "get_config"
+    file_mapper, cli_reader, merger = root["children"]
+    assert file_mapper["name"] == "MapIterable"
+    assert cli_reader["name"] == "CompiledPipeline"
+    assert merger["name"] == "InferredAggregator"
+    # the lazily processed files nest under the mapper that produced them
+    assert len(file_mapper["children"]) == len(FILES)
+    assert all(c["name"] == "CompiledPipeline" for c in file_mapper["children"])
+    assert any(s["name"] == "FileReader" for s in walk(file_mapper["children"][0]))
+    # timed within the mapper, with the sizes known when exported
+    assert file_mapper["duration_ns"] >= sum(
+        c["duration_ns"] for c in file_mapper["children"]
+    )
+    assert all(s["duration_ns"] >= 0 for s in walk(root))
+    assert merger["output_size"] == 2
+    assert root["error"] is None
+
+
+def test_tracer_is_accepted_everywhere() -> None:
+    with mock.patch("sys.argv", ["test.py"]):
+        tracer = tracing.Tracer()
+        asyncio.run(aget_config(*FILES, tracer=tracer))
+        (root,) = tracer.spans
+        assert root.name == "aget_config" and root.children
+
+        tracer = tracing.Tracer()
+        configured = configure(*FILES, tracer=tracer)(lambda **kwargs: kwargs)
+        configured()
+        configured()
+        first, cached = tracer.spans
+        assert first.name == cached.name == "configure"
+        assert first.children[-1].name == "InferredAggregator"
+        assert len(cached.children) < len(first.children)  # the files aren't read
+
+        tracer = tracing.Tracer()
+        config = LiveConfig(*FILES, watch="poll", tracer=tracer)
+        config.reinterpolate()
+        start, reinterpolation = tracer.spans
+        assert start.name == "LiveConfig"
+        assert len(start.children) == len(FILES) + 2  # files, CLI and the merge
+        assert reinterpolation.name == "LiveConfig.reinterpolate"
+
+
+def test_tracer_keeps_the_last_spans() -> None:
+    exporter = ListExporter()
+    tracer = tracing.Tracer(exporter, max_spans=2)
+    for size in range(5):
+        with tracing.root_span(operators.Context(tracer), f"call {size}"):
+            pass
+    assert len(exporter.exported) == 5
+    assert [span.name for span in tracer.spans] == ["call 3", "call 4"]
+
+
+class Identity(operators.Operator[int, int]):
+    def _transform(self, ctx: operators.Context, input_: int) -> int:
+        return input_
+
+
+class Fail(operators.Operator[int, int]):
+    def _transform(self, ctx: operators.Context, input_: int) -> int:
+        raise ValueError("boom")
+
+
+def test_trace_records_errors() -> None:
+    exporter = ListExporter()
+    tracer = tracing.Tracer(exporter)
+    step = operators.Pipeline(Identity(), Fail())
+    with pytest.raises(ValueError):
+        step(1, operators.Context(tracer))
+    (span,) = tracer.spans
+    assert exporter.exported == [span.to_dict()]  # failed when exported
+    assert span.error is not None and "boom" in span.error
+    assert span.output_size is None
+    identity, fail = span.children
+    assert identity.error is None and identity.output_size is None
+    assert fail.name == "Fail" and fail.error == span.error
+
+
+def test_tracing_is_off_by_default() -> None:
+    ctx = operators.Context()
+    assert ctx.tracer is None and ctx.get_child().tracer is None
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,103 @@
+import json
+import os
+import pathlib
+from typing import Any, Dict
+from unittest import mock
+
+import pytest
+
+from configmate.base import exceptions
+from configmate.components import interpolators
+from configmate.core import functions
+
+TEST_FILE_FOLDER = "tests/test_files/"
+
+
+@pytest.mark.parametrize(
+    "tree, env, expected",
+    [
+        ({"a": "${A}", "b": 1}, {"A": "x"}, {"a": "x", "b": 1}),
+        ({"a": {"b": ["${A}", "c"]}}, {"A": "x"}, {"a": {"b": ["x", "c"]}}),
+        (
+            {"a": "${A:default}", "b": [None, 1.5]},
+            {},
+            {"a": "default", "b": [None, 1.5]},
+        ),
+        ("${A}-${B:b}", {"A": "a"}, "a-b"),
+        ({"a": "no placeholders"}, {}, {"a": "no placeholders"}),
+    ],
+)
+def test_values_are_interpolated(tree: Any, env: Dict[str, str], expected: Any) -> None:
+    """Only the string leaves with placeholders are substituted."""
+    interpolator = interpolators.ValueInterpolator.from_sub_mapping(env)
+    assert interpolator(tree) == expected
+
+
+def test_parsed_tree_is_not_modified() -> None:
+    """Resolving copies the containers on the paths to the leaves only."""
+    tree = {"a": {"b": "${A}"}, "untouched": {"c": [1, 2]}}
+    index = interpolators.LeafIndex(tree, interpolators.constants.BASH_VAR_PATTERN)
+    resolved, missing = index.resolve({"A": "x"})
+    assert not missing
+    assert tree == {"a": {"b": "${A}"}, "untouched": {"c": [1, 2]}}
+    assert resolved == {"a": {"b": "x"}, "untouched": {"c": [1, 2]}}
+    assert resolved["untouched"] is tree["untouched"]
+
+
+def test_index_reresolves_without_reparsing() -> None:
+    """The leaf index of a tree resolves against a new environment."""
+    interpolator = interpolators.ValueInterpolator.from_sub_mapping({"A": "1"})
+    assert interpolator({"a": "${A}", "b": "b"}) == {"a": "1", "b": "b"}
+    index = interpolator.index({"a": "${A}", "b": "b"})
+    assert [path for path, _ in index.leaves] == [("a",)]
+    assert interpolator.resolve(index, {"A": "2"}) == {"a": "2", "b": "b"}
+
+
+def test_configure_follows_the_environment(tmp_path: pathlib.Path) -> None:
+    """The cached layers are re-resolved on every call, without re-parsing."""
+    (path := tmp_path / "config.json").write_text('{"a": "${A}", "b": "b"}')
+
+    @functions.configure(path, interpolate_values=True)
+    def func(a: str, b: str) -> str:
+        return a + b
+
+    with mock.patch("sys.argv", ["test.py"]):
+        with mock.patch.dict(os.environ, {"A": "1"}, clear=True):
+            assert func() == "1b"
+        path.write_text('{"a": "${A}", "b": "changed"}')  # not read again
+        with mock.patch.dict(os.environ, {"A": "2"}, clear=True):
+            assert func() == "2b"
+
+
+def test_substituted_values_keep_the_quoting(tmp_path: pathlib.Path) -> None:
+    """Values with quotes break raw text interpolation but not value interpolation."""
+    (path := tmp_path / "config.json").write_text(json.dumps({"a": "${A}"}))
+    with mock.patch.dict(os.environ, {"A": 'say "hi"'}, clear=True):
+        with pytest.raises(ValueError):
+            functions.get_config(path)
+        config = functions.get_config(path, interpolate_values=True)
+    assert config == {"a": 'say "hi"'}
+
+
+def test_missing_values_raise() -> None:
+    """Missing variables are handled as with raw text interpolation."""
+    file = os.path.join(TEST_FILE_FOLDER, "test_missing.json")
+    with mock.patch.dict(os.environ, {}, clear=True):
+        with pytest.raises(exceptions.MissingEnvironmentVariable):
+            functions.get_config(file, interpolate_values=True)
+        with pytest.warns(Warning):
+            functions.get_config(file, interpolation="warn", interpolate_values=True)
+
+
+def test_streaming_interpolates_values(tmp_path: pathlib.Path) -> None:
+    """Streamed sections can be interpolated after parsing."""
+    (path := tmp_path / "config.json").write_text('{"a": {"b": "${A}"}, "c": 1}')
+    with mock.patch.dict(os.environ, {"A": "x"}, clear=True):
+        config = functions.get_config(
+            path, section=["a"], streaming=True, interpolate_values=True
+        )
+    assert config == {"b": "x"}
+
+
+if __name__ == "__main__":
+    pytest.main()